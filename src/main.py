@@ -1,6 +1,8 @@
 """Tetris oyununun giris noktasi."""
 
 from tetris.game import TetrisGame
+import logging
+import multiprocessing
 import sys
 import os
 
@@ -13,11 +15,15 @@ def resource_path(relative_path):
 
 
 def main():
+    # TETRIS_LOG_LEVEL=INFO shows auto graphics tier switches
+    logging.basicConfig(level=os.environ.get('TETRIS_LOG_LEVEL', 'WARNING'))
     oyun = TetrisGame()
     oyun.run()
 
 
 if __name__ == "__main__":
+    # The AI player runs in a spawned process; needed for the PyInstaller exe
+    multiprocessing.freeze_support()
     main()
 
 RESOURCE_DIR = resource_path(os.path.join('src', 'tetris', 'resources'))
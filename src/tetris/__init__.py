@@ -1,5 +1,11 @@
 """Tetris paketi."""
 
-from .game import TetrisGame
-
 __all__ = ["TetrisGame"]
+
+
+def __getattr__(name):
+    # Import lazily so headless tools (server, bots) do not pull in pygame
+    if name == "TetrisGame":
+        from .game import TetrisGame
+        return TetrisGame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,226 @@
+"""Ayrı süreçte çalışan yapay zeka oyuncusu.
+
+Yerleşim araması 16 ms'lik kare bütçesine sığmadığı için ayrı bir süreçte
+yapılır. Her yeni parçada tahtanın anlık görüntüsü paylaşılan belleğe
+yazılır ve sürece yalnızca sıra numarası gönderilir. Süreç en iyi yerleşimi
+bulup girdi listesini ("left", "right", "rotate", "drop") bir kuyruğa koyar;
+oyun bu kuyruğu bloklamadan okur ve girdileri ayarlanabilir bir
+saniyedeki eylem hızıyla uygular. Tahta plan hesaplanırken değiştiyse
+(çöp satırı, berserk, başarısız hamle) plan iptal edilip yeniden istenir.
+Ana döngü yapay zekayı hiçbir zaman beklemez.
+"""
+
+import logging
+import multiprocessing
+import queue
+import struct
+from multiprocessing import shared_memory
+
+from . import settings
+from . import snapshot
+from .rules import Board, DEFAULT_COLS, DEFAULT_ROWS
+
+logger = logging.getLogger(__name__)
+
+# Placement evaluation weights (aggregate height, lines, holes, bumpiness)
+WEIGHTS = (-0.51, 0.76, -0.36, -0.18)
+
+# Shared-memory slot: seq, length, snapshot bytes..., seq again. The reader
+# accepts the slot only when both sequence numbers match the request.
+_SLOT_HEAD = struct.Struct("<II")
+_SLOT_TAIL = struct.Struct("<I")
+
+
+def slot_size(cols, rows):
+    return _SLOT_HEAD.size + snapshot.size(cols, rows) + _SLOT_TAIL.size
+
+
+def evaluate(grid, lines):
+    cols = len(grid[0])
+    heights = [0] * cols
+    holes = 0
+    for x in range(cols):
+        seen = False
+        for y, row in enumerate(grid):
+            if row[x] is not None:
+                if not seen:
+                    heights[x] = len(grid) - y
+                    seen = True
+            elif seen:
+                holes += 1
+    bumpiness = sum(abs(heights[i] - heights[i + 1]) for i in range(cols - 1))
+    h, l, o, b = WEIGHTS
+    return h * sum(heights) + l * lines + o * holes + b * bumpiness
+
+
+def _score_drop(board, piece):
+    y = piece.y
+    while board.is_valid_position(piece, 0, 1):
+        piece.y += 1
+    grid = [list(row) for row in board.grid]
+    for x, cy in piece.get_coords():
+        grid[cy][x] = piece.color_index
+    piece.y = y
+    full = [row for row in grid if all(cell is not None for cell in row)]
+    if full:
+        cols = len(grid[0])
+        grid = [[None] * cols for _ in full] + [row for row in grid if any(cell is None for cell in row)]
+    return evaluate(grid, len(full))
+
+
+def search(board):
+    """Aktif parça için en iyi yerleşimi arar ve oraya götüren girdileri döndürür.
+
+    Döndürme ve yana kaydırma `Board.try_rotate`/`try_move` ile denenir; duvar
+    tekmeleri dahil oyunun yapacağı hamlelerin aynısıdır.
+    """
+    piece = board.current_piece
+    if piece is None or board.state == "gameover":
+        return []
+    origin = (piece.x, piece.y, piece.shape)
+    best, best_inputs = None, ["drop"]
+    for rotations in range(4):
+        for direction, name in ((0, None), (-1, "left"), (1, "right")):
+            piece.x, piece.y, piece.shape = origin
+            if not all(board.try_rotate() for _ in range(rotations)):
+                break
+            steps = 0
+            while True:
+                if direction == 0 or steps:
+                    score = _score_drop(board, piece)
+                    if best is None or score > best:
+                        best = score
+                        best_inputs = ["rotate"] * rotations + [name] * steps + ["drop"]
+                if direction == 0 or not board.try_move(direction, 0):
+                    break
+                steps += 1
+    piece.x, piece.y, piece.shape = origin
+    return best_inputs
+
+
+def write_slot(buf, seq, data):
+    end = _SLOT_HEAD.size + len(data)
+    buf[:_SLOT_HEAD.size] = _SLOT_HEAD.pack(seq, len(data))
+    buf[_SLOT_HEAD.size:end] = data
+    buf[end:end + _SLOT_TAIL.size] = _SLOT_TAIL.pack(seq)
+
+
+def read_slot(buf, seq):
+    """Slot `seq` isteğine aitse anlık görüntüyü, üzerine yazıldıysa None döndürür."""
+    head, length = _SLOT_HEAD.unpack_from(buf, 0)
+    end = _SLOT_HEAD.size + length
+    data = bytes(buf[_SLOT_HEAD.size:end])
+    (tail,) = _SLOT_TAIL.unpack_from(buf, end)
+    if head != seq or tail != seq:
+        return None
+    return data
+
+
+def _worker(shm_name, cols, rows, requests, plans):
+    # Imported here: skyline builds on this module's search and weights
+    from . import skyline
+    shm = shared_memory.SharedMemory(name=shm_name)
+    board = Board(cols, rows)
+    table = skyline.open_table(settings.AI_PLAYER['table'])
+    try:
+        while True:
+            seq = requests.get()
+            # Only the newest request matters; older ones are stale already
+            try:
+                while seq is not None:
+                    seq = requests.get_nowait()
+            except queue.Empty:
+                pass
+            if seq is None:
+                return
+            data = read_slot(shm.buf, seq)
+            if data is None:
+                continue
+            snapshot.restore(board, data)
+            board.state = "playing"
+            plans.put((seq, skyline.plan(board, table)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if table is not None:
+            table.close()
+        shm.close()
+
+
+class AIPlayer:
+    def __init__(self, actions_per_second=None, cols=DEFAULT_COLS, rows=DEFAULT_ROWS):
+        cfg = settings.AI_PLAYER
+        self.actions_per_second = actions_per_second or cfg['actions_per_second']
+        ctx = multiprocessing.get_context("spawn")
+        # Sized for the board's snapshot; large boards need far more than the default
+        self.shm = shared_memory.SharedMemory(create=True, size=slot_size(cols, rows))
+        self.requests = ctx.Queue()
+        self.plans = ctx.Queue()
+        self.process = ctx.Process(target=_worker, args=(self.shm.name, cols, rows, self.requests, self.plans),
+                                   daemon=True)
+        self.process.start()
+        self.seq = 0
+        self.plan = []
+        self.grid_version = None
+        self.budget = 0.0
+        self.stats = {'requests': 0, 'plans': 0, 'stale': 0, 'actions': 0, 'replans': 0}
+
+    def request(self, board):
+        """Yeni bir plan ister; önceki plan geçersiz olur."""
+        data = snapshot.capture(board)
+        self.seq += 1
+        write_slot(self.shm.buf, self.seq, data)
+        self.requests.put(self.seq)
+        self.plan = []
+        self.grid_version = board.grid_version
+        self.stats['requests'] += 1
+
+    def poll(self):
+        while True:
+            try:
+                seq, inputs = self.plans.get_nowait()
+            except queue.Empty:
+                return
+            if seq == self.seq:
+                self.plan = list(inputs)
+                self.stats['plans'] += 1
+            else:
+                self.stats['stale'] += 1
+
+    def step(self, game, dt):
+        """Hazır planı eylem hızına göre uygular; oyunu hiç bekletmez."""
+        self.poll()
+        if game.grid_version != self.grid_version:
+            # The board changed under the plan (garbage, berserk, a restore)
+            self.stats['replans'] += 1
+            self.request(game)
+            return
+        if not self.plan:
+            self.budget = 0.0
+            return
+        self.budget = min(self.budget + dt * self.actions_per_second, len(self.plan))
+        while self.budget >= 1 and self.plan:
+            self.budget -= 1
+            action = self.plan.pop(0)
+            self.stats['actions'] += 1
+            if action == "drop":
+                game.hard_drop()
+                return
+            if action == "rotate":
+                ok = game.try_rotate()
+            else:
+                ok = game.try_move(-1 if action == "left" else 1, 0)
+            if not ok:
+                # Gravity or a kick moved the piece off the planned path
+                self.stats['replans'] += 1
+                self.request(game)
+                return
+
+    def close(self):
+        if self.process.is_alive():
+            self.requests.put(None)
+            self.process.join(1)
+            if self.process.is_alive():
+                self.process.terminate()
+        self.shm.close()
+        self.shm.unlink()
@@ -0,0 +1,114 @@
+"""Önceden pişirilmiş efekt zaman çizelgeleri.
+
+Satır silme, kilitleme parlaması ve patlama efektleri açılışta her renk ve
+blok boyutu için kısa kare dizilerine (sprite sheet) çizilir. Oynatma, efektin
+yaşına göre seçilen kareyi tek bir blit ile basmaktan ibarettir; kare başına
+yüzey ayrılmaz ve ölçeklenmez. Yaş duvar saatiyle değil, oyun mantığının her
+güncellemede bir artan `TickClock` sayacıyla ölçülür; aynı kayıt her
+zaman aynı kareleri üretir (tekrarlar ve başsız çizim için).
+"""
+
+import math
+
+import pygame
+
+from . import settings
+
+
+class TickClock:
+    """Mantık adımı sayacı; `update_animations` her çağrıda bir ilerletir."""
+
+    def __init__(self, fps=None):
+        self.fps = fps or settings.FPS
+        self.ticks = 0
+
+    def advance(self):
+        self.ticks += 1
+
+    def ticks_for(self, seconds):
+        return max(1, round(seconds * self.fps))
+
+
+class Timeline:
+    """Kareler ve her karenin hücre köşesine göre kayması."""
+
+    def __init__(self, frames, offsets):
+        self.frames = frames
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.frames)
+
+    def done(self, age):
+        return age >= len(self.frames)
+
+    def frame(self, age):
+        i = min(max(age, 0), len(self.frames) - 1)
+        return self.frames[i], self.offsets[i]
+
+    def blit(self, target, age, x, y, special_flags=0):
+        surf, (dx, dy) = self.frame(age)
+        target.blit(surf, (x + dx, y + dy), special_flags=special_flags)
+
+
+def _finish(surf):
+    # Match the display format when there is one; headless tools may not have it
+    return surf.convert_alpha() if pygame.display.get_surface() else surf
+
+
+def bake_line_clear(color, block, ticks, fps):
+    """Satırdaki bloğun küçülüp parlaması; eski `time.time() % 1` evresi artık yaştan gelir."""
+    base = pygame.Surface((block, block), pygame.SRCALPHA)
+    pygame.draw.rect(base, (*color, 180), (0, 0, block, block), border_radius=8)
+    frames, offsets = [], []
+    for age in range(ticks):
+        scale = 1.0 - 0.5 * abs(math.sin(age / fps * math.pi * 2))
+        size = max(1, int(block * scale))
+        frames.append(_finish(pygame.transform.smoothscale(base, (size, size))))
+        offsets.append(((block - size) // 2, (block - size) // 2))
+    return Timeline(frames, offsets)
+
+
+def bake_lock_flash(color, block, ticks):
+    """Kilitlenen parçanın hücrelerinde sönen, renge çalan beyaz parlama."""
+    tint = tuple((c + 255 * 2) // 3 for c in color)
+    frames = []
+    for age in range(ticks):
+        surf = pygame.Surface((block, block), pygame.SRCALPHA)
+        alpha = int(160 * (1 - age / ticks))
+        pygame.draw.rect(surf, (*tint, alpha), (0, 0, block, block), border_radius=6)
+        frames.append(_finish(surf))
+    return Timeline(frames, [(0, 0)] * ticks)
+
+
+def bake_explosion(color, block, ticks=20):
+    """Silinen satırdan saçılan, küçülüp sönen daire."""
+    frames, offsets = [], []
+    for t in range(ticks):
+        r = max(2, 8 - t // 2)
+        surf = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, max(0, 255 - 12 * t)), (r, r), r)
+        frames.append(_finish(surf))
+        offsets.append((block // 2 + int(8 * math.sin(t)) - r, block // 2 + int(8 * math.cos(t)) - r))
+    return Timeline(frames, offsets)
+
+
+class AnimationBank:
+    """Bir blok boyutu için pişirilmiş bütün efektler; renkler `settings.COLORS` sırasıyla."""
+
+    def __init__(self, block, colors, clock, line_clear_seconds=0.3, lock_seconds=0.15):
+        self.block = block
+        self.line_clear = [bake_line_clear(c, block, clock.ticks_for(line_clear_seconds), clock.fps)
+                           for c in colors]
+        self.lock = [bake_lock_flash(c, block, clock.ticks_for(lock_seconds)) for c in colors]
+        self.explosion = [bake_explosion(c, block) for c in colors]
+
+    def berserk_overlay(self, cache, size, rows):
+        """Berserk karartması; açık bırakılan satırlar başına bir kez çizilip `cache`'te tutulur."""
+        def make():
+            overlay = pygame.Surface(size, pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 180))
+            for top in rows:
+                overlay.fill((0, 0, 0, 0), (0, top, size[0], self.block))
+            return overlay
+        return cache.get('berserk', size, (self.block, tuple(rows)), make)
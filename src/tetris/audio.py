@@ -0,0 +1,218 @@
+"""Düşük gecikmeli ses motoru.
+
+Karıştırıcı `pygame.init()`'ten önce küçük bir tamponla başlatılır; varsayılan
+tampon tek başına onlarca milisaniye gecikme ekler. Bütün efektler açılışta
+karıştırıcının biçimine çözülüp bellekte tutulur, çalma anında dosya okunmaz.
+Her ses bir kategoriye aittir ve her kategorinin kendine ayrılmış kanalları
+vardır: tuş sesleri satır silme veya oyun sonu sesini asla kesmez. Kategori
+doluysa en eski ses çalınan yeni sese yer açar; aynı sesin art arda gelen
+tekrarları (basılı tutulan ok tuşu gibi) en kısa aralıkla sınırlanır.
+Ses düzeyi ve sessiz mod tek yerden (`apply`) uygulanır.
+
+Olaydan sese gecikme, olayların kuyruktan alındığı andan `play` çağrısına
+kadar geçen süre ile karıştırıcı tamponunun süresinin toplamı olarak ölçülür.
+pygame olaylarında zaman damgası olmadığından olayın kuyrukta beklediği süre
+(tam hızda en fazla bir kare) buna dahil değildir.
+
+Kullanım:
+    python -m tetris.audio bench
+"""
+
+import argparse
+import logging
+import os
+import time
+
+import pygame
+
+from . import settings
+
+logger = logging.getLogger(__name__)
+
+SOUND_FILES = {
+    "move": settings.SOUND_MOVE,
+    "rotate": settings.SOUND_ROTATE,
+    "drop": settings.SOUND_DROP,
+    "line": settings.SOUND_LINE,
+    "levelup": settings.SOUND_LEVELUP,
+    "gameover": settings.SOUND_GAMEOVER,
+    "click": settings.SOUND_CLICK,
+    "win": settings.SOUND_WIN,
+    "coin": settings.SOUND_COIN,
+}
+
+
+def init_mixer(config=None):
+    """`pygame.init()`'ten önce çağrılmalıdır; yoksa varsayılan tampon kullanılır."""
+    cfg = config or settings.AUDIO
+    pygame.mixer.pre_init(cfg['frequency'], -16, 2, cfg['buffer'])
+
+
+class AudioEngine:
+    def __init__(self, config=None):
+        cfg = config or settings.AUDIO
+        self.config = cfg
+        self.sounds = {}
+        self.category = {}     # sound name -> category name
+        self.channels = {}     # category name -> list of Channel
+        self.started = {}      # Channel -> perf_counter of its last play
+        self.last_played = {}  # sound name -> perf_counter
+        self.min_interval = {}
+        self.volume = 1.0
+        self.input_at = None   # set while input events are being handled
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.latency_count = 0
+        self.stats = {'played': 0, 'stolen': 0, 'throttled': 0, 'missing': 0}
+        for name, (names, voices, interval_ms) in cfg['categories'].items():
+            for sound in names:
+                self.category[sound] = name
+                self.min_interval[sound] = interval_ms / 1000
+        self.available = self._open_channels()
+
+    def _open_channels(self):
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init()
+            except pygame.error as exc:
+                logger.warning("audio disabled: %s", exc)
+                return False
+        categories = self.config['categories']
+        total = sum(voices for _, voices, _ in categories.values())
+        pygame.mixer.set_num_channels(total)
+        # Reserved channels are never picked by Sound.play(), only by us
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for name, (_, voices, _) in categories.items():
+            self.channels[name] = [pygame.mixer.Channel(index + i) for i in range(voices)]
+            index += voices
+        return True
+
+    @property
+    def buffer_ms(self):
+        """Karıştırıcı tamponunun süresi; olaydan sese gecikmenin sabit kısmı."""
+        init = pygame.mixer.get_init()
+        return self.config['buffer'] / init[0] * 1000 if init else 0.0
+
+    def load(self):
+        """Bütün efektleri çözüp belleğe alır; bulunamayanları bildirir."""
+        if not self.available:
+            return self.sounds
+        for name, path in SOUND_FILES.items():
+            if not os.path.exists(path):
+                logger.info("sound %s not found at %s", name, path)
+                continue
+            try:
+                self.sounds[name] = pygame.mixer.Sound(path)
+            except pygame.error as exc:
+                logger.warning("could not load sound %s: %s", name, exc)
+        for sound in self.sounds.values():
+            sound.set_volume(self.volume)
+        return self.sounds
+
+    def apply(self, prefs):
+        """Müzik, efekt düzeyi ve sessiz modu ayarlar sözlüğünden uygular."""
+        if not self.available:
+            return
+        mute = prefs['mute']
+        pygame.mixer.music.set_volume(0 if mute else prefs['music_volume'])
+        self.volume = 0 if mute else prefs['effects_volume']
+        for sound in self.sounds.values():
+            sound.set_volume(self.volume)
+
+    def play(self, name):
+        sound = self.sounds.get(name)
+        if sound is None:
+            self.stats['missing'] += 1
+            return None
+        if self.volume == 0:
+            return None
+        now = time.perf_counter()
+        if now - self.last_played.get(name, -1.0) < self.min_interval[name]:
+            self.stats['throttled'] += 1
+            return None
+        voices = self.channels[self.category[name]]
+        channel = next((c for c in voices if not c.get_busy()), None)
+        if channel is None:
+            # Steal the voice that has been playing the longest
+            channel = min(voices, key=lambda c: self.started.get(c, 0.0))
+            self.stats['stolen'] += 1
+        channel.play(sound)
+        self.started[channel] = now
+        self.last_played[name] = now
+        self.stats['played'] += 1
+        if self.input_at is not None:
+            delay = time.perf_counter() - self.input_at
+            self.latency_sum += delay
+            self.latency_max = max(self.latency_max, delay)
+            self.latency_count += 1
+        return channel
+
+    def play_music(self, path):
+        if not self.available or not os.path.exists(path):
+            return False
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.play(-1)
+        return True
+
+    def latency(self):
+        """(ortalama, en kötü) olaydan sese gecikme, ms."""
+        if not self.latency_count:
+            return None
+        mean = self.latency_sum / self.latency_count * 1000
+        return mean + self.buffer_ms, self.latency_max * 1000 + self.buffer_ms
+
+    def report(self):
+        init = pygame.mixer.get_init()
+        lines = [f"mixer {init[0] if init else 0} Hz, buffer {self.config['buffer']} "
+                 f"({self.buffer_ms:.1f} ms), {len(self.sounds)}/{len(SOUND_FILES)} sounds loaded",
+                 "played {played}, stolen {stolen}, throttled {throttled}, missing {missing}".format(**self.stats)]
+        latency = self.latency()
+        if latency:
+            lines.append(f"event to audio: {latency[0]:.1f} ms mean, {latency[1]:.1f} ms worst "
+                         f"over {self.latency_count} input sounds")
+        return "\n".join(lines)
+
+    def log_report(self):
+        if self.stats['played']:
+            logger.info("audio\n%s", self.report())
+
+
+def _bench(presses=300, rate_hz=30):
+    """Yüklü sesleri girdi hızında sırayla çalar; (yükleme ms, play µs, rapor) döndürür."""
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    init_mixer()
+    pygame.init()
+    try:
+        start = time.perf_counter()
+        engine = AudioEngine()
+        engine.load()
+        load_ms = (time.perf_counter() - start) * 1000
+        engine.apply(settings.DEFAULT_SETTINGS)
+        names = sorted(engine.sounds) or ["move"]
+        cost = 0.0
+        for i in range(presses):
+            engine.input_at = time.perf_counter()
+            engine.play(names[i % len(names)])
+            cost += time.perf_counter() - engine.input_at
+            engine.input_at = None
+            time.sleep(1 / rate_hz)
+        return load_ms, cost / presses * 1e6, engine.report()
+    finally:
+        pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.audio")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_bench = sub.add_parser("bench", help="measure play() cost and event-to-audio latency")
+    p_bench.add_argument("--presses", type=int, default=300)
+    p_bench.add_argument("--rate", type=float, default=30, help="presses per second")
+    args = parser.parse_args(argv)
+    load_ms, play_us, report = _bench(args.presses, args.rate)
+    print(f"decoded sounds in {load_ms:.1f} ms; play() {play_us:.1f} us")
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
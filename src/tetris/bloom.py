@@ -0,0 +1,85 @@
+"""Kare başına tek bir parıltı (bloom) geçişi.
+
+Oluşturulmuş katmanın parlak pikselleri düşük çözünürlükte ayıklanır,
+NumPy ile ayrılabilir kutu bulanıklığından geçirilir ve hedef yüzeye
+toplamalı olarak eklenir. Maliyeti kaç blok veya butonun parladığından
+bağımsızdır. NumPy yoksa `available` False olur ve oyun nesne başına eski
+parıltıya döner.
+"""
+
+import logging
+
+import pygame
+
+from . import settings
+
+try:
+    import numpy
+    from pygame import surfarray
+except ImportError:  # optional dependency
+    numpy = None
+
+logger = logging.getLogger(__name__)
+
+
+def _box_blur(a, radius, axis):
+    # Box filter along one axis as a sum of shifted slices, edges clamped
+    a = numpy.moveaxis(a, axis, 0)
+    n = a.shape[0]
+    p = numpy.concatenate((numpy.repeat(a[:1], radius, 0), a, numpy.repeat(a[-1:], radius, 0)))
+    out = p[:n].copy()
+    for k in range(1, 2*radius + 1):
+        out += p[k:k + n]
+    out *= 1 / (2*radius + 1)
+    return numpy.moveaxis(out, 0, axis)
+
+
+class Bloom:
+    def __init__(self, config=None):
+        cfg = config or settings.BLOOM
+        self.downscale = cfg['downscale']
+        self.threshold = cfg['threshold']
+        self.radius = cfg['radius']
+        self.passes = cfg['passes']
+        self.strength = cfg['strength']
+        self.available = numpy is not None and cfg['enabled']
+        self._glow = None
+        self._big = None
+
+    def _small(self, size):
+        w, h = size
+        small = ((w + self.downscale - 1) // self.downscale, (h + self.downscale - 1) // self.downscale)
+        if self._glow is None or self._glow.get_size() != small:
+            self._glow = pygame.Surface(small)
+        return self._glow
+
+    def render(self, source, out, strength=1.0):
+        """Parıltıyı `source` ile aynı boyuttaki `out` yüzeyine yazar."""
+        glow = self._small(source.get_size())
+        # Point-sample every n-th pixel; the blur below hides the aliasing
+        # and this is several times cheaper than a smoothscale down
+        step = self.downscale
+        rgb = surfarray.pixels3d(source)[::step, ::step].astype(numpy.float32)
+        if source.get_flags() & pygame.SRCALPHA:
+            rgb *= surfarray.pixels_alpha(source)[::step, ::step, None] * (1 / 255)
+        # Soft threshold on luma keeps only the bright parts
+        luma = rgb @ numpy.array((0.299, 0.587, 0.114), numpy.float32)
+        knee = numpy.clip((luma - self.threshold) / (255 - self.threshold), 0, 1)
+        rgb *= knee[..., None]
+        for _ in range(self.passes):
+            rgb = _box_blur(rgb, self.radius, 0)
+            rgb = _box_blur(rgb, self.radius, 1)
+        rgb *= self.strength * strength
+        surfarray.blit_array(glow, numpy.minimum(rgb, 255).astype(numpy.uint8))
+        pygame.transform.smoothscale(glow, out.get_size(), out)
+        return out
+
+    def apply(self, source, target=None, offset=(0, 0), strength=1.0):
+        """`source` katmanının parlak bölgelerini bulanıklaştırıp `target`'a ekler."""
+        if not self.available or strength <= 0:
+            return
+        target = target if target is not None else source
+        if self._big is None or self._big.get_size() != source.get_size():
+            self._big = pygame.Surface(source.get_size())
+        self.render(source, self._big, strength)
+        target.blit(self._big, offset, special_flags=pygame.BLEND_RGB_ADD)
@@ -0,0 +1,295 @@
+"""Büyük tahtalar için kamera ve parçalı (chunk) blok önbelleği.
+
+Tahta boyutu pencereden bağımsızdır (`TETRIS_BOARD=100x400`). `Camera`
+tahtanın görünen kısmını seçer, aktif parçayı takip eder ve yakınlaştırılıp
+uzaklaştırılabilir; görünmeyen satırlar ve sütunlar hiç çizilmez.
+Yerleşmiş bloklar `ChunkCache` içinde 16x16 hücrelik yüzeylere bir kez
+çizilir; kare başına maliyet görünen parça sayısı kadar blit'tir. Bir parça
+yalnızca `Board.touch_rows` ile bildirilen satırları değiştiğinde (kilitleme,
+satır silme, çöp satırı, berserk) ya da yakınlaştırma ve grafik kalitesi
+değiştiğinde yeniden çizilir. Standart 10x18 tahtada kamera eski yerleşimi
+birebir korur.
+
+Kullanım:
+    python -m tetris.boardview bench
+"""
+
+import argparse
+import os
+import time
+from collections import OrderedDict
+
+import pygame
+
+from . import settings
+
+
+class Camera:
+    """Tahta hücrelerini ekran piksellerine çevirir; parçayı görünür tutar."""
+
+    def __init__(self, viewport, cols, rows, cell, config=None):
+        cfg = config or settings.BOARD_VIEW
+        self.viewport = pygame.Rect(viewport)
+        self.cols = cols
+        self.rows = rows
+        self.min_cell = cfg['min_cell']
+        self.max_cell = cfg['max_cell']
+        self.margin = cfg['follow_margin']
+        self.cell = max(self.min_cell, min(self.max_cell, cell))
+        self.x = 0
+        self.y = 0
+
+    @classmethod
+    def fit(cls, viewport, cols, rows, cell, config=None):
+        """Genişliğe sığan, `cell`'den büyük olmayan hücre boyutuyla kurar."""
+        viewport = pygame.Rect(viewport)
+        return cls(viewport, cols, rows, min(cell, viewport.width // cols), config)
+
+    @property
+    def scrollable(self):
+        return (self.cols * self.cell > self.viewport.width
+                or self.rows * self.cell > self.viewport.height)
+
+    def view_cells(self):
+        return self.viewport.width // self.cell, self.viewport.height // self.cell
+
+    def clamp(self):
+        vw, vh = self.view_cells()
+        self.x = max(0, min(self.x, self.cols - vw))
+        self.y = max(0, min(self.y, self.rows - vh))
+
+    def zoom(self, steps):
+        """Hücre boyutunu adım başına ~%25 değiştirir; değiştiyse True."""
+        cell = round(self.cell * 1.25 ** steps)
+        if cell == self.cell:
+            cell += 1 if steps > 0 else -1
+        cell = max(self.min_cell, min(self.max_cell, cell))
+        if cell == self.cell:
+            return False
+        self.cell = cell
+        self.clamp()
+        return True
+
+    def follow(self, piece):
+        if piece is None or not self.scrollable:
+            return
+        vw, vh = self.view_cells()
+        m = min(self.margin, vh // 4)
+        top, bottom = piece.y, piece.y + len(piece.shape)
+        if top < self.y + m:
+            self.y = top - m
+        elif bottom > self.y + vh - m:
+            self.y = bottom - vh + m
+        m = min(self.margin, vw // 4)
+        left, right = piece.x, piece.x + len(piece.shape[0])
+        if left < self.x + m:
+            self.x = left - m
+        elif right > self.x + vw - m:
+            self.x = right - vw + m
+        self.clamp()
+
+    def origin(self):
+        # Boards narrower than the viewport are centered horizontally
+        pad = max(0, (self.viewport.width - self.cols * self.cell) // 2)
+        return self.viewport.x + pad - self.x * self.cell, self.viewport.y - self.y * self.cell
+
+    def to_screen(self, bx, by):
+        ox, oy = self.origin()
+        return ox + int(bx * self.cell), oy + int(by * self.cell)
+
+    def rect(self, bx, by):
+        return pygame.Rect(self.to_screen(bx, by), (self.cell, self.cell))
+
+    def visible_rows(self):
+        last = self.y + -(-self.viewport.height // self.cell) + 1
+        return range(self.y, min(self.rows, last))
+
+    def visible_cols(self):
+        last = self.x + -(-self.viewport.width // self.cell) + 1
+        return range(self.x, min(self.cols, last))
+
+
+def paint_cell(surface, rect, color_index, style, hidden=False, lod_cell=6):
+    """Tek bir tahta hücresi; `draw_grid`'in hücre başına çizdiğinin aynısı."""
+    cell = rect.width
+    if cell < lod_cell:
+        # Far zoom: borders and shadows would only add noise
+        if color_index is not None and not hidden:
+            surface.fill(settings.COLORS[color_index], rect)
+        return
+    radius = round(6 * cell / settings.BLOCK_SIZE)
+    if color_index is not None:
+        if not hidden:
+            offset = max(1, round(3 * cell / settings.BLOCK_SIZE))
+            pygame.draw.rect(surface, (0,0,0,80), rect.move(offset, offset), border_radius=radius)
+            pygame.draw.rect(surface, settings.COLORS[color_index], rect, border_radius=radius)
+            pygame.draw.rect(surface, (255,255,255), rect, 1, border_radius=radius)
+    else:
+        pygame.draw.rect(surface, (50, 50, 50), rect, 1)
+    radius = round(8 * cell / settings.BLOCK_SIZE)
+    if style == 'best':
+        pygame.draw.rect(surface, (255,255,255,30), rect, 1, border_radius=radius)
+    elif style == 'good':
+        pygame.draw.rect(surface, (100,100,100,40), rect, 1, border_radius=radius)
+    else:
+        pygame.draw.rect(surface, (80,80,80,20), rect, 1, border_radius=radius)
+
+
+class ChunkCache:
+    """Yerleşmiş blokların parça parça önbelleği; en son kullanılan önde tutulur."""
+
+    def __init__(self, config=None):
+        cfg = config or settings.BOARD_VIEW
+        self.size = cfg['chunk_cells']
+        self.budget = int(cfg['cache_mb'] * 1024 * 1024)
+        self.lod_cell = cfg['lod_cell']
+        self.chunks = OrderedDict()  # (cy, cx) -> (hidden rows, surface)
+        self.bytes = 0
+        self.grid = None
+        self.key = None
+        self.stats = {'renders': 0, 'blits': 0, 'evictions': 0}
+
+    def clear(self):
+        self.chunks.clear()
+        self.bytes = 0
+
+    def _drop(self, key):
+        _, surf = self.chunks.pop(key)
+        self.bytes -= surf.get_width() * surf.get_height() * 4
+
+    def sync(self, board, cell, style):
+        """Tahtadaki değişiklikleri önbelleğe yansıtır."""
+        key = (cell, style)
+        if board.grid is not self.grid or key != self.key:
+            # New game, restored snapshot, zoom or graphics change
+            self.clear()
+            self.grid = board.grid
+            self.key = key
+            board.dirty_rows = None
+        elif board.dirty_rows:
+            first, last = board.dirty_rows
+            board.dirty_rows = None
+            # A chunk also shows the shadows of the row above it
+            lo, hi = first // self.size, (last + 1) // self.size
+            for k in [k for k in self.chunks if lo <= k[0] <= hi]:
+                self._drop(k)
+
+    def _render(self, board, cx, cy, cell, style, hidden):
+        n = self.size
+        cols = range(cx * n, min(board.cols, (cx + 1) * n))
+        rows = range(cy * n, min(board.rows, (cy + 1) * n))
+        # Chunks on the bottom and right edges keep the overhanging shadow
+        margin = max(1, round(3 * cell / settings.BLOCK_SIZE))
+        width = len(cols) * cell + (margin if cols.stop == board.cols else 0)
+        height = len(rows) * cell + (margin if rows.stop == board.rows else 0)
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        grid = board.grid
+        # The row above and column to the left are painted too (clipped) for
+        # their drop shadows, in the same order a full-board pass would use
+        for y in range(max(0, rows.start - 1), rows.stop):
+            row = grid[y]
+            skip = y in hidden
+            top = (y - rows.start) * cell
+            for x in range(max(0, cols.start - 1), cols.stop):
+                paint_cell(surf, pygame.Rect((x - cols.start) * cell, top, cell, cell), row[x], style, skip, self.lod_cell)
+        self.stats['renders'] += 1
+        return surf
+
+    def draw(self, target, board, camera, style, hidden_rows=()):
+        """Görünen parçaları çizer; eksik veya eskimiş olanları önce yeniden çizer.
+
+        Hedefin tahta alanı saydam olmalıdır: parçalar örtüşmez ve piksel piksel
+        kopyalanır (BLEND_RGBA_MAX), böylece sonuç hücrelerin doğrudan
+        çizilmesiyle aynıdır.
+        """
+        cell = camera.cell
+        self.sync(board, cell, style)
+        n = self.size
+        rows, cols = camera.visible_rows(), camera.visible_cols()
+        if not rows or not cols:
+            return
+        for cy in range(rows.start // n, (rows.stop - 1) // n + 1):
+            hidden = tuple(y for y in hidden_rows if cy * n - 1 <= y < (cy + 1) * n)
+            for cx in range(cols.start // n, (cols.stop - 1) // n + 1):
+                key = (cy, cx)
+                entry = self.chunks.get(key)
+                if entry is None or entry[0] != hidden:
+                    if entry is not None:
+                        self._drop(key)
+                    surf = self._render(board, cx, cy, cell, style, hidden)
+                    entry = self.chunks[key] = (hidden, surf)
+                    self.bytes += surf.get_width() * surf.get_height() * 4
+                else:
+                    self.chunks.move_to_end(key)
+                target.blit(entry[1], camera.to_screen(cx * n, cy * n), special_flags=pygame.BLEND_RGBA_MAX)
+                self.stats['blits'] += 1
+        while self.bytes > self.budget and len(self.chunks) > 1:
+            self._drop(next(iter(self.chunks)))
+            self.stats['evictions'] += 1
+
+
+def _bench_size(cols, rows, pieces, frames, screen):
+    """Tek bir tahta boyutu için mantık ve çizim maliyetini ölçer."""
+    import random
+    from .rules import Board
+    board = Board(cols, rows, seed=1)
+    viewport = pygame.Rect(0, 60, settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT - 60)
+    camera = Camera.fit(viewport, cols, rows, settings.BLOCK_SIZE)
+    rng = random.Random(1)
+    # Logic: random placements, counting full-line checks and clears
+    start = time.perf_counter()
+    for _ in range(pieces):
+        for _ in range(rng.randrange(4)):
+            board.try_rotate()
+        board.try_move(rng.randrange(cols) - board.current_piece.x, 0)
+        board.hard_drop()
+        if board.state == "gameover":
+            board.reset_board()
+    logic_us = (time.perf_counter() - start) / pieces * 1e6
+    # Rendering: steady frames, then a frame right after a lock
+    cache = ChunkCache()
+    surf = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+    camera.follow(board.current_piece)
+    cache.draw(surf, board, camera, 'best')
+    start = time.perf_counter()
+    for _ in range(frames):
+        surf.fill((0, 0, 0, 0))
+        cache.draw(surf, board, camera, 'best')
+    steady_ms = (time.perf_counter() - start) / frames * 1000
+    start = time.perf_counter()
+    for _ in range(frames):
+        board.touch_rows(board.rows - 1, board.rows - 1)
+        surf.fill((0, 0, 0, 0))
+        cache.draw(surf, board, camera, 'best')
+    lock_ms = (time.perf_counter() - start) / frames * 1000
+    start = time.perf_counter()
+    for _ in range(frames):
+        cache.clear()
+        surf.fill((0, 0, 0, 0))
+        cache.draw(surf, board, camera, 'best')
+    full_ms = (time.perf_counter() - start) / frames * 1000
+    return camera.cell, logic_us, steady_ms, lock_ms, full_ms
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.boardview")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_bench = sub.add_parser("bench", help="logic and render cost at several board sizes")
+    p_bench.add_argument("--sizes", default="10x18,100x400,400x100,1000x1000")
+    p_bench.add_argument("--pieces", type=int, default=2000)
+    p_bench.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args(argv)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    screen = pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    print(f"{'board':>10} {'cell':>4} {'logic us/piece':>15} {'frame ms':>9} "
+          f"{'after lock':>11} {'uncached':>9}")
+    for size in args.sizes.split(","):
+        cols, rows = (int(n) for n in size.lower().split("x"))
+        cell, logic_us, steady_ms, lock_ms, full_ms = _bench_size(cols, rows, args.pieces, args.frames, screen)
+        print(f"{size:>10} {cell:>4} {logic_us:>15.1f} {steady_ms:>9.3f} {lock_ms:>11.3f} {full_ms:>9.3f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Anlık tekrar: son saniyelerin küçültülmüş karelerini tutan halka tampon.
+
+`draw` her yakalama adımında birleştirilmiş ekranı tek bir küçültme
+çağrısıyla doğrudan halka tampondaki yuvaya yazar; ana döngünün kare başına
+işi budur. Tampon başta bir kez, MB cinsinden bütçeye göre ayrılır.
+Kaydetme tuşuna basıldığında yuvalar arka plan iş parçacığında eskiden
+yeniye okunur ve animasyonlu PNG (APNG) olarak sıkıştırılıp yazılır.
+Okunurken üzerine yazılan yuva sıra numarasından anlaşılır ve atlanır.
+
+Büyük temizlik ("bigwin") ve berserk anları işaretlenir; klip adı son
+ana göre verilir, istenirse an geldikten birkaç saniye sonra klip
+kendiliğinden kaydedilir.
+"""
+
+import logging
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from . import settings
+from .replay import png_chunk
+
+logger = logging.getLogger(__name__)
+
+_FCTL = struct.Struct(">IIIIIHHBB")
+
+
+def _frame_rows(rgb, w, h):
+    stride = w * 3
+    return b"".join(b"\x00" + rgb[y * stride:(y + 1) * stride] for y in range(h))
+
+
+class APNGWriter:
+    """Kareleri geldikçe sıkıştırıp yazan APNG kodlayıcı."""
+
+    def __init__(self, path, size, fps, level=3):
+        self.path = path
+        self.size = size
+        self.fps = fps
+        self.level = level
+        self.frames = 0
+        self.seq = 0
+        self.file = open(path, 'wb')
+        w, h = size
+        self.file.write(b"\x89PNG\r\n\x1a\n")
+        self.file.write(png_chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)))
+        # Frame count is patched in close(); overwritten slots are skipped
+        self._actl = self.file.tell()
+        self.file.write(png_chunk(b"acTL", struct.pack(">II", 0, 0)))
+
+    def add(self, rgb):
+        w, h = self.size
+        self.file.write(png_chunk(b"fcTL", _FCTL.pack(self.seq, w, h, 0, 0, 1, self.fps, 0, 0)))
+        self.seq += 1
+        data = zlib.compress(_frame_rows(rgb, w, h), self.level)
+        if self.frames == 0:
+            self.file.write(png_chunk(b"IDAT", data))
+        else:
+            self.file.write(png_chunk(b"fdAT", struct.pack(">I", self.seq) + data))
+            self.seq += 1
+        self.frames += 1
+
+    def close(self):
+        """Dosyayı tamamlar; hiç kare yoksa geçerli bir PNG olmayacağı için siler ve False döndürür."""
+        if self.frames == 0:
+            self.file.close()
+            os.remove(self.path)
+            return False
+        self.file.write(png_chunk(b"IEND", b""))
+        self.file.seek(self._actl)
+        self.file.write(png_chunk(b"acTL", struct.pack(">II", self.frames, 0)))
+        self.file.close()
+        return True
+
+
+class InstantReplay:
+    def __init__(self, screen, config=None):
+        cfg = config or settings.INSTANT_REPLAY
+        self.fps = cfg['fps']
+        self.directory = cfg['dir']
+        self.auto_save_after = cfg['auto_save_after']
+        w, h = screen.get_size()
+        self.size = (max(1, w // cfg['downscale']), max(1, h // cfg['downscale']))
+        self.frame_bytes = self.size[0] * self.size[1] * 4
+        budget = int(cfg['budget_mb'] * 1024 * 1024)
+        self.capacity = max(1, min(int(cfg['seconds'] * self.fps), budget // self.frame_bytes))
+        self.buffer = bytearray(self.capacity * self.frame_bytes)
+        self.scratch = None
+        self._make_slots(screen)
+        self.seqs = [0] * self.capacity   # capture number held by each slot, 0 = empty
+        self.captured = 0
+        self.interval = 1.0 / self.fps
+        self.next_capture = 0.0
+        self.moments = []                 # (capture number, label)
+        self.auto_save_at = None
+        self.executor = ThreadPoolExecutor(1, thread_name_prefix='clip')
+        self.saving = None
+        self.last_cost_us = 0
+        self.stats = {'captures': 0, 'saves': 0, 'skipped': 0, 'max_us': 0}
+
+    @property
+    def seconds(self):
+        return self.capacity / self.fps
+
+    def _make_slots(self, screen):
+        # Each slot is a surface over its part of the ring, so capture writes
+        # into the ring directly. Masks must match for a raw scale copy.
+        view = memoryview(self.buffer)
+        self.format = 'RGBA' if screen.get_masks()[0] == 0xff else 'BGRA'
+        self.slots = [pygame.image.frombuffer(view[i * self.frame_bytes:(i + 1) * self.frame_bytes],
+                                              self.size, self.format)
+                      for i in range(self.capacity)]
+        if screen.get_bitsize() != 32 or screen.get_masks()[:3] != self.slots[0].get_masks()[:3]:
+            self.scratch = pygame.Surface(self.size, 0, screen)
+
+    def capture(self, screen, now=None):
+        """Zamanı geldiyse ekranı küçültüp halka tampona yazar."""
+        now = time.perf_counter() if now is None else now
+        if now < self.next_capture:
+            return False
+        start = time.perf_counter()
+        self.next_capture = max(self.next_capture + self.interval, now - self.interval)
+        self.captured += 1
+        index = self.captured % self.capacity
+        slot = self.slots[index]
+        self.seqs[index] = 0  # mark as being written for the encoder
+        if self.scratch is None:
+            pygame.transform.scale(screen, self.size, slot)
+        else:
+            pygame.transform.scale(screen, self.size, self.scratch)
+            slot.blit(self.scratch, (0, 0))
+        self.seqs[index] = self.captured
+        self.stats['captures'] += 1
+        if self.auto_save_at is not None and self.captured >= self.auto_save_at:
+            self.auto_save_at = None
+            self.save()
+        self.last_cost_us = int((time.perf_counter() - start) * 1e6)
+        self.stats['max_us'] = max(self.stats['max_us'], self.last_cost_us)
+        return True
+
+    def mark(self, label):
+        """Büyük temizlik veya berserk anını işaretler."""
+        self.moments.append((self.captured, label))
+        del self.moments[:-8]
+        if self.auto_save_after and self.auto_save_at is None:
+            self.auto_save_at = self.captured + int(self.auto_save_after * self.fps)
+
+    def save(self):
+        """Tamponu arka planda APNG olarak yazar; dosya yolunu döndürür.
+
+        Henüz kare yakalanmadıysa kaydetmez ve None döndürür.
+        """
+        if self.captured == 0 or (self.saving and not self.saving.done()):
+            return None
+        first = max(1, self.captured - self.capacity + 1)
+        label = next((name for n, name in reversed(self.moments) if n >= first), "clip")
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, time.strftime(f"%Y%m%d-%H%M%S-{label}.png"))
+        self.saving = self.executor.submit(self._encode, path, first, self.captured)
+        self.stats['saves'] += 1
+        return path
+
+    def _encode(self, path, first, last):
+        view = memoryview(self.buffer)
+        writer = APNGWriter(path, self.size, self.fps)
+        written = False
+        try:
+            for n in range(first, last + 1):
+                index = n % self.capacity
+                if self.seqs[index] != n:
+                    self.stats['skipped'] += 1
+                    continue
+                rgba = bytes(view[index * self.frame_bytes:(index + 1) * self.frame_bytes])
+                if self.seqs[index] != n:
+                    # Overwritten while copying; the capture loop lapped us
+                    self.stats['skipped'] += 1
+                    continue
+                frame = pygame.image.frombuffer(rgba, self.size, self.format)
+                writer.add(pygame.image.tobytes(frame, "RGB"))
+        finally:
+            written = writer.close()
+        if not written:
+            logger.warning("replay not saved: every frame was overwritten while saving")
+            return None
+        logger.info("saved %d frame replay to %s", writer.frames, path)
+        return path
+
+    def close(self):
+        self.executor.shutdown(wait=True)
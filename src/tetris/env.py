@@ -0,0 +1,285 @@
+"""Pekiştirmeli öğrenme için Gym tarzı ortam.
+
+`TetrisEnv`, başsız `Board` kuralları üzerinde `reset`/`step` arayüzü sunar.
+`VectorEnv` K ortamı alt süreçlerde çalıştırır: gözlemler, ödüller, bitiş
+bayrakları ve eylemler tek bir paylaşılan bellek bloğundaki NumPy
+dizileridir. Öğrenci gözlemleri kopyasız okur, eylemler toplu yazılır ve
+oyun biten ortamlar kendiliğinden sıfırlanır.
+
+Gözlem: (rows, cols) uint8; 0 boş, 1 yerleşmiş blok, 2 aktif parça.
+Eylemler: 0 bekle, 1 sol, 2 sağ, 3 döndür, 4 hızlı düşür, 5 anında düşür,
+6 hold. Her adımda eylemden sonra parça bir satır düşer.
+
+Ölçüm:
+    python -m tetris.env --envs 64 --workers 0 1 2 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+
+try:
+    import numpy
+except ImportError:  # optional dependency, only needed for the environments
+    numpy = None
+
+from .rules import Board, DEFAULT_COLS, DEFAULT_ROWS
+
+NOOP, LEFT, RIGHT, ROTATE, SOFT_DROP, HARD_DROP, HOLD = range(7)
+NUM_ACTIONS = 7
+
+EMPTY, SETTLED, ACTIVE = 0, 1, 2
+
+
+def _require_numpy():
+    if numpy is None:
+        raise RuntimeError("the RL environments need NumPy")
+
+
+class TetrisEnv:
+    def __init__(self, seed=None, cols=DEFAULT_COLS, rows=DEFAULT_ROWS):
+        _require_numpy()
+        self.cols = cols
+        self.rows = rows
+        self.board = Board(cols, rows, seed)
+        self.steps = 0
+        self._settled = None
+        self._settled_version = None
+
+    @property
+    def observation_shape(self):
+        return (self.rows, self.cols)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.board = Board(self.cols, self.rows, seed)
+        else:
+            self.board.reset_board()
+        self.steps = 0
+        return self.observe(), {}
+
+    def advance(self, action):
+        """Bir eylem ve bir yerçekimi adımı uygular; (ödül, bitti) döndürür."""
+        board = self.board
+        score = board.score
+        if action == LEFT:
+            board.try_move(-1, 0)
+        elif action == RIGHT:
+            board.try_move(1, 0)
+        elif action == ROTATE:
+            board.try_rotate()
+        elif action == SOFT_DROP:
+            board.try_move(0, 1)
+        elif action == HARD_DROP:
+            board.hard_drop()
+        elif action == HOLD:
+            board.hold_current_piece()
+        if board.state == "playing" and action != HARD_DROP:
+            board.gravity_step()
+        board.update_level()
+        self.steps += 1
+        return board.score - score, board.state == "gameover"
+
+    def observe(self, out=None):
+        """Gözlemi `out` dizisine (yoksa yeni diziye) yazar."""
+        board = self.board
+        if self._settled_version != board.grid_version:
+            # Rebuild the settled layer only when the grid actually changed
+            self._settled = numpy.array([[cell is not None for cell in row] for row in board.grid],
+                                        dtype=numpy.uint8)
+            self._settled_version = board.grid_version
+        if out is None:
+            out = numpy.empty((self.rows, self.cols), numpy.uint8)
+        out[:] = self._settled
+        piece = board.current_piece
+        if piece is not None and board.state == "playing":
+            for x, y in piece.get_coords():
+                if 0 <= x < self.cols and 0 <= y < self.rows:
+                    out[y, x] = ACTIVE
+        return out
+
+    def step(self, action):
+        reward, terminated = self.advance(action)
+        info = {'score': self.board.score, 'lines': self.board.lines_cleared}
+        return self.observe(), reward, terminated, False, info
+
+
+# -- vectorized ----------------------------------------------------------
+
+def _layout(num_envs, rows, cols):
+    # rewards (f32), observations (u8), dones (u8), actions (u8), packed in that order
+    offsets = {}
+    offset = 0
+    for name, size in (('rewards', 4 * num_envs), ('obs', num_envs * rows * cols),
+                       ('dones', num_envs), ('actions', num_envs)):
+        offsets[name] = offset
+        offset += size
+    return offsets, offset
+
+
+def _views(buf, num_envs, rows, cols):
+    offsets, _ = _layout(num_envs, rows, cols)
+    return {
+        'rewards': numpy.ndarray((num_envs,), numpy.float32, buf, offsets['rewards']),
+        'obs': numpy.ndarray((num_envs, rows, cols), numpy.uint8, buf, offsets['obs']),
+        'dones': numpy.ndarray((num_envs,), numpy.bool_, buf, offsets['dones']),
+        'actions': numpy.ndarray((num_envs,), numpy.uint8, buf, offsets['actions']),
+    }
+
+
+def _step_envs(envs, start, views):
+    actions, obs = views['actions'], views['obs']
+    rewards, dones = views['rewards'], views['dones']
+    for i, env in enumerate(envs):
+        k = start + i
+        reward, done = env.advance(int(actions[k]))
+        if done:
+            env.reset()
+        env.observe(obs[k])
+        rewards[k] = reward
+        dones[k] = done
+
+
+def _reset_envs(envs, start, views):
+    for i, env in enumerate(envs):
+        env.reset()
+        env.observe(views['obs'][start + i])
+        views['rewards'][start + i] = 0
+        views['dones'][start + i] = False
+
+
+def _worker(conn, shm_name, num_envs, start, count, cols, rows, seed):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    views = _views(shm.buf, num_envs, rows, cols)
+    envs = [TetrisEnv(seed + start + i, cols, rows) for i in range(count)]
+    try:
+        while True:
+            cmd = conn.recv()
+            if cmd == "step":
+                _step_envs(envs, start, views)
+            elif cmd == "reset":
+                _reset_envs(envs, start, views)
+            else:
+                break
+            conn.send(None)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        del views
+        shm.close()
+
+
+class VectorEnv:
+    """`num_envs` ortamı `workers` alt süreçte adımlayan toplu ortam.
+
+    `step` dönen gözlem dizisi paylaşılan belleğin kendisidir; bir sonraki
+    `step`/`reset` çağrısında üzerine yazılır. workers=0 aynı düzeni süreç
+    içinde çalıştırır.
+    """
+
+    def __init__(self, num_envs, workers=None, seed=0, cols=DEFAULT_COLS, rows=DEFAULT_ROWS):
+        _require_numpy()
+        self.num_envs = num_envs
+        self.cols = cols
+        self.rows = rows
+        self.workers = min(num_envs, os.cpu_count() or 1) if workers is None else min(workers, num_envs)
+        _, size = _layout(num_envs, rows, cols)
+        self.shm = None
+        self.conns = []
+        self.procs = []
+        if self.workers:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.views = _views(self.shm.buf, num_envs, rows, cols)
+            ctx = multiprocessing.get_context("spawn")
+            per = -(-num_envs // self.workers)
+            for start in range(0, num_envs, per):
+                parent, child = ctx.Pipe()
+                proc = ctx.Process(target=_worker, daemon=True,
+                                   args=(child, self.shm.name, num_envs, start,
+                                         min(per, num_envs - start), cols, rows, seed))
+                proc.start()
+                self.conns.append(parent)
+                self.procs.append(proc)
+        else:
+            self.views = _views(bytearray(size), num_envs, rows, cols)
+            self.envs = [TetrisEnv(seed + i, cols, rows) for i in range(num_envs)]
+        self.observations = self.views['obs']
+
+    def _run(self, cmd):
+        if not self.workers:
+            (_step_envs if cmd == "step" else _reset_envs)(self.envs, 0, self.views)
+            return
+        for conn in self.conns:
+            conn.send(cmd)
+        for conn in self.conns:
+            conn.recv()
+
+    def reset(self):
+        self._run("reset")
+        return self.observations, {}
+
+    def step(self, actions):
+        """Eylemleri topluca uygular; biten ortamlar kendiliğinden sıfırlanır.
+
+        (gözlemler, ödüller, bitti, kesildi, bilgi) döndürür. Bitti bayrağı
+        olan ortamın gözlemi zaten yeni oyunun ilk gözlemidir.
+        """
+        self.views['actions'][:] = actions
+        self._run("step")
+        dones = self.views['dones'].copy()
+        return self.observations, self.views['rewards'].copy(), dones, numpy.zeros_like(dones), {}
+
+    def close(self):
+        for conn in self.conns:
+            try:
+                conn.send("close")
+            except OSError:
+                pass
+        for proc in self.procs:
+            proc.join(1)
+            if proc.is_alive():
+                proc.terminate()
+        self.conns, self.procs = [], []
+        if self.shm:
+            self.views = self.observations = None
+            try:
+                self.shm.close()
+            except BufferError:
+                pass  # caller still holds an observation view; freed at exit
+            self.shm.unlink()
+            self.shm = None
+
+
+def bench(num_envs=64, workers=(0, 1, 2, 4), steps=500):
+    """Her işçi sayısı için saniyedeki ortam adımını ölçer."""
+    rng = numpy.random.default_rng(0)
+    results = {}
+    for k in workers:
+        env = VectorEnv(num_envs, workers=k)
+        env.reset()
+        actions = rng.integers(0, NUM_ACTIONS, size=(steps, num_envs), dtype=numpy.uint8)
+        start = time.perf_counter()
+        for t in range(steps):
+            env.step(actions[t])
+        elapsed = time.perf_counter() - start
+        env.close()
+        results[k] = num_envs * steps / elapsed
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.env")
+    parser.add_argument("--envs", type=int, default=64)
+    parser.add_argument("--workers", type=int, nargs="*", default=[0, 1, 2, 4])
+    parser.add_argument("--steps", type=int, default=500)
+    args = parser.parse_args(argv)
+    print(f"cores={os.cpu_count()} envs={args.envs}")
+    print(f"{'workers':>8} {'env-steps/s':>12}")
+    for k, rate in bench(args.envs, args.workers, args.steps).items():
+        print(f"{k:8d} {rate:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
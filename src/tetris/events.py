@@ -0,0 +1,128 @@
+"""Oyun olayları ve olay veriyolu.
+
+Kurallar (`Board`) efektleri, sesi, telemetriyi veya yayını doğrudan
+çağırmaz; yalnızca ne olduğunu bildiren tipli olaylar yayar. Parçacıklar,
+sesler, ekran sarsıntısı, telemetri, anlık tekrar, izleyici akışı ve canlı
+durum yayını bu olaylara abone olur.
+
+Dağıtım ucuzdur: her olay türünün aboneleri abone olunduğunda bir kez
+demete (tuple) çevrilir ve `emit` yalnızca o demeti dolaşır. Abonesi
+olmayan bir tür için `emit` tek bir sözlük bakışıdır; olay nesnesi hiç
+oluşturulmaz, bu yüzden başsız tahtalar (botlar, sunucu, araçlar) olaylar
+için neredeyse hiçbir şey ödemez. Temel `Event` türüne abone olan bir
+işleyici bütün olayları alır.
+"""
+
+
+class Event:
+    """Bütün olayların temeli; `board` olayı yayan tahtadır."""
+
+    __slots__ = ('board',)
+
+    def __init__(self, board):
+        self.board = board
+
+
+class PieceSpawned(Event):
+    __slots__ = ()
+
+
+class PieceMoved(Event):
+    __slots__ = ('dx', 'dy')
+
+    def __init__(self, board, dx, dy):
+        self.board = board
+        self.dx = dx
+        self.dy = dy
+
+
+class PieceRotated(Event):
+    __slots__ = ()
+
+
+class PieceLocked(Event):
+    """Parça ızgaraya yazıldıktan sonra; `rows` yazılan satırlardır."""
+
+    __slots__ = ('piece', 'rows')
+
+    def __init__(self, board, piece, rows):
+        self.board = board
+        self.piece = piece
+        self.rows = rows
+
+
+class LinesCleared(Event):
+    """Yalnızca en az bir satır silindiğinde; `rows` silinmeden önceki indekslerdir."""
+
+    __slots__ = ('rows',)
+
+    def __init__(self, board, rows):
+        self.board = board
+        self.rows = rows
+
+
+class LevelUp(Event):
+    __slots__ = ('level',)
+
+    def __init__(self, board, level):
+        self.board = board
+        self.level = level
+
+
+class Berserk(Event):
+    """Alt satırların silindiği kare; `rows` silinen satırlardır."""
+
+    __slots__ = ('rows',)
+
+    def __init__(self, board, rows):
+        self.board = board
+        self.rows = rows
+
+
+class PieceHeld(Event):
+    __slots__ = ()
+
+
+class GameOver(Event):
+    __slots__ = ()
+
+
+class BoardReset(Event):
+    """Yeni oyun veya geri yüklenen anlık görüntü; önceki olaylarla bağ kopar."""
+
+    __slots__ = ()
+
+
+EVENT_TYPES = (Event, PieceSpawned, PieceMoved, PieceRotated, PieceLocked, LinesCleared,
+               LevelUp, Berserk, PieceHeld, GameOver, BoardReset)
+
+
+class EventBus:
+    def __init__(self):
+        self.subscribers = {}  # event type -> handlers in subscription order
+        # Precomputed per type: its own handlers first, then those of its base types
+        self.handlers = dict.fromkeys(EVENT_TYPES, ())
+
+    def subscribe(self, event_type, handler):
+        """`handler(event)`'i kaydeder ve aynı işleyiciyi döndürür."""
+        self.subscribers.setdefault(event_type, []).append(handler)
+        self._rebuild()
+        return handler
+
+    def unsubscribe(self, event_type, handler):
+        self.subscribers[event_type].remove(handler)
+        self._rebuild()
+
+    def _rebuild(self):
+        for event_type in self.handlers:
+            self.handlers[event_type] = tuple(
+                handler for base in event_type.__mro__ if base in self.subscribers
+                for handler in self.subscribers[base])
+
+    def emit(self, event_type, board, *args):
+        """Olayı abonelerine dağıtır; abone yoksa olay nesnesi oluşturulmaz."""
+        handlers = self.handlers[event_type]
+        if handlers:
+            event = event_type(board, *args)
+            for handler in handlers:
+                handler(event)
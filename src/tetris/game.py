@@ -6,29 +6,35 @@ göre skor toplar.
 
 import random
 import pygame
-from copy import deepcopy
+from copy import copy, deepcopy
 import os
 import time
 import math
+import logging
 
 from . import settings
-from .pieces import PIECES, Piece
+from . import audio
+from . import livestate
+from . import snapshot
+from . import warehouse
+from .ai import AIPlayer
+from .animation import AnimationBank, TickClock
+from .bloom import Bloom
+from .boardview import Camera, ChunkCache
+from .clip import InstantReplay
+from .events import Berserk, BoardReset, GameOver, LinesCleared, PieceLocked, PieceRotated, PieceSpawned
+from .governor import GraphicsGovernor, fixed_tier
+from .present import Presenter
+from .pipeline import RenderPipeline
+from .profiler import FrameProfiler
+from .scheduler import FrameScheduler, FULL, SLEEP
+from .telemetry import Telemetry, TelemetryServer
+from .widgets import Button, Label, Overlay, TextBox, WidgetLayer
+from .spectate import StreamWriter, SpectatorBroadcaster
+from .surfaces import SurfaceCache
+from .rules import Board
 
-class Button:
-    def __init__(self, rect, text, font, color=(70, 70, 70), text_color=(255,255,255)):
-        self.rect = pygame.Rect(rect)
-        self.text = text
-        self.font = font
-        self.color = color
-        self.text_color = text_color
-    def draw(self, surface):
-        pygame.draw.rect(surface, self.color, self.rect, border_radius=8)
-        pygame.draw.rect(surface, (200,200,200), self.rect, 2, border_radius=8)
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
-    def is_hovered(self, pos):
-        return self.rect.collidepoint(pos)
+logger = logging.getLogger(__name__)
 
 class Particle:
     def __init__(self, x, y, vx, vy, color, img=None, life=30, scale=1.0):
@@ -58,20 +64,6 @@ class Particle:
             pygame.draw.circle(s, (*self.color, alpha), (4,4), 4)
             surface.blit(s, (self.x-4, self.y-4))
 
-class FallingPiece:
-    def __init__(self, piece: Piece, x, y):
-        self.piece = piece
-        self.x = x
-        self.y = y
-        self.shape = deepcopy(piece.shape)
-        self.color_index = piece.color_index
-    def rotate(self):
-        self.shape = [list(row) for row in zip(*self.shape[::-1])]
-    def get_coords(self):
-        return [(self.x + dx, self.y + dy)
-                for dy, row in enumerate(self.shape)
-                for dx, val in enumerate(row) if val]
-
 class AnimatedPiece:
     def __init__(self, falling_piece):
         self.falling_piece = deepcopy(falling_piece)
@@ -85,7 +77,7 @@ class AnimatedPiece:
         self.animating = False
         self.wind_trail = []  # List of (x, y, alpha, color, rot)
         self.tail_length = 24  # longer for best graphics
-    def update(self, new_x, new_y, new_shape, graphics='best'):
+    def update(self, new_x, new_y, new_shape, tail_length=24):
         dx = new_x - self.anim_x
         dy = new_y - self.anim_y
         self.anim_x += dx * 0.4
@@ -97,84 +89,115 @@ class AnimatedPiece:
         d_rot = (self.target_rot - self.anim_rot)
         self.anim_rot += d_rot * 0.3
         # Wind trail
-        if graphics == 'best':
-            self.tail_length = 24
-        elif graphics == 'good':
-            self.tail_length = 12
-        else:
-            self.tail_length = 0
+        self.tail_length = tail_length
         self.wind_trail.append((self.anim_x, self.anim_y, 180, self.falling_piece.color_index, self.anim_rot))
-        if len(self.wind_trail) > self.tail_length:
+        while len(self.wind_trail) > self.tail_length:
             self.wind_trail.pop(0)
     def get_draw_info(self):
         return self.anim_x, self.anim_y, self.anim_rot, self.falling_piece.shape, self.falling_piece.color_index, self.wind_trail
 
-class TetrisGame:
+class TetrisGame(Board):
     def __init__(self):
+        audio.init_mixer()
         pygame.init()
-        self.fullscreen = False
-        self.window_size = (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT)
-        self.screen = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
+        self.telemetry = Telemetry()
+        self.telemetry_server = self.start_telemetry_server()
+        self.record_file = None
+        self.broadcaster = None
+        self.spectator = self.start_spectator()
+        # Everything draws to the fixed logical surface; the presenter scales it once per frame
+        self.presenter = Presenter((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+        self.screen = self.presenter.open()
         pygame.display.set_caption("Doğa Tetrisi")
         self.clock = pygame.time.Clock()
+        self.scheduler = FrameScheduler()
+        self.profiler = FrameProfiler(enabled=bool(settings.PROFILE), alloc=settings.PROFILE == 'alloc')
         self.font = pygame.font.SysFont("Arial", 28, bold=True)
         self.score_font = pygame.font.SysFont("Arial", 48, bold=True)
         self.small_font = pygame.font.SysFont("Arial", 18)
-        self.state = "menu"  # menu, playing, paused, gameover
-        self.grid = self.create_grid()
-        self.score = 0
-        self.level = 1
-        self.lines_cleared = 0
-        self.fall_speed = 500  # ms
+        # Every surface the draw routines generate goes through this one budget
+        self.surfaces = SurfaceCache()
+        self.surfaces.scale = self.presenter.scale
+        self.telemetry.surfaces = self.surfaces
+        # Full-window layers for draw_game, too large for the cache budget at 4K
+        self.game_layers = [None, None]
+        self.game_layer_index = 0
         self.last_fall_time = pygame.time.get_ticks()
-        self.menu_buttons = self.create_menu_buttons()
         self.pause_button_rect = pygame.Rect(settings.WINDOW_WIDTH-50, 10, 40, 40)
-        self.paused_buttons = self.create_paused_buttons()
-        self.gameover_buttons = self.create_gameover_buttons()
-        self.current_piece = None
-        self.next_piece = None
-        self.hold_piece = None
-        self.hold_used = False
-        self.spawn_new_piece()
+        self.checkpoint = None
+        self.animated_piece = None
+        self.ai = None
+        self.live_state = None
+        cols, rows = settings.BOARD_SIZE or (settings.WINDOW_WIDTH // settings.BLOCK_SIZE,
+                                             (settings.WINDOW_HEIGHT-60) // settings.BLOCK_SIZE)
+        Board.__init__(self, cols, rows)
+        self.animated_piece = AnimatedPiece(self.current_piece)
+        self.camera = Camera.fit((0, 60, settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT-60),
+                                 cols, rows, settings.BLOCK_SIZE)
+        self.board_cache = ChunkCache()
+        self.live_state = livestate.start(self)
+        self.state = "menu"  # menu, playing, paused, gameover
         # Sound/music
-        self.sounds = self.load_sounds()
+        self.audio = audio.AudioEngine()
+        self.telemetry.timed_load('sounds', self.audio.load)
         self.music_loaded = False
         self.play_music()
         # High scores
         self.high_scores = self.load_high_scores()
-        # Animation state
-        self.line_clear_anim = None  # (lines, start_time)
+        # Animation state; effects are aged in logic ticks, not wall time
+        self.anim_clock = TickClock()
+        self.line_clear_anim = None  # (lines, start_tick)
         self.anim_duration = 0.3
-        self.lock_anim = None  # (piece, start_time)
-        self.win_anim = None  # (type, start_time)
+        self.lock_anim = None  # (piece, start_tick)
+        self.win_anim = None  # (type, start_tick)
+        self.animations = self.telemetry.timed_load('animations', AnimationBank, self.camera.cell,
+                                                    settings.COLORS, self.anim_clock, self.anim_duration)
+        self.animation_banks = {self.camera.cell: self.animations}
         # Background animation
         self.bg_anim_time = 0
-        self.bg_image = self.load_bg_image()
-        self.leaf_image = self.load_leaf_image()
+        self.bg_image = self.telemetry.timed_load('background', self.load_bg_image)
+        self.leaf_image = self.telemetry.timed_load('leaf', self.load_leaf_image)
         self.leaf_particles = self.create_leaves()
         # Score animation
         self.score_anim = {'value': 0, 'target': 0, 'last_update': time.time()}
         # Explosion particles
         self.explosions = []
-        self.sparkle_img = self.load_img('sparkle.png')
-        self.coin_img = self.load_img('coin.png')
-        self.glow_img = self.load_img('glow.png')
+        self.sparkle_img = self.telemetry.timed_load('sparkle', self.load_img, 'sparkle.png')
+        self.coin_img = self.telemetry.timed_load('coin', self.load_img, 'coin.png')
+        self.glow_img = self.telemetry.timed_load('glow', self.load_img, 'glow.png')
         self.particles = []
-        self.animated_piece = None
         self.menu_state = 'main'  # 'main', 'settings', 'scores'
         self.settings = dict(settings.DEFAULT_SETTINGS)
+        self.audio.apply(self.settings)
         self.mute_button_rect = pygame.Rect(10, 10, 36, 36)
-        self.settings_buttons = self.create_settings_buttons()
-        self.graphics_modes = ['low', 'good', 'best']
+        self.graphics_modes = ['low', 'good', 'best', 'auto']
+        self.governor = GraphicsGovernor()
+        self.effects = settings.GRAPHICS_TIERS[fixed_tier(self.settings['graphics'])]
+        self.bloom = Bloom()
+        # The pipeline worker gets its own scratch surfaces; the main thread's
+        # bloom may run for the menu while a gameplay job is still in flight
+        self.worker_bloom = Bloom()
+        self.pipeline = RenderPipeline()
+        self.instant_replay = InstantReplay(self.screen) if settings.INSTANT_REPLAY['enabled'] else None
+        self.replay_notice = None  # (text, time)
+        # Pre-rendered gold spark for draw_gold_shine
+        self.spark_img = pygame.Surface((24,24), pygame.SRCALPHA)
+        pygame.draw.ellipse(self.spark_img, (255,255,180,180), (0,0,24,12))
         self.leaf_timer = 0
         self.gold_shine_timer = 0
-        self.berserk_ready = False
-        self.berserk_anim = None
-        self.last_berserk_trigger = 0
         self.player_name = "Player"
         self.name_box_active = False
         self.name_box_rect = pygame.Rect(settings.WINDOW_WIDTH//2-90, 140, 180, 40)
         self.name_box_text = ""
+        self.warehouse = warehouse.start(self)
+        # Retained UI: one cached widget layer per screen
+        self.menu_ui = self.create_menu_ui()
+        self.settings_ui = self.create_settings_ui()
+        self.scores_ui = None
+        self.paused_ui = self.create_paused_ui()
+        self.gameover_ui = self.create_gameover_ui()
+        self.help_ui = self.create_help_ui()
+        self.quit_ui = self.create_quit_ui()
         self.shake_offset = [0, 0]
         self.shake_timer = 0
         self.fade_alpha = 255
@@ -182,157 +205,319 @@ class TetrisGame:
         self.show_help = False
         self.show_quit_confirm = False
         self.is_mobile = self.detect_mobile()
-        self.touch_buttons = self.create_touch_buttons() if self.is_mobile else []
+        self.touch_ui = self.create_touch_ui() if self.is_mobile else WidgetLayer()
+        self.subscribe_events()
+        if settings.AI_PLAYER['enabled']:
+            self.toggle_ai()
+
+    def subscribe_events(self):
+        """Efektleri, sesi, telemetriyi ve yayınları kuralların olaylarına bağlar."""
+        events = self.events
+        events.subscribe(PieceSpawned, self.on_piece_spawned)
+        events.subscribe(PieceRotated, self.on_piece_rotated)
+        events.subscribe(PieceLocked, self.on_piece_locked)
+        events.subscribe(LinesCleared, self.on_lines_cleared)
+        events.subscribe(Berserk, self.on_berserk)
+        events.subscribe(GameOver, self.on_game_over)
+        self.telemetry.subscribe(events)
+        if self.spectator:
+            self.spectator.subscribe(events)
+        if self.live_state:
+            self.live_state.subscribe(events)
+        if self.warehouse:
+            self.warehouse.subscribe(events)
 
-    def create_menu_buttons(self):
+    def create_menu_ui(self):
         w, h = 180, 50
         cx = settings.WINDOW_WIDTH // 2 - w//2
-        cy = settings.WINDOW_HEIGHT // 2 - 2*h
+        cy = settings.WINDOW_HEIGHT // 2 - 3*h
         gap = 20
-        return [
-            Button((cx, cy + i*(h+gap), w, h), text, self.font)
-            for i, text in enumerate(["Start", "Restart", "Scores", "Settings", "How to Play", "Quit"] )
-        ]
-    def create_paused_buttons(self):
+        items = [("start", "Start"), ("continue", "Continue"), ("restart", "Restart"), ("scores", "Scores"),
+                 ("settings", "Settings"), ("help", "How to Play"), ("quit", "Quit")]
+        layer = WidgetLayer([
+            TextBox("name", self.name_box_rect, "Name:", self.small_font, self.font),
+            Label("Doğa Tetrisi", self.font, center=(settings.WINDOW_WIDTH//2, 80 + self.font.get_height()//2)),
+        ])
+        for i, (action, text) in enumerate(items):
+            layer.add(Button(action, (cx, cy + i*(h+gap), w, h), text, self.font, rim=self.bloom.available))
+        return layer
+
+    def create_paused_ui(self):
         w, h = 180, 50
         cx = settings.WINDOW_WIDTH // 2 - w//2
         cy = settings.WINDOW_HEIGHT // 2 - h
         gap = 20
-        return [
-            Button((cx, cy + i*(h+gap), w, h), text, self.font)
-            for i, text in enumerate(["Resume", "Restart", "Quit"])
-        ]
-    def create_gameover_buttons(self):
+        layer = WidgetLayer([
+            Overlay((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), 180),
+            Label("Duraklatıldı", self.font, center=(settings.WINDOW_WIDTH//2, 120 + self.font.get_height()//2)),
+        ])
+        for i, (action, text) in enumerate([("resume", "Resume"), ("restart", "Restart"), ("quit", "Quit")]):
+            layer.add(Button(action, (cx, cy + i*(h+gap), w, h), text, self.font))
+        return layer
+
+    def create_gameover_ui(self):
         w, h = 180, 50
         cx = settings.WINDOW_WIDTH // 2 - w//2
         cy = settings.WINDOW_HEIGHT // 2
         gap = 20
-        return [
-            Button((cx, cy + i*(h+gap), w, h), text, self.font)
-            for i, text in enumerate(["Restart", "Menu", "Quit"])
-        ]
-    def create_settings_buttons(self):
+        mid = settings.WINDOW_WIDTH // 2
+        layer = WidgetLayer([
+            Overlay((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), 200),
+            Label("Oyun Bitti!", self.font, (255,80,80), center=(mid, 120 + self.font.get_height()//2)),
+            Label("Skor: 0", self.font, (255,255,0), center=(mid, 180 + self.font.get_height()//2)),
+            Label("En Yüksek Skorlar:", self.small_font, center=(mid, 230 + self.small_font.get_height()//2)),
+        ])
+        for i in range(5):
+            layer.add(Label("", self.small_font, (200,200,200), center=(mid, 260 + i*24 + self.small_font.get_height()//2)))
+        for i, (action, text) in enumerate([("restart", "Restart"), ("menu", "Menu"), ("quit", "Quit")]):
+            layer.add(Button(action, (cx, cy + i*(h+gap), w, h), text, self.font))
+        return layer
+
+    def create_settings_ui(self):
         w, h = 180, 40
         cx = settings.WINDOW_WIDTH // 2 - w//2
         cy = settings.WINDOW_HEIGHT // 2 - 2*h
         gap = 20
-        return [
-            Button((cx, cy + i*(h+gap), w, h), text, self.font)
-            for i, text in enumerate(["Graphics: ", "Music Volume", "Effects Volume", "Mute", "Reset to Defaults", "Back"] )
+        layer = WidgetLayer([
+            Label("Ayarlar", self.font, center=(settings.WINDOW_WIDTH//2, 80 + self.font.get_height()//2)),
+        ])
+        for i, action in enumerate(["graphics", "music_volume", "effects_volume", "mute", "reset", "back"]):
+            layer.add(Button(action, (cx, cy + i*(h+gap), w, h), self.settings_label(action), self.font))
+        return layer
+
+    def settings_label(self, action):
+        if action == "graphics":
+            label = f"Graphics: {self.settings['graphics'].capitalize()}"
+            if self.settings['graphics'] == 'auto':
+                label += f" ({self.effects['name']})"
+            return label
+        if action == "music_volume":
+            return f"Music Volume: {int(self.settings['music_volume']*100)}%"
+        if action == "effects_volume":
+            return f"Effects Volume: {int(self.settings['effects_volume']*100)}%"
+        if action == "mute":
+            return f"Mute: {'On' if self.settings['mute'] else 'Off'}"
+        return {"reset": "Reset to Defaults", "back": "Back"}[action]
+
+    def create_scores_ui(self):
+        mid = settings.WINDOW_WIDTH // 2
+        layer = WidgetLayer([
+            Label("En Yüksek Skorlar", self.font, center=(mid, 80 + self.font.get_height()//2)),
+            Label("(Tıkla veya herhangi bir tuşa bas: Geri)", self.small_font, (200,200,200),
+                  center=(mid, 400 + self.small_font.get_height()//2)),
+        ])
+        for i, s in enumerate(self.high_scores):
+            layer.add(Label(f"{i+1}. {s}", self.small_font, (255,255,0 if i==0 else 200),
+                            center=(mid, 180 + i*32 + self.small_font.get_height()//2)))
+        layer.scores = list(self.high_scores)
+        return layer
+
+    def create_help_ui(self):
+        help_lines = [
+            "Nasıl Oynanır:",
+            "Sol/Sağ: Hareket", "Yukarı: Döndür", "Aşağı: Hızlı düşür",
+            "Boşluk: Anında düşür", "ESC: Duraklat", "C: Hold", "F: Tam ekran",
+            "F5/F9: Kontrol noktası kaydet/yükle",
+            "F7: Yapay zeka oynasın",
+            "F8: Son saniyeleri kaydet",
+            "Fare: Menü butonları", "M: Sesi aç/kapat"
         ]
+        return WidgetLayer([Overlay((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), 200, help_lines, self.font)])
 
-    def create_grid(self):
-        cols = settings.WINDOW_WIDTH // settings.BLOCK_SIZE
-        rows = (settings.WINDOW_HEIGHT-60) // settings.BLOCK_SIZE
-        return [[None for _ in range(cols)] for _ in range(rows)]
+    def create_quit_ui(self):
+        mid = settings.WINDOW_WIDTH // 2
+        return WidgetLayer([
+            Overlay((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), 180),
+            Label("Çıkmak istiyor musun?", self.font, center=(mid, 220 + self.font.get_height()//2)),
+            Button("quit_yes", (mid-80, 300, 70, 40), "Evet", self.font, (80,200,80)),
+            Button("quit_no", (mid+10, 300, 70, 40), "Hayır", self.font, (200,80,80)),
+        ])
 
-    def spawn_new_piece(self):
-        if self.next_piece is None:
-            self.current_piece = FallingPiece(random.choice(PIECES), 3, 0)
-            self.next_piece = FallingPiece(random.choice(PIECES), 3, 0)
-        else:
-            self.current_piece = self.next_piece
-            self.current_piece.x = 3
-            self.current_piece.y = 0
-            self.next_piece = FallingPiece(random.choice(PIECES), 3, 0)
-        self.hold_used = False
-        if not self.is_valid_position(self.current_piece, 0, 0):
-            self.state = "gameover"
-        self.animated_piece = AnimatedPiece(self.current_piece)
+    def save_instant_replay(self):
+        path = self.instant_replay.save()
+        if path:
+            self.replay_notice = (f"Kaydediliyor: {os.path.basename(path)}", time.time())
+
+    def toggle_ai(self):
+        if self.ai:
+            self.ai.close()
+            self.ai = None
+            return
+        try:
+            self.ai = AIPlayer(cols=self.cols, rows=self.rows)
+        except OSError as exc:
+            logger.warning("AI player disabled: %s", exc)
+            return
+        self.ai.request(self)
 
     def run(self):
         running = True
         self.state = 'menu'  # Always start in menu
         while running:
-            self.clock.tick(settings.FPS)
-            self.bg_anim_time += 1/settings.FPS
-            self.gold_shine_timer += 1/settings.FPS
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    if self.state == 'menu':
-                        running = False
-                    else:
-                        self.show_quit_confirm = True
-                if self.state == "menu":
-                    self.handle_menu_event(event)
-                elif self.state == "playing":
-                    self.handle_game_event(event)
-                elif self.state == "paused":
-                    self.handle_paused_event(event)
-                elif self.state == "gameover":
-                    self.handle_gameover_event(event)
-                if self.name_box_active:
-                    self.handle_name_box_event(event)
+            mode = self.frame_mode()
+            events = self.scheduler.wait(self.clock, mode)
+            # Sounds started while handling these events count toward event-to-audio latency
+            self.audio.input_at = time.perf_counter()
+            dt = min(self.clock.get_time(), 100) / 1000
+            self.profiler.begin_frame()
+            self.update_effects(measure=mode == FULL)
+            self.bg_anim_time += dt
+            self.gold_shine_timer += dt
+            with self.profiler.phase('events'):
+                running = self.handle_events(events, running)
+            self.audio.input_at = None
+            if self.scheduler.minimized and self.state == "playing":
+                # Nobody can see the board; falling pieces would lose the game
+                self.pause_game()
             if self.state == "playing":
-                self.update()
-            self.draw()
+                if self.ai:
+                    with self.profiler.phase('ai'):
+                        self.ai.step(self, dt)
+                with self.profiler.phase('update'):
+                    self.update()
+            if mode != SLEEP:
+                with self.profiler.phase('draw'):
+                    self.draw()
+            self.profiler.end_frame()
+            if self.spectator and self.state != "menu":
+                self.spectator.frame(self)
+            if self.live_state:
+                self.live_state.publish(self)
+            if mode == FULL:
+                self.telemetry.frame(self.clock.get_time(), self.state == "playing",
+                                     len(self.particles), self.level, self.score)
+        self.shutdown()
+
+    def shutdown(self):
+        """Oyundan her çıkış yolu buradan geçer: yan hizmetler kapatılır, tamponlar yazılır."""
+        self.profiler.log_report()
+        self.profiler.close()
+        self.audio.log_report()
+        self.surfaces.log_report()
+        self.pipeline.close()
+        if self.ai:
+            self.ai.close()
+        if self.spectator:
+            # Frames since the last record are still only counted
+            self.spectator.close()
+        if self.record_file:
+            self.record_file.close()
+        if self.broadcaster:
+            self.broadcaster.close()
+        if self.live_state:
+            self.live_state.close()
+        if self.warehouse:
+            self.warehouse.close()
+        if self.instant_replay:
+            self.instant_replay.close()
+        if self.telemetry_server:
+            self.telemetry_server.stop()
         pygame.quit()
 
+    def frame_mode(self):
+        """Zamanlayıcının bu kare için seçtiği mod; menü karartması sürerken tam hız."""
+        # The fade is only drawn by the menu, so a pending one must not keep other screens busy
+        return self.scheduler.mode(self.state, busy=self.fade_in and self.state == "menu")
+
+    def handle_events(self, events, running):
+        for event in events:
+            event = self.presenter.map_event(event)
+            self.scheduler.observe(event)
+            if event.type == pygame.VIDEORESIZE:
+                self.presenter.resize(event.w, event.h)
+                self.surfaces.invalidate(self.presenter.scale)
+                self.game_layers = [None, None]
+            if event.type == pygame.QUIT:
+                if self.state == 'menu':
+                    running = False
+                else:
+                    self.show_quit_confirm = True
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.log_report()
+                self.surfaces.log_report()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F8 and self.instant_replay:
+                self.save_instant_replay()
+            if event.type == pygame.APP_WILLENTERBACKGROUND:
+                if self.state == "playing":
+                    self.pause_game()
+                elif self.state == "paused":
+                    self.autosave()
+            if self.state == "menu":
+                self.handle_menu_event(event)
+            elif self.state == "playing":
+                self.handle_game_event(event)
+            elif self.state == "paused":
+                self.handle_paused_event(event)
+            elif self.state == "gameover":
+                self.handle_gameover_event(event)
+            if self.name_box_active:
+                self.handle_name_box_event(event)
+        return running
+
     def handle_menu_event(self, event):
         if self.menu_state == 'main':
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if self.name_box_rect.collidepoint(event.pos):
-                    self.name_box_active = True
-                else:
-                    self.name_box_active = False
-                for btn in self.menu_buttons:
-                    if btn.is_hovered(event.pos):
-                        if btn.text == "Start":
-                            self.reset_game()
-                            self.state = "playing"
-                            self.fade_in = True
-                            self.fade_alpha = 255
-                        elif btn.text == "Restart":
-                            self.reset_game()
-                        elif btn.text == "Scores":
-                            self.menu_state = 'scores'
-                        elif btn.text == "Settings":
-                            self.menu_state = 'settings'
-                        elif btn.text == "How to Play":
-                            self.show_help = True
-                        elif btn.text == "Quit":
-                            self.show_quit_confirm = True
+                action = self.menu_ui.action_at(event.pos)
+                self.name_box_active = action == "name"
+                if action == "start":
+                    self.reset_game()
+                    self.state = "playing"
+                    self.fade_in = True
+                    self.fade_alpha = 255
+                elif action == "continue":
+                    if self.load_autosave():
+                        self.state = "paused"
+                elif action == "restart":
+                    self.reset_game()
+                elif action == "scores":
+                    self.menu_state = 'scores'
+                elif action == "settings":
+                    self.menu_state = 'settings'
+                elif action == "help":
+                    self.show_help = True
+                elif action == "quit":
+                    self.show_quit_confirm = True
                 if self.mute_button_rect.collidepoint(event.pos):
                     self.toggle_mute()
         elif self.menu_state == 'settings':
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for i, btn in enumerate(self.settings_buttons):
-                    if btn.is_hovered(event.pos):
-                        if btn.text.startswith("Graphics"):
-                            idx = self.graphics_modes.index(self.settings['graphics'])
-                            self.settings['graphics'] = self.graphics_modes[(idx+1)%len(self.graphics_modes)]
-                        elif btn.text == "Music Volume":
-                            self.settings['music_volume'] = max(0.0, min(1.0, self.settings['music_volume']+0.1))
-                            pygame.mixer.music.set_volume(0 if self.settings['mute'] else self.settings['music_volume'])
-                        elif btn.text == "Effects Volume":
-                            self.settings['effects_volume'] = max(0.0, min(1.0, self.settings['effects_volume']+0.1))
-                            for s in self.sounds.values():
-                                s.set_volume(0 if self.settings['mute'] else self.settings['effects_volume'])
-                        elif btn.text == "Mute":
-                            self.toggle_mute()
-                        elif btn.text == "Reset to Defaults":
-                            self.settings = dict(settings.DEFAULT_SETTINGS)
-                            pygame.mixer.music.set_volume(self.settings['music_volume'])
-                            for s in self.sounds.values():
-                                s.set_volume(self.settings['effects_volume'])
-                        elif btn.text == "Back":
-                            self.menu_state = 'main'
+                action = self.settings_ui.action_at(event.pos)
+                if action == "graphics":
+                    idx = self.graphics_modes.index(self.settings['graphics'])
+                    self.settings['graphics'] = self.graphics_modes[(idx+1)%len(self.graphics_modes)]
+                    self.update_effects()
+                elif action == "music_volume":
+                    self.settings['music_volume'] = max(0.0, min(1.0, self.settings['music_volume']+0.1))
+                    self.audio.apply(self.settings)
+                elif action == "effects_volume":
+                    self.settings['effects_volume'] = max(0.0, min(1.0, self.settings['effects_volume']+0.1))
+                    self.audio.apply(self.settings)
+                elif action == "mute":
+                    self.toggle_mute()
+                elif action == "reset":
+                    self.settings = dict(settings.DEFAULT_SETTINGS)
+                    self.update_effects()
+                    self.audio.apply(self.settings)
+                elif action == "back":
+                    self.menu_state = 'main'
         elif self.menu_state == 'scores':
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 self.menu_state = 'main'
         if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
             self.toggle_mute()
         if self.show_quit_confirm and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mx, my = event.pos
-            if self.quit_yes_rect.collidepoint(mx, my):
-                pygame.quit(); exit()
-            elif self.quit_no_rect.collidepoint(mx, my):
+            action = self.quit_ui.action_at(event.pos)
+            if action == "quit_yes":
+                self.shutdown(); exit()
+            elif action == "quit_no":
                 self.show_quit_confirm = False
 
     def handle_name_box_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
                 self.player_name = self.name_box_text if self.name_box_text else "Player"
+                if self.warehouse:
+                    self.warehouse.player = self.player_name
                 self.name_box_active = False
             elif event.key == pygame.K_BACKSPACE:
                 self.name_box_text = self.name_box_text[:-1]
@@ -342,10 +527,12 @@ class TetrisGame:
     def handle_game_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.pause_button_rect.collidepoint(event.pos):
-                self.state = "paused"
+                self.pause_game()
         if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_DOWN, pygame.K_UP, pygame.K_SPACE, pygame.K_c):
+                self.telemetry.action()
             if event.key == pygame.K_ESCAPE:
-                self.state = "paused"
+                self.pause_game()
             elif event.key == pygame.K_LEFT:
                 self.try_move(-1, 0)
                 self.play_sound("move")
@@ -365,119 +552,263 @@ class TetrisGame:
                 self.play_sound("click")
             elif event.key == pygame.K_f:
                 self.toggle_fullscreen()
-        if event.type == pygame.VIDEORESIZE:
-            # Maintain aspect ratio
-            w, h = event.w, event.h
-            aspect = settings.ASPECT_RATIO
-            if w/h > aspect:
-                h = h
-                w = int(h * aspect)
-            else:
-                w = w
-                h = int(w / aspect)
-            self.window_size = (w, h)
-            self.screen = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
+            elif event.key == pygame.K_F5:
+                self.checkpoint = self.save_snapshot()
+            elif event.key == pygame.K_F9:
+                if self.checkpoint:
+                    self.load_snapshot(self.checkpoint)
+            elif event.key == pygame.K_F7:
+                self.toggle_ai()
+            elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                self.zoom_board(1)
+            elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                self.zoom_board(-1)
+        if event.type == pygame.MOUSEWHEEL:
+            self.zoom_board(event.y)
         if self.is_mobile and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for btn in self.touch_buttons:
-                if btn['rect'].collidepoint(event.pos):
-                    if btn['action'] == 'rotate':
-                        self.try_rotate()
-                        self.play_sound("rotate")
-                    elif btn['action'] == 'drop':
-                        self.hard_drop()
-                    elif btn['action'] == 'hold':
-                        self.hold_current_piece()
-                        self.play_sound("click")
-                    elif btn['action'] == 'left':
-                        self.try_move(-1, 0)
-                        self.play_sound("move")
-                    elif btn['action'] == 'right':
-                        self.try_move(1, 0)
-                        self.play_sound("move")
+            action = self.touch_ui.action_at(event.pos)
+            if action:
+                self.telemetry.action()
+            if action == 'rotate':
+                self.try_rotate()
+                self.play_sound("rotate")
+            elif action == 'drop':
+                self.hard_drop()
+            elif action == 'hold':
+                self.hold_current_piece()
+                self.play_sound("click")
+            elif action == 'left':
+                self.try_move(-1, 0)
+                self.play_sound("move")
+            elif action == 'right':
+                self.try_move(1, 0)
+                self.play_sound("move")
 
     def handle_paused_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for btn in self.paused_buttons:
-                if btn.is_hovered(event.pos):
-                    if btn.text == "Resume":
-                        self.state = "playing"
-                    elif btn.text == "Restart":
-                        self.reset_game()
-                        self.state = "playing"
-                    elif btn.text == "Quit":
-                        pygame.quit(); exit()
+            action = self.paused_ui.action_at(event.pos)
+            if action == "resume":
+                self.state = "playing"
+            elif action == "restart":
+                self.reset_game()
+                self.state = "playing"
+            elif action == "quit":
+                self.shutdown(); exit()
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self.state = "playing"
 
     def handle_gameover_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for btn in self.gameover_buttons:
-                if btn.is_hovered(event.pos):
-                    if btn.text == "Restart":
-                        self.reset_game()
-                        self.state = "playing"
-                    elif btn.text == "Menu":
-                        self.state = "menu"
-                    elif btn.text == "Quit":
-                        pygame.quit(); exit()
+            action = self.gameover_ui.action_at(event.pos)
+            if action == "restart":
+                self.reset_game()
+                self.state = "playing"
+            elif action == "menu":
+                self.state = "menu"
+            elif action == "quit":
+                self.shutdown(); exit()
 
     def reset_game(self):
-        self.grid = self.create_grid()
-        self.score = 0
-        self.level = 1
-        self.lines_cleared = 0
-        self.fall_speed = 500
+        state = self.state
+        self.telemetry.new_session()
+        self.reset_board()
+        self.state = state  # callers decide when play starts
         self.last_fall_time = pygame.time.get_ticks()
-        self.current_piece = None
-        self.next_piece = None
-        self.hold_piece = None
-        self.hold_used = False
-        self.spawn_new_piece()
+
+    def start_spectator(self):
+        sinks = []
+        if settings.SPECTATOR_PORT:
+            try:
+                self.broadcaster = SpectatorBroadcaster(settings.SPECTATOR_HOST, settings.SPECTATOR_PORT)
+                sinks.append(self.broadcaster.send)
+            except OSError as exc:
+                logger.warning("spectator stream disabled: %s", exc)
+        if settings.RECORD_FILE:
+            try:
+                self.record_file = open(settings.RECORD_FILE, 'wb')
+                sinks.append(lambda data, keyframe: self.record_file.write(data))
+            except OSError as exc:
+                logger.warning("game recording disabled: %s", exc)
+        if not sinks:
+            return None
+        def sink(data, keyframe):
+            for send in sinks:
+                send(data, keyframe)
+        return StreamWriter(sink, fps=settings.FPS)
+
+    def start_telemetry_server(self):
+        if not settings.METRICS_PORT:
+            return None
+        try:
+            return TelemetryServer(self.telemetry, settings.METRICS_HOST, settings.METRICS_PORT).start()
+        except OSError as exc:
+            logger.warning("telemetry endpoint disabled: %s", exc)
+            return None
+
+    def update_effects(self, measure=True):
+        mode = self.settings.get('graphics', 'best')
+        if mode == 'auto':
+            if measure:
+                self.governor.tick(self.clock.get_rawtime())
+            self.effects = self.governor.effects
+        else:
+            self.effects = settings.GRAPHICS_TIERS[fixed_tier(mode)]
+
+    def pause_game(self):
+        self.state = "paused"
+        self.autosave()
+
+    def save_snapshot(self):
+        return snapshot.capture(self)
+
+    def load_snapshot(self, data):
+        state = snapshot.restore(self, data)
+        # Presentation state is not part of the snapshot; start it fresh
+        self.animated_piece = AnimatedPiece(self.current_piece)
+        self.line_clear_anim = None
+        self.lock_anim = None
+        self.win_anim = None
+        self.explosions = []
+        self.particles = []
+        self.shake_timer = 0
+        self.shake_offset = [0, 0]
+        self.score_anim['value'] = self.score_anim['target'] = self.score
+        self.last_fall_time = pygame.time.get_ticks()
+        self.events.emit(BoardReset, self)
+        return state
+
+    def autosave(self):
+        try:
+            snapshot.save_file(self.save_snapshot(), settings.AUTOSAVE_FILE)
+        except (OSError, snapshot.SnapshotError) as exc:
+            logger.warning("autosave failed: %s", exc)
+
+    def load_autosave(self):
+        data = snapshot.load_file(settings.AUTOSAVE_FILE)
+        if not data:
+            return False
+        try:
+            self.load_snapshot(data)
+        except snapshot.SnapshotError:
+            return False
+        return True
+
+    def clear_autosave(self):
+        if os.path.exists(settings.AUTOSAVE_FILE):
+            os.remove(settings.AUTOSAVE_FILE)
 
     def update(self):
         now = pygame.time.get_ticks()
+        if not self.update_animations():
+            return  # Wait for animation
+        if now - self.last_fall_time > self.fall_speed:
+            self.last_fall_time = now
+            self.gravity_step()
+        # Level up logic
+        self.update_level()
+        self.update_particles()
+        # Berserk mode: only trigger once per 10 lines
+        self.check_berserk()
+        self.advance_berserk()
+
+    # -- event subscribers ----------------------------------------------
+    def on_piece_spawned(self, event):
+        self.animated_piece = AnimatedPiece(self.current_piece)
+        if self.ai and self.state != "gameover":
+            self.ai.request(self)
+
+    def on_piece_rotated(self, event):
+        # Animate rotation (actual shape and animation)
+        if self.animated_piece:
+            self.animated_piece.falling_piece.shape = deepcopy(self.current_piece.shape)
+            self.animated_piece.target_rot += 90
+
+    def on_piece_locked(self, event):
+        piece = event.piece
+        self.lock_anim = (deepcopy(piece), self.anim_clock.ticks)
+        color = settings.COLORS[piece.color_index]
+        img = self.coin_img if self.coin_img else None
+        for x, y in piece.get_coords():
+            if 0 <= y < len(self.grid) and 0 <= x < len(self.grid[0]):
+                # Add sparkle/coin particles
+                px, py = self.camera.to_screen(x + 0.5, y + 0.5)
+                for _ in range(2):
+                    vx = random.uniform(-1,1)
+                    vy = random.uniform(-2,-0.5)
+                    self.particles.append(Particle(px, py, vx, vy, color, img, 30, 0.7))
+        self.play_sound("drop")
+        self.score_anim['target'] = self.score
+
+    def on_lines_cleared(self, event):
+        lines = event.rows
+        self.line_clear_anim = (lines, self.anim_clock.ticks)
+        self.play_sound("line")
+        self.shake_timer = 16  # camera shake
+        if len(lines) >= 2:
+            self.win_anim = ("bigwin", self.anim_clock.ticks)
+            if self.instant_replay:
+                self.instant_replay.mark("bigwin")
+        self.play_sound("levelup")
+
+    def on_game_over(self, event):
+        # Once per game: a finished game must not be offered by "Continue"
+        self.save_high_score(self.score)
+        self.clear_autosave()
+        self.play_sound("gameover")
+
+    def on_berserk(self, event):
+        # Add coin/slot explosion
+        img = self.coin_img if self.coin_img else None
+        for l in event.rows:
+            for x in range(len(self.grid[0])):
+                vx = random.uniform(-2,2)
+                vy = random.uniform(-4,-1)
+                px, py = self.camera.to_screen(x + 0.5, l + 0.5)
+                self.particles.append(Particle(px, py, vx, vy, (255,215,0), img, 40, 1.0))
+        self.play_sound("win")
+        if self.instant_replay:
+            self.instant_replay.mark("berserk")
+
+    def update_animations(self):
+        """Satır silme animasyonu sürerken False döndürür; oyun o sırada bekler."""
+        self.anim_clock.advance()
+        now = self.anim_clock.ticks
         self.update_leaves()
         self.update_score_anim()
+        if self.lock_anim and self.animations.lock[0].done(now - self.lock_anim[1]):
+            self.lock_anim = None
         if self.line_clear_anim:
             lines, start = self.line_clear_anim
-            if time.time() - start < self.anim_duration:
-                return  # Wait for animation
-            # Explosion effect
+            if not self.animations.line_clear[0].done(now - start):
+                return False
+            # Explosion effect; colors cycle by cell so replays match
+            cols = len(self.grid[0])
+            step = max(1, cols // self.effects['explosion_density'])
             for y in lines:
-                for x in range(10):
-                    self.explosions.append({'x': x, 'y': y, 't': 0, 'color': settings.COLORS[random.randint(0,3)]})
+                for x in range(0, cols, step):
+                    self.explosions.append({'x': x, 'y': y, 't': 0, 'color': (x + y) % len(settings.COLORS)})
             self.line_clear_anim = None
         for exp in self.explosions:
             exp['t'] += 1
-        self.explosions = [e for e in self.explosions if e['t'] < 20]
+        self.explosions = [e for e in self.explosions if not self.animations.explosion[0].done(e['t'])]
         if self.win_anim:
             anim_type, start = self.win_anim
-            if time.time() - start > 1.0:
+            if now - start > self.anim_clock.ticks_for(1.0):
                 self.win_anim = None
-        if now - self.last_fall_time > self.fall_speed:
-            self.last_fall_time = now
-            if not self.try_move(0, 1):
-                self.lock_piece()
-                lines = self.get_full_lines()
-                if lines:
-                    self.line_clear_anim = (lines, time.time())
-                    self.play_sound("line")
-                    if len(lines) >= 2:
-                        self.win_anim = ("bigwin", time.time())
-                        self.play_sound("levelup")
-                self.clear_lines()
-                self.spawn_new_piece()
-        # Level up logic
-        self.level = 1 + self.lines_cleared // 10
-        self.fall_speed = max(100, 500 - (self.level-1)*40)
+        return True
+
+    def update_particles(self):
         for p in self.particles:
             p.update()
         self.particles = [p for p in self.particles if p.age < p.life]
+        cap = self.effects['particle_cap']
+        if len(self.particles) > cap:
+            del self.particles[:-cap]
         # Animate piece
-        graphics = self.settings.get('graphics', 'best')
         if self.animated_piece:
-            self.animated_piece.update(self.current_piece.x, self.current_piece.y, self.current_piece.shape, graphics)
+            self.animated_piece.update(self.current_piece.x, self.current_piece.y, self.current_piece.shape, self.effects['trail_length'])
+        self.camera.follow(self.current_piece)
         # Camera shake
         if self.shake_timer > 0:
             self.shake_timer -= 1
@@ -485,107 +816,14 @@ class TetrisGame:
             self.shake_offset[1] = random.randint(-4, 4)
         else:
             self.shake_offset = [0, 0]
-        # Berserk mode logic fix: only trigger once per 10 lines, after player clears 10, 20, 30... lines
-        if self.lines_cleared // 10 > self.last_berserk_trigger and self.lines_cleared % 10 == 0:
-            self.last_berserk_trigger = self.lines_cleared // 10
-            self.berserk_ready = True
-            self.berserk_anim = {'timer': 0, 'lines': [len(self.grid)-1, len(self.grid)-2]}
-        if self.berserk_anim:
-            self.berserk_anim['timer'] += 1
-            if self.berserk_anim['timer'] == 1:
-                # Remove 2 bottom lines and shift grid up
-                for l in sorted(self.berserk_anim['lines']):
-                    self.grid.pop()
-                    self.grid.insert(0, [None for _ in range(len(self.grid[0]))])
-                # Add coin/slot explosion
-                for l in self.berserk_anim['lines']:
-                    for x in range(len(self.grid[0])):
-                        vx = random.uniform(-2,2)
-                        vy = random.uniform(-4,-1)
-                        img = self.coin_img if self.coin_img else None
-                        self.particles.append(Particle(x*settings.BLOCK_SIZE+settings.BLOCK_SIZE//2, l*settings.BLOCK_SIZE+60+settings.BLOCK_SIZE//2, vx, vy, (255,215,0), img, 40, 1.0))
-                self.play_sound("win")
-            if self.berserk_anim['timer'] > 60:
-                self.berserk_anim = None
-                self.berserk_ready = False
-
-    def try_move(self, dx, dy):
-        if self.is_valid_position(self.current_piece, dx, dy):
-            self.current_piece.x += dx
-            self.current_piece.y += dy
-            return True
-        return False
-
-    def try_rotate(self):
-        old_shape = deepcopy(self.current_piece.shape)
-        self.current_piece.rotate()
-        if not self.is_valid_position(self.current_piece, 0, 0):
-            # Wall kick: try shifting left or right
-            if self.is_valid_position(self.current_piece, -1, 0):
-                self.current_piece.x -= 1
-            elif self.is_valid_position(self.current_piece, 1, 0):
-                self.current_piece.x += 1
-            else:
-                self.current_piece.shape = old_shape
-        # Animate rotation (actual shape and animation)
-        if self.animated_piece:
-            self.animated_piece.falling_piece.shape = deepcopy(self.current_piece.shape)
-            self.animated_piece.target_rot += 90
-
-    def hard_drop(self):
-        while self.try_move(0, 1):
-            pass
-        self.lock_piece()
-        self.clear_lines()
-        self.spawn_new_piece()
-
-    def is_valid_position(self, piece, dx, dy):
-        for x, y in piece.get_coords():
-            nx, ny = x + dx, y + dy
-            if nx < 0 or nx >= len(self.grid[0]) or ny < 0 or ny >= len(self.grid):
-                return False
-            if self.grid[ny][nx] is not None:
-                return False
-        return True
-
-    def lock_piece(self):
-        self.lock_anim = (deepcopy(self.current_piece), time.time())
-        for x, y in self.current_piece.get_coords():
-            if 0 <= y < len(self.grid) and 0 <= x < len(self.grid[0]):
-                self.grid[y][x] = self.current_piece.color_index
-                # Add sparkle/coin particles
-                for _ in range(2):
-                    vx = random.uniform(-1,1)
-                    vy = random.uniform(-2,-0.5)
-                    img = self.coin_img if self.coin_img else None
-                    self.particles.append(Particle(
-                        x*settings.BLOCK_SIZE+settings.BLOCK_SIZE//2,
-                        y*settings.BLOCK_SIZE+60+settings.BLOCK_SIZE//2,
-                        vx, vy, settings.COLORS[self.current_piece.color_index], img, 30, 0.7))
-        self.play_sound("drop")
-        self.score_anim['target'] = self.score
-
-    def clear_lines(self):
-        full_lines = [i for i, row in enumerate(self.grid) if all(cell is not None for cell in row)]
-        if full_lines:
-            self.line_clear_anim = (full_lines, time.time())
-            self.play_sound("line")
-            self.shake_timer = 16  # camera shake
-        new_grid = [row for row in self.grid if any(cell is None for cell in row)]
-        lines_cleared = len(self.grid) - len(new_grid)
-        if lines_cleared > 0:
-            for _ in range(lines_cleared):
-                new_grid.insert(0, [None for _ in range(len(self.grid[0]))])
-            self.grid = new_grid
-            self.lines_cleared += lines_cleared
-            self.score += [0, 100, 300, 500, 800][lines_cleared]
-            if lines_cleared >= 1:
-                self.play_sound("levelup")
 
     def draw(self):
-        self.draw_cyberpunk_background()
+        with self.profiler.phase('background'):
+            self.draw_cyberpunk_background()
         if self.state == "menu":
             self.draw_menu()
+            with self.profiler.phase('bloom'):
+                self.bloom.apply(self.screen, strength=self.bloom_strength())
         elif self.state == "playing":
             self.draw_game()
         elif self.state == "paused":
@@ -594,105 +832,92 @@ class TetrisGame:
         elif self.state == "gameover":
             self.draw_game()
             self.draw_gameover()
-        pygame.display.flip()
+        if self.instant_replay and self.state != "menu":
+            with self.profiler.phase('capture'):
+                self.instant_replay.capture(self.screen)
+            self.profiler.count('capture_max_us', self.instant_replay.stats['max_us'])
+        self.prepare_layers()
+        with self.profiler.phase('flip'):
+            self.presenter.present()
+
+    def prepare_layers(self):
+        # Queue next frame's background and particle layers on the render workers
+        if not self.pipeline.threaded:
+            return
+        size = self.screen.get_size()
+        leaves = [(leaf['x'], leaf['y'], leaf['size'], leaf['angle']) for leaf in self.leaf_particles]
+        self.pipeline.submit('background', size, 0, self.paint_background, self.bg_anim_time, leaves)
+        if self.state != "menu":
+            self.pipeline.submit('particles', size, pygame.SRCALPHA, self.paint_particles,
+                                 [copy(p) for p in self.particles])
 
     def draw_cyberpunk_background(self):
+        layer = self.pipeline.front('background') if self.pipeline.threaded else None
+        if layer is not None:
+            self.screen.blit(layer, (0,0))
+            return
+        leaves = [(leaf['x'], leaf['y'], leaf['size'], leaf['angle']) for leaf in self.leaf_particles]
+        self.paint_background(self.screen, self.bg_anim_time, leaves)
+
+    def paint_background(self, surface, t, leaves):
         if self.bg_image:
-            bg = pygame.transform.smoothscale(self.bg_image, self.screen.get_size())
-            self.screen.blit(bg, (0,0))
+            surface.blit(self.bg_image, (0,0))
         else:
-            self.draw_animated_background()
+            self.draw_animated_background(surface, t)
         # Draw animated leaves
         if self.leaf_image:
-            for leaf in self.leaf_particles:
-                x = int(leaf['x'])
-                y = int(leaf['y'])
-                scale = leaf['size']
-                img = pygame.transform.rotozoom(self.leaf_image, leaf['angle']*180/math.pi, scale)
-                self.screen.blit(img, (x, y))
+            for x, y, scale, angle in leaves:
+                img = pygame.transform.rotozoom(self.leaf_image, angle*180/math.pi, scale)
+                surface.blit(img, (int(x), int(y)))
+
+    def paint_particles(self, surface, particles):
+        surface.fill((0,0,0,0))
+        for p in particles:
+            p.draw(surface)
+
+    def paint_bloom(self, surface, source, strength):
+        # Runs on the pipeline worker
+        self.worker_bloom.render(source, surface, strength)
 
     def draw_menu(self):
         self.draw_cyberpunk_background()
         # Top left mute button
         self.draw_mute_button()
-        # Name box
-        pygame.draw.rect(self.screen, (40,40,60), self.name_box_rect, border_radius=8)
-        pygame.draw.rect(self.screen, (255,255,255), self.name_box_rect, 2, border_radius=8)
-        name_label = self.small_font.render("Name:", True, (255,255,255), None)
-        self.screen.blit(name_label, (self.name_box_rect.x-60, self.name_box_rect.y+8))
-        name_text = self.font.render(self.name_box_text if self.name_box_active else (self.player_name or "Player"), True, (255,215,0) if self.name_box_active else (255,255,255), None)
-        self.screen.blit(name_text, (self.name_box_rect.x+10, self.name_box_rect.y+5))
+        # Name box (part of the main layer for clicks, shown on every menu page)
+        name_box = self.menu_ui.get("name")
+        name_box.active = self.name_box_active
+        name_box.text = self.name_box_text if self.name_box_active else (self.player_name or "Player")
+        if self.menu_state != 'main':
+            name_box.draw(self.screen)
         if self.menu_state == 'main':
-            title = self.font.render("Doğa Tetrisi", True, (255,255,255), None)
-            self.screen.blit(title, (settings.WINDOW_WIDTH//2 - title.get_width()//2, 80))
-            for btn in self.menu_buttons:
-                btn.draw(self.screen)
+            self.menu_ui.draw(self.screen)
             # Button hover glow
-            mouse = pygame.mouse.get_pos()
-            for btn in self.menu_buttons:
-                if btn.is_hovered(mouse):
-                    glow = self.glow_img
-                    if glow:
-                        g = pygame.transform.smoothscale(glow, (btn.rect.width+20, btn.rect.height+20))
-                        self.screen.blit(g, (btn.rect.x-10, btn.rect.y-10), special_flags=pygame.BLEND_ADD)
+            hovered = self.menu_ui.hover(self.presenter.mouse_pos())
+            if isinstance(hovered, Button) and self.glow_img and not self.bloom.available:
+                glow = self.scaled_glow((hovered.rect.width+20, hovered.rect.height+20))
+                self.screen.blit(glow, (hovered.rect.x-10, hovered.rect.y-10), special_flags=pygame.BLEND_ADD)
         elif self.menu_state == 'settings':
-            title = self.font.render("Ayarlar", True, (255,255,255), None)
-            self.screen.blit(title, (settings.WINDOW_WIDTH//2 - title.get_width()//2, 80))
-            for i, btn in enumerate(self.settings_buttons):
-                label = btn.text
-                if label.startswith("Graphics"):
-                    label = f"Graphics: {self.settings['graphics'].capitalize()}"
-                elif label == "Music Volume":
-                    label = f"Music Volume: {int(self.settings['music_volume']*100)}%"
-                elif label == "Effects Volume":
-                    label = f"Effects Volume: {int(self.settings['effects_volume']*100)}%"
-                elif label == "Mute":
-                    label = f"Mute: {'On' if self.settings['mute'] else 'Off'}"
-                btn.font = self.font
-                btn.text = label
-                btn.draw(self.screen)
+            for btn in self.settings_ui:
+                if isinstance(btn, Button):
+                    btn.set_text(self.settings_label(btn.action))
+            self.settings_ui.draw(self.screen)
         elif self.menu_state == 'scores':
-            title = self.font.render("En Yüksek Skorlar", True, (255,255,255), None)
-            self.screen.blit(title, (settings.WINDOW_WIDTH//2 - title.get_width()//2, 80))
-            for i, s in enumerate(self.high_scores):
-                sc = self.small_font.render(f"{i+1}. {s}", True, (255,255,0 if i==0 else 200), None)
-                self.screen.blit(sc, (settings.WINDOW_WIDTH//2 - sc.get_width()//2, 180 + i*32))
-            back = self.small_font.render("(Tıkla veya herhangi bir tuşa bas: Geri)", True, (200,200,200), None)
-            self.screen.blit(back, (settings.WINDOW_WIDTH//2 - back.get_width()//2, 400))
+            if self.scores_ui is None or self.scores_ui.scores != self.high_scores:
+                self.scores_ui = self.create_scores_ui()
+            self.scores_ui.draw(self.screen)
         # Help overlay
         if self.show_help:
-            s = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), pygame.SRCALPHA)
-            s.fill((0,0,0,200))
-            help_lines = [
-                "Nasıl Oynanır:",
-                "Sol/Sağ: Hareket", "Yukarı: Döndür", "Aşağı: Hızlı düşür",
-                "Boşluk: Anında düşür", "ESC: Duraklat", "C: Hold", "F: Tam ekran",
-                "Fare: Menü butonları", "M: Sesi aç/kapat"
-            ]
-            for i, line in enumerate(help_lines):
-                surf = self.font.render(line, True, (255,255,255), None)
-                s.blit(surf, (settings.WINDOW_WIDTH//2 - surf.get_width()//2, 120 + i*36))
-            self.screen.blit(s, (0,0))
+            self.help_ui.draw(self.screen)
         # Quit confirmation
         if self.show_quit_confirm:
-            s = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), pygame.SRCALPHA)
-            s.fill((0,0,0,180))
-            qtext = self.font.render("Çıkmak istiyor musun?", True, (255,255,255), None)
-            self.screen.blit(s, (0,0))
-            self.screen.blit(qtext, (settings.WINDOW_WIDTH//2 - qtext.get_width()//2, 220))
-            self.quit_yes_rect = pygame.Rect(settings.WINDOW_WIDTH//2-80, 300, 70, 40)
-            self.quit_no_rect = pygame.Rect(settings.WINDOW_WIDTH//2+10, 300, 70, 40)
-            pygame.draw.rect(self.screen, (80,200,80), self.quit_yes_rect, border_radius=8)
-            pygame.draw.rect(self.screen, (200,80,80), self.quit_no_rect, border_radius=8)
-            yes = self.font.render("Evet", True, (255,255,255), None)
-            no = self.font.render("Hayır", True, (255,255,255), None)
-            self.screen.blit(yes, (self.quit_yes_rect.x+10, self.quit_yes_rect.y+5))
-            self.screen.blit(no, (self.quit_no_rect.x+10, self.quit_no_rect.y+5))
+            self.quit_ui.draw(self.screen)
         # Fade-in effect
         if self.fade_in:
             self.fade_alpha = max(0, self.fade_alpha-12)
-            fade = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), pygame.SRCALPHA)
-            fade.fill((0,0,0,self.fade_alpha))
+            size = (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT)
+            # One opaque surface; the per-surface alpha does the fading
+            fade = self.surfaces.get('fade', size, None, lambda: pygame.Surface(size))
+            fade.set_alpha(self.fade_alpha)
             self.screen.blit(fade, (0,0))
             if self.fade_alpha == 0:
                 self.fade_in = False
@@ -718,24 +943,31 @@ class TetrisGame:
 
     def toggle_mute(self):
         self.settings['mute'] = not self.settings['mute']
-        pygame.mixer.music.set_volume(0 if self.settings['mute'] else self.settings['music_volume'])
-        for s in self.sounds.values():
-            s.set_volume(0 if self.settings['mute'] else self.settings['effects_volume'])
+        self.audio.apply(self.settings)
 
     def draw_game(self):
         # Camera shake
         ox, oy = self.shake_offset
-        surf = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        self.draw_grid(target_surface=surf)
-        self.draw_hud(target_surface=surf)
-        self.draw_piece(self.current_piece, animated=True, target_surface=surf)
-        self.draw_ghost_piece(self.current_piece, target_surface=surf)
+        surf = self.game_layer()
+        # A scrolled board must not spill into the HUD strip
+        board_clip = self.camera.viewport if self.camera.scrollable else None
+        with self.profiler.phase('draw_grid'):
+            surf.set_clip(board_clip)
+            self.draw_grid(target_surface=surf)
+            surf.set_clip(None)
+        with self.profiler.phase('draw_hud'):
+            self.draw_hud(target_surface=surf)
+        with self.profiler.phase('draw_piece'):
+            surf.set_clip(board_clip)
+            self.draw_piece(self.current_piece, animated=True, target_surface=surf)
+            self.draw_ghost_piece(self.current_piece, target_surface=surf)
+            surf.set_clip(None)
         if self.hold_piece:
             self.draw_piece_preview(self.hold_piece, 60, 120, label="Hold", target_surface=surf)
         # Pause button
         pygame.draw.rect(surf, (80,80,200), self.pause_button_rect, border_radius=8)
         pygame.draw.rect(surf, (255,255,255), self.pause_button_rect, 2, border_radius=8)
-        pause_icon = self.font.render("II", True, (255,255,255))
+        pause_icon = self.surfaces.text(self.font, 'font', "II", (255,255,255))
         icon_rect = pause_icon.get_rect(center=self.pause_button_rect.center)
         surf.blit(pause_icon, icon_rect)
         # Mute button (top left)
@@ -744,42 +976,69 @@ class TetrisGame:
         self.draw_gold_shine(target_surface=surf)
         # Berserk mode darken effect
         if self.berserk_anim:
-            s = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), pygame.SRCALPHA)
-            s.fill((0,0,0,180))
-            for l in self.berserk_anim['lines']:
-                pygame.draw.rect(s, (0,0,0,0), (0, l*settings.BLOCK_SIZE+60, settings.WINDOW_WIDTH, settings.BLOCK_SIZE))
-            surf.blit(s, (0,0))
+            rows = [self.camera.to_screen(0, l)[1] for l in self.berserk_anim['lines']]
+            surf.blit(self.animations.berserk_overlay(self.surfaces, (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), rows), (0,0))
         # Draw touch buttons if mobile
         if self.is_mobile:
             self.draw_touch_buttons()
         self.screen.blit(surf, (ox, oy))
+        with self.profiler.phase('bloom'):
+            strength = self.bloom_strength()
+            if self.pipeline.threaded and self.bloom.available and strength > 0:
+                # Add the glow prepared from the previous frame, then hand this one over
+                glow = self.pipeline.front('bloom')
+                if glow is not None:
+                    self.screen.blit(glow, (ox, oy), special_flags=pygame.BLEND_RGB_ADD)
+                self.pipeline.submit('bloom', surf.get_size(), 0, self.paint_bloom, surf, strength)
+            else:
+                self.bloom.apply(surf, self.screen, (ox, oy), strength)
+
+    def game_layer(self):
+        # The threaded bloom reads last frame's layer on a worker, so two layers alternate
+        if self.pipeline.threaded:
+            self.game_layer_index ^= 1
+        size = self.screen.get_size()
+        surf = self.game_layers[self.game_layer_index]
+        if surf is None or surf.get_size() != size:
+            surf = self.game_layers[self.game_layer_index] = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            surf.fill((0, 0, 0, 0))
+        return surf
+
+    def bloom_strength(self):
+        return self.effects['glow_passes'] / 4
+
+    def object_glow_passes(self):
+        # The bloom pass replaces per-block glow when it can run
+        return 0 if self.bloom.available else self.effects['glow_passes']
 
     def draw_hud(self, target_surface=None):
         if target_surface is None:
             target_surface = self.screen
         # Animated gold score at center top with glow and shadow
         score_val = self.score_anim['value']
-        score_surf = self.score_font.render(f"{score_val}", True, (255, 215, 0), None)
+        text = self.surfaces.text
+        score_surf = text(self.score_font, 'score_font', f"{score_val}", (255, 215, 0))
         # Shadow
-        shadow = self.score_font.render(f"{score_val}", True, (0,0,0), None)
+        shadow = text(self.score_font, 'score_font', f"{score_val}", (0,0,0))
         target_surface.blit(shadow, (settings.WINDOW_WIDTH//2 - shadow.get_width()//2 + 3, 23))
-        # Glow
-        if self.glow_img:
-            glow = pygame.transform.smoothscale(self.glow_img, (score_surf.get_width()+40, score_surf.get_height()+40))
+        # Glow (left to the bloom pass when available)
+        if self.glow_img and not self.bloom.available:
+            glow = self.scaled_glow((score_surf.get_width()+40, score_surf.get_height()+40))
             target_surface.blit(glow, (settings.WINDOW_WIDTH//2 - glow.get_width()//2, 0), special_flags=pygame.BLEND_ADD)
         # Score
         target_surface.blit(score_surf, (settings.WINDOW_WIDTH//2 - score_surf.get_width()//2, 20))
         # Shine effect
         shine_x = int((math.sin(self.bg_anim_time*2) + 1) * score_surf.get_width()//2)
-        shine = pygame.Surface((30, score_surf.get_height()), pygame.SRCALPHA)
-        pygame.draw.ellipse(shine, (255,255,255,80), shine.get_rect())
+        shine = self.surfaces.get('shine', (30, score_surf.get_height()), None,
+                                  lambda: self.make_ellipse((30, score_surf.get_height()), (255,255,255,80)))
         target_surface.blit(shine, (settings.WINDOW_WIDTH//2 - score_surf.get_width()//2 + shine_x, 20))
         # Level and lines (with shadow)
         font = self.font
-        level = font.render(f"Seviye: {self.level}", True, (0,255,255), None)
-        lines = font.render(f"Satır: {self.lines_cleared}", True, (255,128,255), None)
-        shadow2 = font.render(f"Seviye: {self.level}", True, (0,0,0), None)
-        shadow3 = font.render(f"Satır: {self.lines_cleared}", True, (0,0,0), None)
+        level = text(font, 'font', f"Seviye: {self.level}", (0,255,255))
+        lines = text(font, 'font', f"Satır: {self.lines_cleared}", (255,128,255))
+        shadow2 = text(font, 'font', f"Seviye: {self.level}", (0,0,0))
+        shadow3 = text(font, 'font', f"Satır: {self.lines_cleared}", (0,0,0))
         target_surface.blit(shadow2, (23, 13))
         target_surface.blit(shadow3, (settings.WINDOW_WIDTH-157, 13))
         target_surface.blit(level, (20, 10))
@@ -789,85 +1048,71 @@ class TetrisGame:
         if self.hold_piece:
             self.draw_piece_preview(self.hold_piece, 60, 120, label="Hold", target_surface=target_surface)
         # FPS counter (good/best)
-        if self.settings.get('graphics','best') in ['good','best']:
+        if self.effects['style'] in ['good','best']:
             fps = int(self.clock.get_fps())
-            fps_surf = self.small_font.render(f"FPS: {fps}", True, (200,255,200), None)
+            fps_surf = text(self.small_font, 'small_font', f"FPS: {fps}", (200,255,200))
             target_surface.blit(fps_surf, (settings.WINDOW_WIDTH-80, settings.WINDOW_HEIGHT-30))
+        if self.replay_notice and time.time() - self.replay_notice[1] < 2.0:
+            note = text(self.small_font, 'small_font', self.replay_notice[0], (255,255,255))
+            target_surface.blit(note, (settings.WINDOW_WIDTH//2 - note.get_width()//2, settings.WINDOW_HEIGHT-60))
 
     def draw_piece(self, piece, animated=True, ghost=False, target_surface=None):
         if target_surface is None:
             target_surface = self.screen
-        graphics = self.settings.get('graphics', 'best')
+        fx = self.effects
+        graphics = fx['style']
+        glow_passes = self.object_glow_passes()
+        cam = self.camera
+        cell = cam.cell
+        radius = round(8 * cell / settings.BLOCK_SIZE)
         # Use animated position/rotation for current piece
         if animated and self.animated_piece and piece == self.current_piece:
             anim_x, anim_y, anim_rot, shape, color_index, wind_trail = self.animated_piece.get_draw_info()
             # Draw wind trail (only in 'good' and 'best')
-            if graphics in ['good', 'best']:
+            if fx['trail_length']:
                 for i, (tx, ty, alpha, cidx, trot) in enumerate(self.animated_piece.wind_trail):
                     for dy, row in enumerate(shape):
                         for dx, val in enumerate(row):
                             if val:
-                                rect = pygame.Rect(
-                                    int((tx+dx) * settings.BLOCK_SIZE),
-                                    int((ty+dy) * settings.BLOCK_SIZE + 60),
-                                    settings.BLOCK_SIZE,
-                                    settings.BLOCK_SIZE,
-                                )
+                                rect = cam.rect(tx+dx, ty+dy)
                                 color = settings.COLORS[cidx]
                                 tail_color = tuple(min(255, int(x*0.7)) for x in color)
-                                s = pygame.Surface((settings.BLOCK_SIZE, settings.BLOCK_SIZE), pygame.SRCALPHA)
-                                pygame.draw.rect(s, (*tail_color, int(60*(i/len(self.animated_piece.wind_trail)))), (0,0,settings.BLOCK_SIZE,settings.BLOCK_SIZE), border_radius=8)
-                                target_surface.blit(s, rect.topleft)
+                                alpha = int(60*(i/len(self.animated_piece.wind_trail)))
+                                target_surface.blit(self.block_sprite('trail', cell, (*tail_color, alpha), radius), rect.topleft)
             # Draw animated piece
             for dy, row in enumerate(shape):
                 for dx, val in enumerate(row):
                     if val:
-                        rect = pygame.Rect(
-                            int((anim_x+dx) * settings.BLOCK_SIZE),
-                            int((anim_y+dy) * settings.BLOCK_SIZE + 60),
-                            settings.BLOCK_SIZE,
-                            settings.BLOCK_SIZE,
-                        )
+                        rect = cam.rect(anim_x+dx, anim_y+dy)
                         color = settings.COLORS[color_index]
-                        # 3D/elemental effects for 'best' graphics
-                        if graphics == 'best':
+                        # 3D/elemental effects (high tiers)
+                        if fx['elemental']:
                             self.draw_elemental_effect(rect, color_index, target_surface)
-                        # Glowing shadow (only in 'good' and 'best')
-                        if graphics in ['good', 'best']:
-                            for r in range(8, 0, -2):
-                                s = pygame.Surface((settings.BLOCK_SIZE, settings.BLOCK_SIZE), pygame.SRCALPHA)
-                                pygame.draw.rect(s, (*color, 20), (0,0,settings.BLOCK_SIZE,settings.BLOCK_SIZE), border_radius=r)
-                                target_surface.blit(s, rect.topleft)
+                        # Glowing shadow (one pass per glow tier step)
+                        for r in range(8, 8 - 2*glow_passes, -2):
+                            target_surface.blit(self.block_sprite('block_glow', cell, (*color, 20), r), rect.topleft)
                         # Main block
-                        pygame.draw.rect(target_surface, color, rect, border_radius=8)
+                        pygame.draw.rect(target_surface, color, rect, border_radius=radius)
                         if graphics == 'best':
-                            pygame.draw.rect(target_surface, (255,255,255), rect, 2, border_radius=8)
+                            pygame.draw.rect(target_surface, (255,255,255), rect, 2, border_radius=radius)
             return
         # Fallback: static draw
         for x, y in piece.get_coords():
             if y >= 0:
-                rect = pygame.Rect(
-                    x * settings.BLOCK_SIZE,
-                    y * settings.BLOCK_SIZE + 60,
-                    settings.BLOCK_SIZE,
-                    settings.BLOCK_SIZE,
-                )
+                rect = cam.rect(x, y)
                 color = settings.COLORS[piece.color_index]
                 if ghost:
                     color = tuple(min(255, int(c*0.5)) for c in color)
-                # 3D/elemental effects for 'best' graphics
-                if graphics == 'best':
+                # 3D/elemental effects (high tiers)
+                if fx['elemental']:
                     self.draw_elemental_effect(rect, piece.color_index, target_surface)
-                # Glowing shadow (only in 'good' and 'best')
-                if graphics in ['good', 'best']:
-                    for r in range(8, 0, -2):
-                        s = pygame.Surface((settings.BLOCK_SIZE, settings.BLOCK_SIZE), pygame.SRCALPHA)
-                        pygame.draw.rect(s, (*color, 20), (0,0,settings.BLOCK_SIZE,settings.BLOCK_SIZE), border_radius=r)
-                        target_surface.blit(s, rect.topleft)
+                # Glowing shadow (one pass per glow tier step)
+                for r in range(8, 8 - 2*glow_passes, -2):
+                    target_surface.blit(self.block_sprite('block_glow', cell, (*color, 20), r), rect.topleft)
                 # Main block
-                pygame.draw.rect(target_surface, color, rect, border_radius=8)
+                pygame.draw.rect(target_surface, color, rect, border_radius=radius)
                 if graphics == 'best':
-                    pygame.draw.rect(target_surface, (255,255,255), rect, 2, border_radius=8)
+                    pygame.draw.rect(target_surface, (255,255,255), rect, 2, border_radius=radius)
 
     def draw_ghost_piece(self, piece, target_surface=None):
         if target_surface is None:
@@ -884,7 +1129,7 @@ class TetrisGame:
         block = settings.BLOCK_SIZE // 2
         offset_x = cx - (len(shape[0])*block)//2
         offset_y = cy - (len(shape)*block)//2
-        label_surf = self.small_font.render(label+":", True, (255,255,255))
+        label_surf = self.surfaces.text(self.small_font, 'small_font', label+":", (255,255,255))
         target_surface.blit(label_surf, (cx-40, cy-40))
         for dy, row in enumerate(shape):
             for dx, val in enumerate(row):
@@ -900,113 +1145,62 @@ class TetrisGame:
     def draw_grid(self, target_surface=None):
         if target_surface is None:
             target_surface = self.screen
-        graphics = self.settings.get('graphics', 'best')
-        anim_lines = set(self.line_clear_anim[0]) if self.line_clear_anim else set()
-        for y, row in enumerate(self.grid):
-            for x, color_index in enumerate(row):
-                rect = pygame.Rect(
-                    x * settings.BLOCK_SIZE,
-                    y * settings.BLOCK_SIZE + 60,
-                    settings.BLOCK_SIZE,
-                    settings.BLOCK_SIZE,
-                )
-                color = settings.COLORS[color_index] if color_index is not None else (50, 50, 50)
-                if color_index is not None:
-                    if y in anim_lines:
+        cam = self.camera
+        anim_lines = self.line_clear_anim[0] if self.line_clear_anim else ()
+        now = self.anim_clock.ticks
+        # Settled blocks come from the chunk cache; clearing rows are left out of it
+        self.board_cache.draw(target_surface, self, cam, self.effects['style'], anim_lines)
+        if anim_lines:
+            rows = cam.visible_rows()
+            for y in anim_lines:
+                if y not in rows:
+                    continue
+                row = self.grid[y]
+                for x in cam.visible_cols():
+                    if row[x] is not None:
                         # Smooth shrink/flash
-                        t = (time.time() % 1)
-                        scale = 1.0 - 0.5 * abs(math.sin(t*math.pi*2))
-                        s = pygame.Surface((settings.BLOCK_SIZE, settings.BLOCK_SIZE), pygame.SRCALPHA)
-                        pygame.draw.rect(s, (*color, 180), (0,0,settings.BLOCK_SIZE,settings.BLOCK_SIZE), border_radius=8)
-                        s = pygame.transform.smoothscale(s, (int(settings.BLOCK_SIZE*scale), int(settings.BLOCK_SIZE*scale)))
-                        target_surface.blit(s, (rect.x + (settings.BLOCK_SIZE-s.get_width())//2, rect.y + (settings.BLOCK_SIZE-s.get_height())//2))
-                    else:
-                        # Soft shadow
-                        shadow_rect = rect.move(3,3)
-                        pygame.draw.rect(target_surface, (0,0,0,80), shadow_rect, border_radius=6)
-                        pygame.draw.rect(target_surface, color, rect, border_radius=6)
-                        pygame.draw.rect(target_surface, (255,255,255), rect, 1, border_radius=6)
-                else:
-                    pygame.draw.rect(target_surface, (50, 50, 50), rect, 1)
-                # Draw grid lines (less visible/cooler)
-                if graphics == 'best':
-                    pygame.draw.rect(target_surface, (255,255,255,30), rect, 1, border_radius=8)
-                elif graphics == 'good':
-                    pygame.draw.rect(target_surface, (100,100,100,40), rect, 1, border_radius=8)
-                else:
-                    pygame.draw.rect(target_surface, (80,80,80,20), rect, 1, border_radius=8)
+                        rect = cam.rect(x, y)
+                        self.animations.line_clear[row[x]].blit(target_surface, now - self.line_clear_anim[1], rect.x, rect.y)
+        # Lock flash over the cells the last piece settled into
+        if self.lock_anim:
+            piece, start = self.lock_anim
+            flash = self.animations.lock[piece.color_index]
+            for x, y in piece.get_coords():
+                flash.blit(target_surface, now - start, *cam.to_screen(x, y))
         # Draw explosion particles
         for exp in self.explosions:
-            x = exp['x']
-            y = exp['y']
-            t = exp['t']
-            color = exp['color']
-            px = x * settings.BLOCK_SIZE + settings.BLOCK_SIZE//2 + int(8*math.sin(t))
-            py = y * settings.BLOCK_SIZE + 60 + settings.BLOCK_SIZE//2 + int(8*math.cos(t))
-            r = max(2, 8-t//2)
-            alpha = max(0, 255-12*t)
-            s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*color, alpha), (r, r), r)
-            target_surface.blit(s, (px-r, py-r))
+            self.animations.explosion[exp['color']].blit(
+                target_surface, exp['t'], *cam.to_screen(exp['x'], exp['y']))
         # Draw sparkle/coin particles
-        for p in self.particles:
-            p.draw(target_surface)
+        with self.profiler.phase('particles'):
+            layer = self.pipeline.front('particles') if self.pipeline.threaded else None
+            if layer is not None:
+                target_surface.blit(layer, (0,0))
+            else:
+                for p in self.particles:
+                    p.draw(target_surface)
 
     def draw_paused(self):
-        s = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), pygame.SRCALPHA)
-        s.fill((0,0,0,180))
-        self.screen.blit(s, (0,0))
-        label = self.font.render("Duraklatıldı", True, (255,255,255))
-        self.screen.blit(label, (settings.WINDOW_WIDTH//2 - label.get_width()//2, 120))
-        for btn in self.paused_buttons:
-            btn.draw(self.screen)
+        self.paused_ui.draw(self.screen)
 
     def draw_gameover(self):
-        if not hasattr(self, '_score_saved'):
-            self.save_high_score(self.score)
-            self.play_sound("gameover")
-            self._score_saved = True
-        s = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), pygame.SRCALPHA)
-        s.fill((0,0,0,200))
-        self.screen.blit(s, (0,0))
-        label = self.font.render("Oyun Bitti!", True, (255,80,80))
-        self.screen.blit(label, (settings.WINDOW_WIDTH//2 - label.get_width()//2, 120))
-        score_label = self.font.render(f"Skor: {self.score}", True, (255,255,0))
-        self.screen.blit(score_label, (settings.WINDOW_WIDTH//2 - score_label.get_width()//2, 180))
-        # High scores
-        hs_label = self.small_font.render("En Yüksek Skorlar:", True, (255,255,255))
-        self.screen.blit(hs_label, (settings.WINDOW_WIDTH//2 - hs_label.get_width()//2, 230))
-        for i, s in enumerate(self.high_scores):
-            sc = self.small_font.render(f"{i+1}. {s}", True, (255,255,0) if s==self.score else (200,200,200))
-            self.screen.blit(sc, (settings.WINDOW_WIDTH//2 - sc.get_width()//2, 260 + i*24))
-        for btn in self.gameover_buttons:
-            btn.draw(self.screen)
-
-    def load_sounds(self):
-        sounds = {}
-        for name, path in [
-            ("move", settings.SOUND_MOVE),
-            ("rotate", settings.SOUND_ROTATE),
-            ("drop", settings.SOUND_DROP),
-            ("line", settings.SOUND_LINE),
-            ("levelup", settings.SOUND_LEVELUP),
-            ("gameover", settings.SOUND_GAMEOVER),
-            ("click", settings.SOUND_CLICK),
-        ]:
-            if os.path.exists(path):
-                sounds[name] = pygame.mixer.Sound(path)
-        return sounds
+        labels = self.gameover_ui.widgets
+        labels[2].set_text(f"Skor: {self.score}")
+        # High scores; unused rows stay empty
+        for i, label in enumerate(labels[4:9]):
+            if i < len(self.high_scores):
+                s = self.high_scores[i]
+                label.set_text(f"{i+1}. {s}", (255,255,0) if s==self.score else (200,200,200))
+            else:
+                label.set_text("")
+        self.gameover_ui.draw(self.screen)
 
     def play_sound(self, name):
-        if name in self.sounds:
-            self.sounds[name].play()
+        self.audio.play(name)
 
     def play_music(self):
-        if not self.music_loaded and os.path.exists(settings.MUSIC_BG):
-            pygame.mixer.music.load(settings.MUSIC_BG)
-            pygame.mixer.music.set_volume(0.3)
-            pygame.mixer.music.play(-1)
-            self.music_loaded = True
+        if not self.music_loaded:
+            self.music_loaded = self.audio.play_music(settings.MUSIC_BG)
 
     def load_high_scores(self):
         if not os.path.exists(settings.HIGH_SCORE_FILE):
@@ -1022,24 +1216,11 @@ class TetrisGame:
                 f.write(f"{s}\n")
         self.high_scores = scores
 
-    def get_full_lines(self):
-        return [i for i, row in enumerate(self.grid) if all(cell is not None for cell in row)]
-
-    def hold_current_piece(self):
-        if self.hold_used:
-            return
-        if self.hold_piece is None:
-            self.hold_piece = FallingPiece(self.current_piece.piece, 3, 0)
-            self.spawn_new_piece()
-        else:
-            self.current_piece, self.hold_piece = self.hold_piece, FallingPiece(self.current_piece.piece, 3, 0)
-            self.current_piece.x = 3
-            self.current_piece.y = 0
-        self.hold_used = True
-
     def load_bg_image(self):
         if os.path.exists(settings.BACKGROUND_IMAGE):
-            return pygame.image.load(settings.BACKGROUND_IMAGE).convert()
+            # Scaled once to the logical size; window scaling happens at present time
+            img = pygame.image.load(settings.BACKGROUND_IMAGE).convert()
+            return pygame.transform.smoothscale(img, self.screen.get_size())
         return None
     def load_leaf_image(self):
         if os.path.exists(settings.LEAF_IMAGE):
@@ -1070,22 +1251,20 @@ class TetrisGame:
                 leaf['y'] = random.randint(-60, 0)
                 leaf['x'] = random.randint(0, settings.WINDOW_WIDTH)
 
+    def zoom_board(self, steps):
+        if not steps or not self.camera.zoom(steps):
+            return
+        self.camera.follow(self.current_piece)
+        cell = self.camera.cell
+        if cell not in self.animation_banks:
+            self.animation_banks[cell] = AnimationBank(cell, settings.COLORS, self.anim_clock, self.anim_duration)
+        self.animations = self.animation_banks[cell]
+
     def toggle_fullscreen(self):
-        self.fullscreen = not self.fullscreen
-        if self.fullscreen:
-            info = pygame.display.Info()
-            w, h = info.current_w, info.current_h
-            # Maintain aspect ratio
-            aspect = settings.ASPECT_RATIO
-            if w/h > aspect:
-                h = h
-                w = int(h * aspect)
-            else:
-                w = w
-                h = int(w / aspect)
-            self.screen = pygame.display.set_mode((w, h), pygame.FULLSCREEN)
-        else:
-            self.screen = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
+        self.screen = self.presenter.toggle_fullscreen()
+        # The display format and window scale may both have changed
+        self.surfaces.invalidate(self.presenter.scale)
+        self.game_layers = [None, None]
 
     def update_score_anim(self):
         now = time.time()
@@ -1097,16 +1276,18 @@ class TetrisGame:
         elif self.score_anim['value'] > self.score_anim['target']:
             self.score_anim['value'] = self.score_anim['target']
 
-    def draw_animated_background(self):
+    def draw_animated_background(self, target_surface=None, t=None):
+        if target_surface is None:
+            target_surface = self.screen
         # Vibrant animated gradient background
-        t = self.bg_anim_time
+        t = self.bg_anim_time if t is None else t
         for y in range(settings.WINDOW_HEIGHT):
             color = (
                 int(60 + 60 * (1 + math.sin(t + y/60)) / 2),
                 int(60 + 120 * (1 + math.sin(t + y/80 + 2)) / 2),
                 int(120 + 80 * (1 + math.sin(t + y/100 + 4)) / 2)
             )
-            pygame.draw.line(self.screen, color, (0, y), (settings.WINDOW_WIDTH, y))
+            pygame.draw.line(target_surface, color, (0, y), (settings.WINDOW_WIDTH, y))
         # Optional: add floating shapes or sparkles
         for i in range(10):
             x = int((settings.WINDOW_WIDTH/10) * i + 30 * math.sin(t + i))
@@ -1117,7 +1298,7 @@ class TetrisGame:
                 int(180 + 60 * math.sin(t + i*2)),
                 int(180 + 60 * math.sin(t + i*3))
             )
-            pygame.draw.circle(self.screen, c, (x, y), r, 0)
+            pygame.draw.circle(target_surface, c, (x, y), r, 0)
 
     def load_img(self, name):
         path = os.path.join(settings.RESOURCE_DIR, name)
@@ -1132,71 +1313,82 @@ class TetrisGame:
             for i in range(3):
                 x = random.randint(settings.WINDOW_WIDTH//2-60, settings.WINDOW_WIDTH//2+60)
                 y = random.randint(10, 60)
-                s = pygame.Surface((24,24), pygame.SRCALPHA)
-                pygame.draw.ellipse(s, (255,255,180,180), (0,0,24,12))
-                target_surface.blit(s, (x, y), special_flags=pygame.BLEND_ADD)
+                target_surface.blit(self.spark_img, (x, y), special_flags=pygame.BLEND_ADD)
 
     def draw_elemental_effect(self, rect, color_index, target_surface=None):
         if target_surface is None:
             target_surface = self.screen
+        s = self.surfaces.get('elemental', rect.size, color_index,
+                              lambda: self.make_elemental(rect.size, color_index))
+        target_surface.blit(s, rect.topleft, special_flags=pygame.BLEND_ADD)
+
+    def make_elemental(self, size, color_index):
         # 0: Fire, 1: Water, 2: Earth, 3: Air
-        s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+        width, height = size
+        s = pygame.Surface(size, pygame.SRCALPHA)
         if color_index == 0:  # Fire
             for i in range(6):
-                pygame.draw.ellipse(s, (255, 120+i*20, 0, 60), (rect.width//2-8, rect.height//2-8-i*2, 16, 8))
-            pygame.draw.ellipse(s, (255,255,0,80), (rect.width//2-8, rect.height//2-12, 16, 8))
+                pygame.draw.ellipse(s, (255, 120+i*20, 0, 60), (width//2-8, height//2-8-i*2, 16, 8))
+            pygame.draw.ellipse(s, (255,255,0,80), (width//2-8, height//2-12, 16, 8))
         elif color_index == 1:  # Water
             for i in range(6):
-                pygame.draw.arc(s, (0, 120+20*i, 255, 60), (2, 2+i*2, rect.width-4, rect.height-4-i*2), 0, 3.14, 2)
-            pygame.draw.ellipse(s, (0,255,255,80), (rect.width//2-8, rect.height//2+4, 16, 8))
+                pygame.draw.arc(s, (0, 120+20*i, 255, 60), (2, 2+i*2, width-4, height-4-i*2), 0, 3.14, 2)
+            pygame.draw.ellipse(s, (0,255,255,80), (width//2-8, height//2+4, 16, 8))
         elif color_index == 2:  # Earth
             for i in range(6):
-                pygame.draw.rect(s, (139, 69+i*10, 19, 40), (4, rect.height-8-i*2, rect.width-8, 4))
-            pygame.draw.ellipse(s, (80, 40, 0, 80), (rect.width//2-8, rect.height-8, 16, 8))
+                pygame.draw.rect(s, (139, 69+i*10, 19, 40), (4, height-8-i*2, width-8, 4))
+            pygame.draw.ellipse(s, (80, 40, 0, 80), (width//2-8, height-8, 16, 8))
         elif color_index == 3:  # Air
             for i in range(6):
-                pygame.draw.arc(s, (200,200,255, 40), (2, 2+i*2, rect.width-4, rect.height-4-i*2), 3.14, 6.28, 2)
-            pygame.draw.ellipse(s, (255,255,255,40), (rect.width//2-8, rect.height//2-8, 16, 8))
-        target_surface.blit(s, rect.topleft, special_flags=pygame.BLEND_ADD)
+                pygame.draw.arc(s, (200,200,255, 40), (2, 2+i*2, width-4, height-4-i*2), 3.14, 6.28, 2)
+            pygame.draw.ellipse(s, (255,255,255,40), (width//2-8, height//2-8, 16, 8))
+        return s
+
+    # -- cached surfaces (see tetris.surfaces) ---------------------------
+    def block_sprite(self, asset, cell, rgba, radius):
+        """Yarı saydam, köşeleri yuvarlatılmış tek hücrelik kare."""
+        def make():
+            s = pygame.Surface((cell, cell), pygame.SRCALPHA)
+            pygame.draw.rect(s, rgba, (0,0,cell,cell), border_radius=radius)
+            return s
+        return self.surfaces.get(asset, cell, (rgba, radius), make)
+
+    def scaled_glow(self, size):
+        return self.surfaces.get('glow', size, None, lambda: pygame.transform.smoothscale(self.glow_img, size))
+
+    @staticmethod
+    def make_fill(size, rgba):
+        s = pygame.Surface(size, pygame.SRCALPHA)
+        s.fill(rgba)
+        return s
+
+    @staticmethod
+    def make_ellipse(size, rgba):
+        s = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.ellipse(s, rgba, s.get_rect())
+        return s
 
     def detect_mobile(self):
         # Simple heuristic: if running on Android or Kivy, or via environment
         import platform
         return 'ANDROID_ARGUMENT' in os.environ or platform.system() == 'Android'
 
-    def create_touch_buttons(self):
+    def create_touch_ui(self):
         # Bottom HUD: rotate, drop, hold
         w, h = 64, 64
         y = settings.WINDOW_HEIGHT - h - 10
         gap = 20
         cx = settings.WINDOW_WIDTH // 2
-        buttons = [
-            {'rect': pygame.Rect(cx-w-gap, y, w, h), 'action': 'rotate'},
-            {'rect': pygame.Rect(cx, y, w, h), 'action': 'drop'},
-            {'rect': pygame.Rect(cx+w+gap, y, w, h), 'action': 'hold'},
-        ]
+        blue, green = (80, 80, 200), (80, 200, 80)
         # Left/right move buttons
         my = settings.WINDOW_HEIGHT//2
-        buttons.append({'rect': pygame.Rect(10, my-40, 48, 80), 'action': 'left'})
-        buttons.append({'rect': pygame.Rect(settings.WINDOW_WIDTH-58, my-40, 48, 80), 'action': 'right'})
-        return buttons
+        return WidgetLayer([
+            Button('rotate', (cx-w-gap, y, w, h), '⟳', self.font, blue, radius=16, border=(255,255,255)),
+            Button('drop', (cx, y, w, h), '↓', self.font, blue, radius=16, border=(255,255,255)),
+            Button('hold', (cx+w+gap, y, w, h), '⧗', self.font, blue, radius=16, border=(255,255,255)),
+            Button('left', (10, my-40, 48, 80), '←', self.font, green, radius=16, border=(255,255,255)),
+            Button('right', (settings.WINDOW_WIDTH-58, my-40, 48, 80), '→', self.font, green, radius=16, border=(255,255,255)),
+        ])
 
     def draw_touch_buttons(self):
-        for btn in self.touch_buttons:
-            color = (80, 80, 200) if btn['action'] in ['rotate', 'drop', 'hold'] else (80, 200, 80)
-            pygame.draw.rect(self.screen, color, btn['rect'], border_radius=16)
-            pygame.draw.rect(self.screen, (255,255,255), btn['rect'], 2, border_radius=16)
-            icon = ''
-            if btn['action'] == 'rotate':
-                icon = '⟳'
-            elif btn['action'] == 'drop':
-                icon = '↓'
-            elif btn['action'] == 'hold':
-                icon = '⧗'
-            elif btn['action'] == 'left':
-                icon = '←'
-            elif btn['action'] == 'right':
-                icon = '→'
-            surf = self.font.render(icon, True, (255,255,255))
-            rect = surf.get_rect(center=btn['rect'].center)
-            self.screen.blit(surf, rect)
+        self.touch_ui.draw(self.screen)
@@ -0,0 +1,74 @@
+"""Uyarlanabilir grafik kalitesi.
+
+"auto" grafik modunda son karelerin çalışma süresini izler ve efekt
+seviyesini histerezisle bir basamak düşürür ya da yükseltir.
+"""
+
+import logging
+from collections import deque
+
+from . import settings
+
+logger = logging.getLogger(__name__)
+
+
+def fixed_tier(mode):
+    """'low'/'good'/'best' modunun karşılık geldiği efekt seviyesini döndürür."""
+    for i, tier in enumerate(settings.GRAPHICS_TIERS):
+        if tier['name'] == mode:
+            return i
+    return len(settings.GRAPHICS_TIERS) - 1
+
+
+class GraphicsGovernor:
+    def __init__(self, budget_ms=1000 / settings.FPS, tier=None):
+        cfg = settings.AUTO_GRAPHICS
+        self.budget_ms = budget_ms
+        self.window = cfg['window']
+        self.down_ratio = cfg['down_ratio']
+        self.up_ratio = cfg['up_ratio']
+        self.up_windows = cfg['up_windows']
+        self.cooldown = cfg['cooldown']
+        self.tier = len(settings.GRAPHICS_TIERS) - 1 if tier is None else tier
+        self.samples = deque(maxlen=self.window)
+        self.calm_windows = 0
+        self.frames_since_switch = 0
+        self.switches = []  # (frame, old tier, new tier, mean ms)
+        self.frame = 0
+
+    @property
+    def effects(self):
+        return settings.GRAPHICS_TIERS[self.tier]
+
+    def tick(self, frame_ms):
+        """Bir karenin çalışma süresini kaydeder; seviye değiştiyse True döner."""
+        self.frame += 1
+        self.frames_since_switch += 1
+        self.samples.append(frame_ms)
+        if len(self.samples) < self.window or self.frames_since_switch < self.cooldown:
+            return False
+        if self.frame % self.window:
+            return False
+        mean = sum(self.samples) / len(self.samples)
+        if mean > self.budget_ms * self.down_ratio and self.tier > 0:
+            self.calm_windows = 0
+            return self._switch(self.tier - 1, mean)
+        if mean < self.budget_ms * self.up_ratio and self.tier < len(settings.GRAPHICS_TIERS) - 1:
+            self.calm_windows += 1
+            if self.calm_windows >= self.up_windows:
+                self.calm_windows = 0
+                return self._switch(self.tier + 1, mean)
+        else:
+            self.calm_windows = 0
+        return False
+
+    def _switch(self, tier, mean):
+        old = self.tier
+        self.tier = tier
+        self.frames_since_switch = 0
+        self.samples.clear()
+        self.switches.append((self.frame, old, tier, mean))
+        logger.info("graphics tier %s -> %s at frame %d (mean work %.2f ms, budget %.2f ms)",
+                    settings.GRAPHICS_TIERS[old]['name'], settings.GRAPHICS_TIERS[tier]['name'],
+                    self.frame, mean, self.budget_ms)
+        return True
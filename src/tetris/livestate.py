@@ -0,0 +1,304 @@
+"""Canlı oyun durumunun paylaşılan bellekte yayını.
+
+Yayın yazılımları ve test düzenekleri ekranı okumak yerine tahtayı
+doğrudan bu segmentten okur. Oyun yalnızca durum değiştiğinde (hareket,
+döndürme, kilitleme, satır silme, doğma, hold, durum geçişi) ve en fazla kare
+başına bir kez yazar. Okuyucular kilit almaz ve oyuna hiçbir şey göndermez;
+okuyucu sayısı oyunun maliyetini değiştirmez.
+
+Segment düzeni (little-endian, sürüm 2):
+
+    0   4s   magic b"TLIV"
+    4   u8   düzen sürümü (2)
+    5   u8   ayrılmış
+    6   u16  sütun sayısı
+    8   u16  satır sayısı
+    10  u16  ayrılmış
+    12  u32  seqlock sayacı: yazarken tek, tutarlıyken çift
+    16  u32  skor
+    20  u16  seviye
+    22  u16  silinen satır
+    24  u8   durum: 0 menu, 1 playing, 2 paused, 3 gameover
+    25  u8   hold kullanıldı mı
+    26  u16  ayrılmış
+    28  6B   aktif parça: tür, dönüş, i16 x, i16 y (tür 0xFF = yok)
+    34  6B   sonraki parça
+    40  6B   hold parçası
+    46  u32  grid sürümü (yerleşmiş bloklar her değiştiğinde artar)
+    50  ...  grid: hücre başına 4 bit, satır satır; 0 boş, n renk n-1
+
+Tutarlı okuma: sayacı oku; tekse tekrar dene; baytları kopyala; sayacı
+yeniden oku; iki değer aynıysa kopya tutarlıdır.
+
+Kullanım:
+    TETRIS_SHM=tetris_state python -m main
+    python -m tetris.livestate watch tetris_state
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import struct
+import time
+from multiprocessing import shared_memory
+
+from . import settings
+from .events import Event
+from .snapshot import STATES, _pack_piece, pack_grid, unpack_grid
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TLIV"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sBxHHxx")
+_SEQ = struct.Struct("<I")
+_BODY = struct.Struct("<IHHBBxx6s6s6sI")
+_PIECE = struct.Struct("<BBhh")
+MAX_SIDE = 0xFFFF
+SEQ_OFFSET = _HEADER.size
+BODY_OFFSET = SEQ_OFFSET + _SEQ.size
+GRID_OFFSET = BODY_OFFSET + _BODY.size
+
+
+# Segments created by writers in this process
+_written = set()
+
+
+def segment_size(cols, rows):
+    return GRID_OFFSET + (cols * rows + 1) // 2
+
+
+class LiveStateWriter:
+    def __init__(self, name, cols, rows):
+        if cols > MAX_SIDE or rows > MAX_SIDE:
+            raise ValueError(f"{cols}x{rows} board does not fit the live state layout")
+        size = segment_size(cols, rows)
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left behind by a crashed session
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self.name = name
+        _written.add(name)
+        self.buf = self.shm.buf
+        self.buf[:_HEADER.size] = _HEADER.pack(MAGIC, VERSION, cols, rows)
+        self.seq = 0
+        self.dirty = True
+        self.grid_version = None
+        self.last_state = None
+        self.publishes = 0
+
+    def subscribe(self, events):
+        """Tahtanın her olayında segmenti kirli işaretler."""
+        events.subscribe(Event, self.changed)
+
+    def changed(self, event=None):
+        self.dirty = True
+
+    def publish(self, game):
+        """Değişiklik varsa segmenti günceller; yoksa hemen döner."""
+        if not self.dirty and game.state == self.last_state:
+            return False
+        buf = self.buf
+        self.seq += 1
+        _SEQ.pack_into(buf, SEQ_OFFSET, self.seq)   # odd: write in progress
+        state = STATES.index(game.state) if game.state in STATES else 0
+        _BODY.pack_into(buf, BODY_OFFSET, game.score, game.level, game.lines_cleared, state,
+                        game.hold_used, _pack_piece(game.current_piece), _pack_piece(game.next_piece),
+                        _pack_piece(game.hold_piece), game.grid_version)
+        if game.grid_version != self.grid_version:
+            # Moves and rotations leave the settled blocks alone; skip the repack
+            grid = pack_grid(game.grid)
+            buf[GRID_OFFSET:GRID_OFFSET + len(grid)] = grid
+            self.grid_version = game.grid_version
+        self.seq += 1
+        _SEQ.pack_into(buf, SEQ_OFFSET, self.seq)   # even: consistent
+        self.dirty = False
+        self.last_state = game.state
+        self.publishes += 1
+        return True
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+        self.shm.unlink()
+        _written.discard(self.name)
+
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        shm = shared_memory.SharedMemory(name=name)
+        if multiprocessing.parent_process() is None and name not in _written:
+            # Attaching registers the segment with this process's resource
+            # tracker, which would unlink the game's segment on exit. Child
+            # processes share their parent's tracker and must leave it be.
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class LiveStateReader:
+    """Segmentten kilitsiz, tutarlı anlık görüntüler okur."""
+
+    def __init__(self, name):
+        self.shm = _attach(name)
+        magic, version, self.cols, self.rows = _HEADER.unpack_from(self.shm.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self.shm.close()
+            raise ValueError(f"{name} is not a version {VERSION} live state segment")
+        self.size = segment_size(self.cols, self.rows)
+        self.retries = 0
+
+    def seq(self):
+        return _SEQ.unpack_from(self.shm.buf, SEQ_OFFSET)[0]
+
+    def read_raw(self):
+        """(sayaç, baytlar) döndürür; yazım ortasına denk gelirse yeniden dener."""
+        buf = self.shm.buf
+        while True:
+            before = _SEQ.unpack_from(buf, SEQ_OFFSET)[0]
+            if not before & 1:
+                data = bytes(buf[:self.size])
+                if _SEQ.unpack_from(buf, SEQ_OFFSET)[0] == before:
+                    return before, data
+            self.retries += 1
+            time.sleep(0)  # let a preempted writer finish
+
+    def read(self):
+        seq, data = self.read_raw()
+        (score, level, lines, state, hold_used, active, upcoming, hold,
+         grid_version) = _BODY.unpack_from(data, BODY_OFFSET)
+        return {
+            'seq': seq,
+            'score': score,
+            'level': level,
+            'lines_cleared': lines,
+            'state': STATES[state] if state < len(STATES) else "menu",
+            'hold_used': bool(hold_used),
+            'current_piece': _PIECE.unpack(active),
+            'next_piece': _PIECE.unpack(upcoming),
+            'hold_piece': _PIECE.unpack(hold),
+            'grid_version': grid_version,
+            'grid': unpack_grid(data[GRID_OFFSET:], self.cols, self.rows),
+        }
+
+    def wait(self, seq, timeout=1.0, poll=0.002):
+        """Sayaç `seq`'ten farklı olana dek bekler; yeni anlık görüntüyü döndürür."""
+        deadline = time.monotonic() + timeout
+        while self.seq() == seq:
+            if time.monotonic() > deadline:
+                return None
+            time.sleep(poll)
+        return self.read()
+
+    def close(self):
+        self.shm.close()
+
+
+def start(game):
+    """Ayar açıksa oyunun yazıcısını kurar."""
+    if not settings.LIVE_STATE_NAME:
+        return None
+    try:
+        return LiveStateWriter(settings.LIVE_STATE_NAME, len(game.grid[0]), len(game.grid))
+    except (OSError, ValueError) as exc:
+        logger.warning("live state export disabled: %s", exc)
+        return None
+
+
+def _render(snap):
+    lines = [f"seq {snap['seq']} {snap['state']} score {snap['score']} "
+             f"level {snap['level']} lines {snap['lines_cleared']}"]
+    grid = [["#" if cell is not None else "." for cell in row] for row in snap['grid']]
+    index, rotation, x, y = snap['current_piece']
+    if index != 0xFF:
+        from .spectate import _make_piece
+        for px, py in _make_piece(index, rotation, x, y).get_coords():
+            if 0 <= py < len(grid) and 0 <= px < len(grid[0]):
+                grid[py][px] = "@"
+    lines += ["".join(row) for row in grid]
+    return "\n".join(lines)
+
+
+def _bench_reader(name, seconds, conn):
+    reader = LiveStateReader(name)
+    conn.send(None)
+    reads = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        reader.read()
+        reads += 1
+    conn.send((reads / (time.perf_counter() - start), reader.retries))
+    reader.close()
+
+
+def _bench(seconds=2.0):
+    """Yazıcının yayın maliyetini, okuyucu ayrı bir süreçte okurken ölçer."""
+    from .rules import Board
+    board = Board(seed=1)
+    writer = LiveStateWriter(f"tetris_bench_{os.getpid()}", board.cols, board.rows)
+    writer.publish(board)
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe()
+    proc = ctx.Process(target=_bench_reader, args=(writer.name, seconds, child))
+    try:
+        proc.start()
+        parent.recv()  # reader attached
+        n, spent = 0, 0.0
+        while proc.is_alive() and not parent.poll():
+            if not board.try_move(1 if n % 20 < 10 else -1, 0):
+                board.hard_drop()
+                if board.state == "gameover":
+                    board.reset_board()
+            writer.dirty = True
+            start = time.perf_counter()
+            writer.publish(board)
+            spent += time.perf_counter() - start
+            n += 1
+        publish_us = spent / max(1, n) * 1e6
+        idle = time.perf_counter()
+        for _ in range(10000):
+            writer.publish(board)
+        idle_us = (time.perf_counter() - idle) / 10000 * 1e6
+        read_rate, retries = parent.recv()
+        proc.join()
+    finally:
+        writer.close()
+    return publish_us, idle_us, read_rate, retries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.livestate")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_watch = sub.add_parser("watch", help="print the board whenever it changes")
+    p_watch.add_argument("name")
+    sub.add_parser("bench")
+    args = parser.parse_args(argv)
+    if args.cmd == "bench":
+        publish_us, idle_us, read_rate, retries = _bench()
+        print(f"publish {publish_us:.1f} us per change, {idle_us:.2f} us when unchanged; "
+              f"reader process {read_rate:.0f} snapshots/s, {retries} retries")
+        return
+    reader = LiveStateReader(args.name)
+    seq = None
+    try:
+        while True:
+            snap = reader.wait(seq, timeout=60)
+            if snap:
+                seq = snap['seq']
+                print(_render(snap), end="\n\n", flush=True)
+    except (KeyboardInterrupt, FileNotFoundError):
+        pass
+    finally:
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""Perft: kurallara göre ulaşılabilir yerleşimlerin sayımı.
+
+Satrançtaki perft gibi, verilen bir tahtadan ve parça dizisinden `d`
+parça sonra ulaşılabilen farklı durumların sayısını bulur. Hamleler
+oyunun kendi kurallarıyla üretilir: sola/sağa/aşağı kaydırma
+`Board.try_move`, duvar tekmeli döndürme `Board.try_rotate`, hold
+`Board.hold_current_piece`; kilitleme, satır silme ve yeni parça da
+`lock_piece`, `clear_lines` ve `spawn_new_piece` ile yapılır. Parça aşağı
+inemediği her konum bir yerleşimdir; aşağı kaydırma ile varılan ve yana
+kaydırma ya da döndürme ile girilen oyuklar da sayılır. Aynı hücrelere
+düşen yerleşimler (simetrik dönüşler) ve hold ile aynı sonuca varan dallar
+bir kez sayılır: bir düğümün çocukları, sonuçtaki anlık görüntülerin
+kümesidir. Berserk zamanlı bir efekt olduğu için sayıma katılmaz.
+
+Parça dizisi "IOTS" harflerinden oluşur ve bitince başa döner. Daha hızlı
+bir hamle üreteci `KNOWN` tablosundaki sayılarla doğrulanabilir.
+
+Kullanım:
+    python -m tetris.perft run --position empty --depth 3
+    python -m tetris.perft run --sequence TSIO --board 10x18 --depth 3 --divide
+    python -m tetris.perft run --position tuck --depth 4 --processes 4
+    python -m tetris.perft check
+"""
+
+import argparse
+import multiprocessing
+import time
+
+from . import snapshot
+from .pieces import PIECES
+from .rules import Board, GARBAGE_COLOR
+
+# Letters in PIECES order
+PIECE_NAMES = "IOTS"
+
+# name -> (cols, rows, sequence, bottom rows of the board ('#' filled),
+#          perft counts for depth 1, 2, ...)
+KNOWN = {
+    'empty': (10, 18, "TSIO", (), (51, 2072, 61147)),
+    'narrow': (4, 8, "IOTS", (
+        "##.#",
+        "#..#",
+    ), (8, 104, 667, 2739, 7697)),
+    'tuck': (6, 8, "TSOI", (
+        "##....",
+        "#...##",
+        "#.####",
+    ), (27, 471, 5341)),
+}
+
+
+class SequenceRng:
+    """`PieceRng` yerine verilen diziyi sırayla döndürür.
+
+    `state` dizideki konumdur; anlık görüntülere üretecin durumu olarak
+    yazılır ve aynen geri yüklenir.
+    """
+
+    def __init__(self, sequence, state=0):
+        self.indices = [PIECE_NAMES.index(c) for c in sequence.upper()]
+        self.state = state
+
+    def choice(self, seq):
+        piece = seq[self.indices[self.state]]
+        self.state = (self.state + 1) % len(self.indices)
+        return piece
+
+
+def make_board(sequence, cols=10, rows=18, filled=()):
+    """Dizinin ilk iki parçası aktif ve sonraki olan, alt satırları `filled` olan tahta."""
+    board = Board(cols, rows)
+    for y, line in enumerate(filled, rows - len(filled)):
+        board.grid[y] = [GARBAGE_COLOR if c == '#' else None for c in line]
+    board.piece_rng = SequenceRng(sequence)
+    board.next_piece = None
+    board.spawn_new_piece()
+    return board
+
+
+def known_board(name):
+    cols, rows, sequence, filled, _ = KNOWN[name]
+    return make_board(sequence, cols, rows, filled), sequence
+
+
+def placements(board):
+    """Aktif parçanın ulaşılabilir kilitlenme konumları: {hücreler: (x, y, şekil, dönüş)}."""
+    piece = board.current_piece
+    start = (piece.x, piece.y, piece.shape)
+    # Rotation is tracked by count; try_rotate builds a fresh shape list each time
+    seen = {(piece.x, piece.y, 0)}
+    stack = [(piece.x, piece.y, piece.shape, 0)]
+    found = {}
+    while stack:
+        x, y, shape, rotation = stack.pop()
+        for dx, dy in ((-1, 0), (1, 0), (0, 1)):
+            piece.x, piece.y, piece.shape = x, y, shape
+            if board.try_move(dx, dy):
+                key = (piece.x, piece.y, rotation)
+                if key not in seen:
+                    seen.add(key)
+                    stack.append((piece.x, piece.y, shape, rotation))
+            elif dy:
+                found.setdefault(frozenset(piece.get_coords()), (x, y, shape, rotation))
+        piece.x, piece.y, piece.shape = x, y, shape
+        if board.try_rotate():
+            key = (piece.x, piece.y, (rotation + 1) % 4)
+            if key not in seen:
+                seen.add(key)
+                stack.append((piece.x, piece.y, piece.shape, (rotation + 1) % 4))
+    piece.x, piece.y, piece.shape = start
+    return found
+
+
+def _restore(board, data):
+    board.state = snapshot.restore(board, data)
+
+
+def children(board):
+    """Tek parça sonra ulaşılan farklı durumlar: {anlık görüntü: etiket}.
+
+    Tahta son çocuğun durumunda kalır; çağıran gerekirse geri yükler.
+    """
+    root = snapshot.capture(board)
+    out = {}
+    for hold in (False, True):
+        _restore(board, root)
+        if hold and not board.hold_current_piece():
+            continue
+        if board.state == "gameover":
+            continue
+        base = snapshot.capture(board) if hold else root
+        name = PIECE_NAMES[PIECES.index(board.current_piece.piece)]
+        for x, y, shape, rotation in placements(board).values():
+            _restore(board, base)
+            piece = board.current_piece
+            piece.x, piece.y, piece.shape = x, y, shape
+            label = f"{'hold ' if hold else ''}{name}{rotation} x{x} y{y}"
+            board.lock_piece()
+            board.clear_lines()
+            board.spawn_new_piece()
+            out.setdefault(snapshot.capture(board), label)
+    return out
+
+
+def count(board, depth):
+    """`depth` parça sonraki yaprak durumların sayısı."""
+    if depth == 0:
+        return 1
+    if board.state == "gameover":
+        return 0
+    kids = children(board)
+    if depth == 1:
+        return len(kids)
+    total = 0
+    for data in kids:
+        _restore(board, data)
+        total += count(board, depth - 1)
+    return total
+
+
+def _count_child(args):
+    data, sequence, cols, rows, depth = args
+    board = make_board(sequence, cols, rows)
+    _restore(board, data)
+    return count(board, depth)
+
+
+def divide(board, sequence, depth, processes=1):
+    """Kökün her çocuğu için alt sayım: [(etiket, sayı)]; kök süreçlere bölünebilir."""
+    kids = children(board)
+    if depth <= 1:
+        return [(label, 1) for label in kids.values()]
+    tasks = [(data, sequence, board.cols, board.rows, depth - 1) for data in kids]
+    if processes > 1:
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(processes) as pool:
+            counts = pool.map(_count_child, tasks, chunksize=1)
+    else:
+        counts = [_count_child(task) for task in tasks]
+    return list(zip(kids.values(), counts))
+
+
+def perft(board, sequence, depth, processes=1):
+    """(sayı, saniye) döndürür."""
+    start = time.perf_counter()
+    if processes > 1 and depth > 1:
+        total = sum(n for _, n in divide(board, sequence, depth, processes))
+    else:
+        total = count(board, depth)
+    return total, time.perf_counter() - start
+
+
+def check(max_depth=None, processes=1):
+    """`KNOWN` tablosunu doğrular; [(konum, derinlik, beklenen, bulunan)] döndürür."""
+    results = []
+    for name, (_, _, sequence, _, counts) in KNOWN.items():
+        for depth, expected in enumerate(counts[:max_depth], 1):
+            board, _ = known_board(name)
+            found, _ = perft(board, sequence, depth, processes)
+            results.append((name, depth, expected, found))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.perft")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_run = sub.add_parser("run", help="count reachable states to a depth")
+    p_run.add_argument("--depth", type=int, default=2)
+    p_run.add_argument("--position", choices=sorted(KNOWN), help="start from a known position")
+    p_run.add_argument("--sequence", default="TSIO", help="piece letters from IOTS, repeated")
+    p_run.add_argument("--board", default="10x18", help="COLSxROWS of an empty board")
+    p_run.add_argument("--processes", type=int, default=1, help="split the root across processes")
+    p_run.add_argument("--divide", action="store_true", help="print the count below each root move")
+    p_check = sub.add_parser("check", help="validate the rules against the known counts")
+    p_check.add_argument("--max-depth", type=int)
+    p_check.add_argument("--processes", type=int, default=1)
+    args = parser.parse_args(argv)
+    if args.cmd == "check":
+        failed = 0
+        for name, depth, expected, found in check(args.max_depth, args.processes):
+            ok = expected == found
+            failed += not ok
+            print(f"{name:8} depth {depth}: {found:>10} {'ok' if ok else f'expected {expected}'}")
+        raise SystemExit(1 if failed else 0)
+    if args.position:
+        board, sequence = known_board(args.position)
+    else:
+        cols, rows = (int(n) for n in args.board.lower().split("x"))
+        sequence = args.sequence
+        board = make_board(sequence, cols, rows)
+    if args.divide:
+        start = time.perf_counter()
+        rows = divide(board, sequence, args.depth, args.processes)
+        seconds = time.perf_counter() - start
+        for label, n in sorted(rows):
+            print(f"{label:20} {n}")
+        total = sum(n for _, n in rows)
+    else:
+        total, seconds = perft(board, sequence, args.depth, args.processes)
+    print(f"depth {args.depth}: {total} nodes in {seconds:.2f} s ({total / max(seconds, 1e-9):.0f} nodes/s)")
+
+
+if __name__ == "__main__":
+    main()
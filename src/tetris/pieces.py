@@ -3,6 +3,8 @@
 Bu dosya farklı Tetris parçalarının koordinat şekillerini saklar.
 """
 
+import random
+from copy import deepcopy
 from dataclasses import dataclass
 from typing import List
 
@@ -19,3 +21,42 @@ PIECES = [
     Piece(shape=[[0, 1, 0], [1, 1, 1]], color_index=2),  # T parçası - Toprak
     Piece(shape=[[1, 1, 0], [0, 1, 1]], color_index=3),  # S parçası - Hava
 ]
+
+
+class FallingPiece:
+    def __init__(self, piece: Piece, x, y):
+        self.piece = piece
+        self.x = x
+        self.y = y
+        self.shape = deepcopy(piece.shape)
+        self.color_index = piece.color_index
+    def rotate(self):
+        self.shape = [list(row) for row in zip(*self.shape[::-1])]
+    def get_coords(self):
+        return [(self.x + dx, self.y + dy)
+                for dy, row in enumerate(self.shape)
+                for dx, val in enumerate(row) if val]
+
+
+class PieceRng:
+    """Parça seçimi için 32 bitlik xorshift üreteci.
+
+    Tüm durumu tek bir tamsayıdır; bu sayede anlık görüntülere dört bayt
+    olarak yazılıp aynen geri yüklenebilir.
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.state = (seed & 0xFFFFFFFF) or 0x9E3779B9
+
+    def next(self):
+        x = self.state
+        x ^= (x << 13) & 0xFFFFFFFF
+        x ^= x >> 17
+        x ^= (x << 5) & 0xFFFFFFFF
+        self.state = x
+        return x
+
+    def choice(self, seq):
+        return seq[self.next() % len(seq)]
@@ -0,0 +1,131 @@
+"""İş parçacıklı çizim hattı.
+
+Arka plan ve yapraklar, parçacıklar ve bloom katmanları bir sonraki kare
+için işçi iş parçacıklarında çift tamponlu yüzeylere hazırlanır. Bu sırada
+ana iş parçacığı olayları, oyun mantığını ve mevcut karenin birleştirmesini
+yürütür. pygame'in büyük blit, ölçekleme ve surfarray işlemleri GIL'i
+bıraktığı için çok çekirdekli cihazlarda kare süresi kısalır. Tek çekirdekte
+veya kapalıyken hat seri çalışır ve katmanlar eskisi gibi doğrudan çizilir.
+
+Ölçüm:
+    python -m tetris.pipeline --frames 600
+"""
+
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from . import settings
+
+logger = logging.getLogger(__name__)
+
+
+def worker_count(setting=None):
+    """Ayardan işçi sayısını çözer; 0 seri yol demektir."""
+    setting = settings.RENDER_THREADS if setting is None else setting
+    cores = os.cpu_count() or 1
+    if setting in ('', '0', 'off'):
+        return 0
+    if setting == 'auto':
+        # Keep one core for the main thread; on a single core threads only add overhead
+        return min(3, cores - 1)
+    return max(0, int(setting))
+
+
+class Layer:
+    """Bir işçinin arka tampona çizdiği, ana iş parçacığının ön tamponu okuduğu katman."""
+
+    def __init__(self, size, flags=0):
+        self.buffers = [pygame.Surface(size, flags), pygame.Surface(size, flags)]
+        self.index = 0
+        self.pending = None
+        self.ready = False
+
+    def front(self):
+        if self.pending is not None:
+            self.pending.result()
+            self.pending = None
+            self.index ^= 1
+            self.ready = True
+        return self.buffers[self.index] if self.ready else None
+
+    def back(self):
+        return self.buffers[self.index ^ 1]
+
+
+class RenderPipeline:
+    def __init__(self, workers=None):
+        self.workers = worker_count() if workers is None else workers
+        self.threaded = self.workers > 0
+        self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix='render') if self.threaded else None
+        self.layers = {}
+        self.jobs = 0
+        if self.threaded:
+            logger.info("threaded renderer with %d worker(s)", self.workers)
+
+    def layer(self, name, size, flags=0):
+        layer = self.layers.get(name)
+        if layer is None or layer.buffers[0].get_size() != tuple(size):
+            layer = self.layers[name] = Layer(size, flags)
+        return layer
+
+    def submit(self, name, size, flags, paint, *args):
+        """`paint(surface, *args)` işini bir sonraki kare için kuyruğa ekler."""
+        layer = self.layer(name, size, flags)
+        layer.front()  # at most one job per layer in flight
+        layer.pending = self.executor.submit(paint, layer.back(), *args)
+        self.jobs += 1
+
+    def front(self, name):
+        """Hazırlanmış son katmanı döndürür (henüz yoksa None)."""
+        layer = self.layers.get(name)
+        return layer.front() if layer else None
+
+    def close(self):
+        if self.executor:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+
+def _bench(workers, frames):
+    from .game import TetrisGame
+    game = TetrisGame()
+    game.pipeline.close()
+    game.pipeline = RenderPipeline(workers)
+    game.reset_game()
+    game.state = "playing"
+    start = time.perf_counter()
+    for i in range(frames):
+        game.bg_anim_time += 1 / settings.FPS
+        game.update()
+        if i % 30 == 0:
+            game.hard_drop()
+            if game.state == "gameover":
+                game.reset_game()
+                game.state = "playing"
+        game.draw()
+    elapsed = time.perf_counter() - start
+    game.pipeline.close()
+    return elapsed / frames * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.pipeline")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="threaded worker count (default: auto, forced to 1 on a single core)")
+    args = parser.parse_args(argv)
+    workers = args.workers if args.workers is not None else max(1, worker_count('auto'))
+    serial = _bench(0, args.frames)
+    threaded = _bench(workers, args.frames)
+    print(f"cores={os.cpu_count()} serial {serial:.2f} ms/frame, "
+          f"{workers} worker(s) {threaded:.2f} ms/frame, speedup x{serial / threaded:.2f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
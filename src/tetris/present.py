@@ -0,0 +1,132 @@
+"""Mantıksal çözünürlükte çizim ve pencereye tek adımda ölçekleme.
+
+Oyunun bütün katmanları `settings.WINDOW_WIDTH` x `settings.WINDOW_HEIGHT`
+boyutundaki sabit bir mantıksal yüzeye çizilir. Pencere boyutu veya tam ekran
+değiştiğinde çizim kodu aynı kalır; yalnızca bu yüzeyin ekrana aktarılması
+değişir:
+
+* ``'scaled'``: pygame.SCALED ile SDL işleyicisi yüzeyi pencereye gerer
+  (GPU, kenar boşluklu). Fare koordinatları SDL tarafından çevrilir.
+* ``'integer'``: yazılım yolu. Yüzey tam sayı katsayıyla (pencereye
+  sığmazsa kesirli) tek bir `transform.scale` çağrısıyla pencereye yazılır;
+  hedef dikdörtgen yalnızca pencere değiştiğinde yeniden hesaplanır.
+"""
+
+import logging
+
+import pygame
+
+from . import settings
+
+logger = logging.getLogger(__name__)
+
+MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+
+class Presenter:
+    def __init__(self, logical_size, mode=None):
+        self.logical_size = tuple(logical_size)
+        self.mode = mode or settings.RENDER_SCALE
+        self.fullscreen = False
+        self.window_size = self.logical_size
+        self.window = None
+        self.surface = None
+        self.scale = 1.0
+        self.dest = pygame.Rect((0, 0), self.logical_size)
+        self._target = None
+        self.rescales = 0
+
+    def open(self, window_size=None):
+        """Pencereyi açar ve çizim yapılacak mantıksal yüzeyi döndürür."""
+        if window_size:
+            self.window_size = tuple(window_size)
+        if self.mode == 'scaled':
+            try:
+                self.window = pygame.display.set_mode(self.logical_size, pygame.SCALED | pygame.RESIZABLE)
+                self.surface = self.window
+                return self.surface
+            except pygame.error as exc:
+                logger.warning("SCALED display unavailable, using software scaling: %s", exc)
+                self.mode = 'integer'
+        self.window = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
+        self.surface = pygame.Surface(self.logical_size).convert()
+        self._fit()
+        return self.surface
+
+    def resize(self, w, h):
+        if self.mode == 'scaled' or self.fullscreen:
+            return
+        self.window_size = (w, h)
+        self.window = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
+        self._fit()
+
+    def toggle_fullscreen(self):
+        self.fullscreen = not self.fullscreen
+        if self.mode == 'scaled':
+            try:
+                pygame.display.toggle_fullscreen()
+                return self.surface
+            except pygame.error:
+                pass
+            flags = pygame.SCALED | (pygame.FULLSCREEN if self.fullscreen else pygame.RESIZABLE)
+            try:
+                self.window = self.surface = pygame.display.set_mode(self.logical_size, flags)
+                return self.surface
+            except pygame.error as exc:
+                logger.warning("SCALED display lost, using software scaling: %s", exc)
+                self.mode = 'integer'
+                self.surface = None
+        if self.fullscreen:
+            info = pygame.display.Info()
+            self.window = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
+        else:
+            self.window = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
+        if self.surface is None:
+            # Made after the new mode so it matches the display format
+            self.surface = pygame.Surface(self.logical_size).convert()
+        self._fit()
+        return self.surface
+
+    def _fit(self):
+        lw, lh = self.logical_size
+        ww, wh = self.window.get_size()
+        fit = min(ww / lw, wh / lh)
+        # Whole-number factors keep pixels crisp and let us use plain scale;
+        # below 1x there is no integer step, so shrink to fit instead
+        scale = float(int(fit)) if fit >= 1 else fit
+        if scale != self.scale:
+            self.rescales += 1
+            logger.info("presenting %dx%d at %.2fx into %dx%d", lw, lh, scale, ww, wh)
+        self.scale = scale
+        size = (max(1, int(lw * scale)), max(1, int(lh * scale)))
+        self.dest = pygame.Rect(((ww - size[0]) // 2, (wh - size[1]) // 2), size)
+        self.window.fill((0, 0, 0))
+        self._target = None if self.scale == 1 else self.window.subsurface(self.dest)
+
+    def present(self):
+        if self.surface is not self.window:
+            if self._target is None:
+                self.window.blit(self.surface, self.dest)
+            else:
+                # The one scale step of the frame, written straight into the window
+                pygame.transform.scale(self.surface, self.dest.size, self._target)
+        pygame.display.flip()
+
+    def to_logical(self, pos):
+        if self.surface is self.window:
+            return pos
+        x, y = pos
+        return (int((x - self.dest.x) / self.scale), int((y - self.dest.y) / self.scale))
+
+    def map_event(self, event):
+        """Fare olaylarının konumunu mantıksal koordinatlara çevirir."""
+        if self.surface is self.window or event.type not in MOUSE_EVENTS:
+            return event
+        attrs = dict(event.dict)
+        attrs['pos'] = self.to_logical(event.pos)
+        if 'rel' in attrs:
+            attrs['rel'] = (int(attrs['rel'][0] / self.scale), int(attrs['rel'][1] / self.scale))
+        return pygame.event.Event(event.type, attrs)
+
+    def mouse_pos(self):
+        return self.to_logical(pygame.mouse.get_pos())
@@ -0,0 +1,191 @@
+"""Kare başına profil çıkarıcı.
+
+Isteğe bağlı tanı modu: her karede aşamaların (olaylar, update, draw_grid,
+draw_piece, parçacıklar...) süresini ve tracemalloc ile ayırdıkları belleği
+ölçer, gc duraklamalarını kare numarasıyla kaydeder ve en kötü kaynakları
+raporlar. Kapalıyken `phase()` paylaşılan boş bir bağlam döndürür.
+
+Not: tracemalloc yalnızca Python ayırıcısını izler; SDL'in piksel
+tamponları sayılmaz, ancak her yeni `pygame.Surface` nesnesi sayılır.
+"""
+
+import contextlib
+import gc
+import logging
+import os
+import time
+import tracemalloc
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+_NULL = contextlib.nullcontext()
+
+
+class _Phase:
+    __slots__ = ('profiler', 'name')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._push(self.name)
+
+    def __exit__(self, *exc):
+        self.profiler._pop()
+
+
+class FrameProfiler:
+    def __init__(self, enabled=False, alloc=False, sample_every=30, frames_kept=5, package_dir=None):
+        self.enabled = enabled or alloc
+        self.alloc = alloc
+        self.sample_every = sample_every
+        self.frames_kept = frames_kept
+        self.package_dir = package_dir or os.path.dirname(os.path.abspath(__file__))
+        self.frame = 0
+        self.stack = []
+        self.phase_time = defaultdict(float)   # name -> total seconds
+        self.phase_bytes = defaultdict(int)    # name -> total transient bytes
+        self.phase_calls = defaultdict(int)
+        self.worst_frames = []                 # (bytes, frame, phase)
+        self.sites = defaultdict(lambda: [0, 0])  # (phase, file:line) -> [count, bytes]
+        self.gc_pauses = []                    # worst (ms, frame, phase, generation, collected)
+        self.gc_count = 0
+        self.gc_ms = 0.0
+        self.counters = {}
+        self._seg_start = 0.0
+        self._seg_mem = 0
+        self._frame_bytes = defaultdict(int)
+        self._snap = None
+        self._gc_start = None
+        if self.alloc:
+            tracemalloc.start(1)
+        if self.enabled:
+            gc.callbacks.append(self._on_gc)
+
+    def close(self):
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self.alloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    # -- frame / phase bookkeeping ------------------------------------
+    def phase(self, name):
+        if not self.enabled:
+            return _NULL
+        return _Phase(self, name)
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.frame += 1
+        self._frame_bytes.clear()
+        self._push('frame')
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self._pop()
+        for name, size in self._frame_bytes.items():
+            self.worst_frames.append((size, self.frame, name))
+        if len(self.worst_frames) > 200:
+            self.worst_frames.sort(reverse=True)
+            del self.worst_frames[self.frames_kept * 4:]
+
+    def count(self, name, value):
+        """Serbest bir sayacı kaydeder (örneğin yakalama maliyeti)."""
+        if self.enabled:
+            self.counters[name] = value
+
+    def _sampling(self):
+        return self.alloc and self.frame % self.sample_every == 0
+
+    def _close_segment(self):
+        name = self.stack[-1]
+        now = time.perf_counter()
+        self.phase_time[name] += now - self._seg_start
+        if self.alloc:
+            current, peak = tracemalloc.get_traced_memory()
+            size = max(0, peak - self._seg_mem)
+            self.phase_bytes[name] += size
+            self._frame_bytes[name] += size
+            if self._snap is not None:
+                snap = self._take_snapshot()
+                for stat in snap.compare_to(self._snap, 'lineno'):
+                    if stat.count_diff > 0:
+                        frame = stat.traceback[0]
+                        site = self.sites[(name, f"{os.path.basename(frame.filename)}:{frame.lineno}")]
+                        site[0] += stat.count_diff
+                        site[1] += stat.size_diff
+                self._snap = None
+
+    def _open_segment(self):
+        if self.alloc:
+            if self._sampling():
+                self._snap = self._take_snapshot()
+            tracemalloc.reset_peak()
+            self._seg_mem = tracemalloc.get_traced_memory()[0]
+        self._seg_start = time.perf_counter()
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(True, os.path.join(self.package_dir, '*')),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    def _push(self, name):
+        if self.stack:
+            self._close_segment()
+        self.stack.append(name)
+        self.phase_calls[name] += 1
+        self._open_segment()
+
+    def _pop(self):
+        self._close_segment()
+        self.stack.pop()
+        if self.stack:
+            self._open_segment()
+
+    def _on_gc(self, phase, info):
+        if phase == 'start':
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            ms = (time.perf_counter() - self._gc_start) * 1000
+            self._gc_start = None
+            where = self.stack[-1] if self.stack else '-'
+            self.gc_count += 1
+            self.gc_ms += ms
+            self.gc_pauses.append((ms, self.frame, where, info.get('generation'), info.get('collected')))
+            if len(self.gc_pauses) > 200:
+                self.gc_pauses.sort(reverse=True)
+                del self.gc_pauses[40:]
+
+    # -- reporting ----------------------------------------------------
+    def report(self, top=10):
+        if not self.enabled:
+            return "profiler disabled"
+        frames = max(1, self.frame)
+        lines = [f"frames: {self.frame}"]
+        lines.append("phase                 ms/frame   KiB/frame   calls")
+        for name in sorted(self.phase_time, key=self.phase_time.get, reverse=True):
+            lines.append(f"{name:<20} {self.phase_time[name]*1000/frames:9.3f} "
+                         f"{self.phase_bytes[name]/1024/frames:11.1f} {self.phase_calls[name]:7d}")
+        if self.alloc:
+            lines.append("worst frames (transient KiB, frame, phase):")
+            for size, frame, name in sorted(self.worst_frames, reverse=True)[:self.frames_kept]:
+                lines.append(f"  {size/1024:8.1f}  #{frame:<7d} {name}")
+            lines.append(f"top allocation sites (sampled every {self.sample_every} frames):")
+            ranked = sorted(self.sites.items(), key=lambda kv: kv[1][0], reverse=True)[:top]
+            for (name, site), (count, size) in ranked:
+                lines.append(f"  {count:8d} blocks {size/1024:8.1f} KiB  {name:<14} {site}")
+        lines.append(f"gc pauses: {self.gc_count}, {self.gc_ms:.1f} ms total")
+        for ms, frame, name, gen, collected in sorted(self.gc_pauses, reverse=True)[:top]:
+            lines.append(f"  {ms:7.3f} ms  #{frame:<7d} gen{gen} collected={collected} in {name}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name}: {value}")
+        return "\n".join(lines)
+
+    def log_report(self):
+        if self.enabled:
+            logger.warning("frame profile\n%s", self.report())
@@ -0,0 +1,208 @@
+"""Oyun kaydından başsız video karesi üretimi.
+
+Kayıt, izleyici akışının dosyaya yazılmış hâlidir (`TETRIS_RECORD`). Kareler
+oyunun kendi çizim kodundan (`draw_game`, `draw_grid`, `draw_piece`) geçer;
+pencere açılmaz (SDL_VIDEODRIVER=dummy) ve efektlerin mantık adımı sayacı
+(`anim_clock`) kayıttaki kare numarasına eşitlenir. Zaman çizelgesi
+parçalara bölünür ve her parça ayrı bir süreçte çizilir; süreç kendi
+parçasının başına kadar kaydı çizmeden ilerletir, efektler otursun diye son
+iki saniyeyi de çizmeden canlandırır. Çıktı PNG kareleri ya da ffmpeg'e
+verilebilecek ham RGB dosyalarıdır.
+
+Kullanım:
+    python -m tetris.replay demo game.tlog --seconds 180
+    python -m tetris.replay render game.tlog out/ --format rgb
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import struct
+import time
+import zlib
+
+import pygame
+
+from . import settings
+from .ai import search
+from .spectate import RecordedBoard, StreamReader, StreamWriter
+
+# Seconds of effects simulated before a chunk's first frame
+WARMUP_SECONDS = 2.0
+
+
+def png_chunk(tag, data):
+    """Uzunluk ve CRC ile tek bir PNG parçası (chunk); `clip` de kullanır."""
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+
+def write_png(surface, path):
+    """Hızlı sıkıştırmalı PNG yazar; pygame'in kaydedicisinden birkaç kat hızlı."""
+    w, h = surface.get_size()
+    raw = pygame.image.tobytes(surface, "RGB")
+    stride = w * 3
+    # Filter type 0 on every row; level 1 trades some size for speed
+    rows = b"".join(b"\x00" + raw[y * stride:(y + 1) * stride] for y in range(h))
+    with open(path, 'wb') as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(png_chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)))
+        f.write(png_chunk(b"IDAT", zlib.compress(rows, 1)))
+        f.write(png_chunk(b"IEND", b""))
+
+
+def count_frames(data):
+    """Kayıttaki kare sayısı (çizim yapmadan)."""
+    return sum(1 for _ in StreamReader().replay(data))
+
+
+def _headless_game():
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    # A replay must never record, broadcast or play by itself
+    settings.RECORD_FILE = ''
+    settings.SPECTATOR_PORT = 0
+    settings.METRICS_PORT = 0
+    settings.AI_PLAYER['enabled'] = False
+    settings.LIVE_STATE_NAME = ''
+    settings.WAREHOUSE['enabled'] = False
+    settings.INSTANT_REPLAY['enabled'] = False
+    from .game import AnimatedPiece, TetrisGame
+    game = TetrisGame()
+    game.state = "playing"
+    return game, AnimatedPiece
+
+
+def _render_chunk(path, start, stop, out_dir, fmt, fps, log_fps):
+    game, AnimatedPiece = _headless_game()
+    with open(path, 'rb') as f:
+        data = f.read()
+    random.seed(start)
+    first = start * log_fps // fps
+    warmup = max(0, first - int(WARMUP_SECONDS * log_fps))
+    raw = open(os.path.join(out_dir, f"chunk_{start:06d}.rgb"), 'wb') if fmt == 'rgb' else None
+    next_piece = None
+    index = start
+    try:
+        for frame, board in enumerate(StreamReader(game).replay(data)):
+            if frame < warmup:
+                continue
+            # One log frame is one logic tick of the recorded game
+            game.anim_clock.ticks = frame
+            game.bg_anim_time = frame / log_fps
+            # Spawn, hold and keyframes replace the next piece; rotations only the shape
+            if game.next_piece is not next_piece or game.animated_piece is None:
+                next_piece = game.next_piece
+                game.animated_piece = AnimatedPiece(game.current_piece)
+            elif game.current_piece.shape != game.animated_piece.falling_piece.shape:
+                game.animated_piece.falling_piece.shape = [list(row) for row in game.current_piece.shape]
+                game.animated_piece.target_rot += 90
+            if game.update_animations():
+                game.update_particles()
+            while index < stop and index * log_fps // fps == frame:
+                game.draw_cyberpunk_background()
+                game.draw_game()
+                if raw:
+                    raw.write(pygame.image.tobytes(game.screen, "RGB"))
+                else:
+                    write_png(game.screen, os.path.join(out_dir, f"frame_{index:06d}.png"))
+                index += 1
+            if index >= stop:
+                break
+    finally:
+        if raw:
+            raw.close()
+        pygame.quit()
+    return start, index - start
+
+
+def _render_chunk_args(args):
+    return _render_chunk(*args)
+
+
+def render(path, out_dir, fps=60, fmt='png', workers=None, log_fps=None):
+    """Kaydı `out_dir` altına kare kare çizer; (kare sayısı, saniye) döndürür."""
+    log_fps = log_fps or settings.FPS
+    workers = workers or os.cpu_count() or 1
+    with open(path, 'rb') as f:
+        total = (count_frames(f.read()) - 1) * fps // log_fps + 1
+    os.makedirs(out_dir, exist_ok=True)
+    per = -(-total // workers)
+    chunks = [(path, start, min(start + per, total), out_dir, fmt, fps, log_fps)
+              for start in range(0, total, per)]
+    began = time.perf_counter()
+    if len(chunks) == 1:
+        written = [_render_chunk(*chunks[0])]
+    else:
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(len(chunks)) as pool:
+            written = pool.map(_render_chunk_args, chunks)
+    elapsed = time.perf_counter() - began
+    return sum(n for _, n in written), elapsed
+
+
+def record_demo(path, seconds=180, seed=1, fps=None, actions_per_second=10):
+    """Arama botunun oynadığı bir oyunu kayıt dosyasına yazar."""
+    fps = fps or settings.FPS
+    with open(path, 'wb') as f:
+        writer = StreamWriter(lambda data, keyframe: f.write(data), fps=fps)
+        board = RecordedBoard(writer, seed=seed)
+        plan, budget, fall_ms = [], 0.0, 0.0
+        for _ in range(int(seconds * fps)):
+            if board.state == "gameover":
+                board.reset_board()
+            if not plan:
+                plan = search(board)
+            budget += actions_per_second / fps
+            while budget >= 1 and plan:
+                budget -= 1
+                action = plan.pop(0)
+                if action == "drop":
+                    board.hard_drop()
+                elif action == "rotate":
+                    board.try_rotate()
+                else:
+                    board.try_move(-1 if action == "left" else 1, 0)
+            fall_ms += 1000 / fps
+            if fall_ms >= board.fall_speed:
+                fall_ms = 0.0
+                board.gravity_step()
+                plan = []
+            board.update_level()
+            board.check_berserk()
+            board.advance_berserk()
+            writer.frame(board)
+        writer.close()
+    return writer.frames
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.replay")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_demo = sub.add_parser("demo", help="record a bot game to a log file")
+    p_demo.add_argument("log")
+    p_demo.add_argument("--seconds", type=float, default=180)
+    p_demo.add_argument("--seed", type=int, default=1)
+    p_render = sub.add_parser("render", help="render a log to frames")
+    p_render.add_argument("log")
+    p_render.add_argument("out")
+    p_render.add_argument("--fps", type=int, default=60)
+    p_render.add_argument("--format", choices=("png", "rgb"), default="png")
+    p_render.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+    if args.cmd == "demo":
+        frames = record_demo(args.log, args.seconds, args.seed)
+        print(f"{frames} frames written to {args.log}")
+        return
+    frames, elapsed = render(args.log, args.out, args.fps, args.format, args.workers)
+    seconds = frames / args.fps
+    print(f"{frames} frames ({seconds:.1f} s of play) in {elapsed:.1f} s: "
+          f"{frames / elapsed:.0f} fps, x{seconds / elapsed:.1f} real time")
+    if args.format == "rgb":
+        w, h = settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT
+        print(f"encode: cat {args.out}/chunk_*.rgb | ffmpeg -f rawvideo -pix_fmt rgb24 "
+              f"-s {w}x{h} -r {args.fps} -i - out.mp4")
+
+
+if __name__ == "__main__":
+    main()
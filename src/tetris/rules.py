@@ -0,0 +1,264 @@
+"""Başsız (headless) Tetris kuralları.
+
+`Board`, `TetrisGame`'in kullandığı oyun kurallarını pygame olmadan taşır:
+hareket, duvar tekmeli döndürme, hold, kilitleme, satır silme, seviye,
+berserk ve rakipten gelen çöp satırları. Kurallar efekt çağırmaz, `events`
+veriyoluna olay yayar; `TetrisGame` bu sınıftan türeyip görsel ve sesli
+efektleri bu olaylara abone eder. Sunucu, botlar ve araçlar doğrudan `Board`
+kullanır.
+"""
+
+from .events import (EventBus, Berserk, BoardReset, GameOver, LevelUp, LinesCleared, PieceHeld,
+                     PieceLocked, PieceMoved, PieceRotated, PieceSpawned)
+from .pieces import PIECES, FallingPiece, PieceRng
+
+DEFAULT_COLS = 10
+DEFAULT_ROWS = 18
+SPAWN_X = 3
+LINE_SCORES = [0, 100, 300, 500, 800]
+# Garbage rows use the earth color
+GARBAGE_COLOR = 2
+
+
+class Board:
+    def __init__(self, cols=DEFAULT_COLS, rows=DEFAULT_ROWS, seed=None, events=None):
+        self.cols = cols
+        self.rows = rows
+        # Centered on wide boards; SPAWN_X on the standard 10 columns
+        self.spawn_x = max(0, (cols - 4) // 2)
+        self.piece_rng = PieceRng(seed)
+        self.state = "playing"
+        # Bumped on every grid mutation so viewers can skip unchanged boards
+        self.grid_version = 0
+        # (first, last) rows changed in place since a renderer last took them
+        self.dirty_rows = None
+        # Rows the last lock wrote to; the only rows a clear needs to check
+        self.lock_rows = None
+        self.events = events or EventBus()
+        self.reset_board()
+
+    def create_grid(self):
+        return [[None for _ in range(self.cols)] for _ in range(self.rows)]
+
+    def reset_board(self):
+        self.grid = self.create_grid()
+        self.grid_version += 1
+        self.lock_rows = None
+        self.score = 0
+        self.level = 1
+        self.lines_cleared = 0
+        self.fall_speed = 500  # ms
+        self.current_piece = None
+        self.next_piece = None
+        self.hold_piece = None
+        self.hold_used = False
+        self.last_berserk_trigger = 0
+        self.berserk_ready = False
+        self.berserk_anim = None
+        self.state = "playing"
+        self.spawn_new_piece()
+        self.events.emit(BoardReset, self)
+
+    def spawn_new_piece(self):
+        if self.next_piece is None:
+            self.current_piece = FallingPiece(self.piece_rng.choice(PIECES), self.spawn_x, 0)
+            self.next_piece = FallingPiece(self.piece_rng.choice(PIECES), self.spawn_x, 0)
+        else:
+            self.current_piece = self.next_piece
+            self.current_piece.x = self.spawn_x
+            self.current_piece.y = 0
+            self.next_piece = FallingPiece(self.piece_rng.choice(PIECES), self.spawn_x, 0)
+        self.hold_used = False
+        self.events.emit(PieceSpawned, self)
+        if not self.is_valid_position(self.current_piece, 0, 0) and self.state != "gameover":
+            self.state = "gameover"
+            self.events.emit(GameOver, self)
+
+    def is_valid_position(self, piece, dx, dy):
+        for x, y in piece.get_coords():
+            nx, ny = x + dx, y + dy
+            if nx < 0 or nx >= len(self.grid[0]) or ny < 0 or ny >= len(self.grid):
+                return False
+            if self.grid[ny][nx] is not None:
+                return False
+        return True
+
+    def try_move(self, dx, dy):
+        if self.is_valid_position(self.current_piece, dx, dy):
+            self.current_piece.x += dx
+            self.current_piece.y += dy
+            # Hot in searches; skip even the emit call when nobody listens
+            if self.events.handlers[PieceMoved]:
+                self.events.emit(PieceMoved, self, dx, dy)
+            return True
+        return False
+
+    def try_rotate(self):
+        old_shape = self.current_piece.shape
+        self.current_piece.rotate()
+        if not self.is_valid_position(self.current_piece, 0, 0):
+            # Wall kick: try shifting left or right
+            if self.is_valid_position(self.current_piece, -1, 0):
+                self.current_piece.x -= 1
+            elif self.is_valid_position(self.current_piece, 1, 0):
+                self.current_piece.x += 1
+            else:
+                self.current_piece.shape = old_shape
+                return False
+        if self.events.handlers[PieceRotated]:
+            self.events.emit(PieceRotated, self)
+        return True
+
+    def drop_distance(self, piece):
+        """Parçanın kaç satır düşebileceği; yalnızca parçanın altındaki hücrelere bakar."""
+        grid = self.grid
+        rows = len(grid)
+        distance = rows
+        for x, y in piece.get_coords():
+            ny = y + 1
+            while ny - y - 1 < distance and ny < rows and (ny < 0 or grid[ny][x] is None):
+                ny += 1
+            distance = ny - y - 1
+        return distance
+
+    def hard_drop(self):
+        # One jump instead of a try_move per row; tall boards fall hundreds of rows
+        self.current_piece.y += self.drop_distance(self.current_piece)
+        self.lock_piece()
+        cleared = self.clear_lines()
+        self.spawn_new_piece()
+        return cleared
+
+    def touch_rows(self, first, last):
+        """Yerinde değişen satır aralığını çizim önbelleği için biriktirir."""
+        if self.dirty_rows:
+            first = min(first, self.dirty_rows[0])
+            last = max(last, self.dirty_rows[1])
+        self.dirty_rows = (first, last)
+
+    def lock_piece(self):
+        rows = set()
+        for x, y in self.current_piece.get_coords():
+            if 0 <= y < len(self.grid) and 0 <= x < len(self.grid[0]):
+                self.grid[y][x] = self.current_piece.color_index
+                rows.add(y)
+        self.grid_version += 1
+        self.lock_rows = (self.grid, sorted(rows))
+        if rows:
+            self.touch_rows(min(rows), max(rows))
+        self.events.emit(PieceLocked, self, self.current_piece, self.lock_rows[1])
+
+    def get_full_lines(self):
+        # Only a lock can fill a row, so after one just its rows are checked
+        if self.lock_rows and self.lock_rows[0] is self.grid:
+            rows = self.lock_rows[1]
+        else:
+            rows = range(len(self.grid))
+        return [i for i in rows if all(cell is not None for cell in self.grid[i])]
+
+    def clear_lines(self):
+        """Dolu satırları siler ve silinen satır indekslerini döndürür."""
+        full_lines = self.get_full_lines()
+        self.lock_rows = None
+        if full_lines:
+            cols = len(self.grid[0])
+            # In place: rows above the cleared ones keep their lists and move down
+            for y in reversed(full_lines):
+                del self.grid[y]
+            self.grid[:0] = [[None] * cols for _ in full_lines]
+            self.grid_version += 1
+            self.touch_rows(0, full_lines[-1])
+            self.lines_cleared += len(full_lines)
+            self.score += LINE_SCORES[min(len(full_lines), 4)]
+            self.events.emit(LinesCleared, self, full_lines)
+        return full_lines
+
+    def hold_current_piece(self):
+        if self.hold_used:
+            return False
+        if self.hold_piece is None:
+            self.hold_piece = FallingPiece(self.current_piece.piece, self.spawn_x, 0)
+            self.spawn_new_piece()
+        else:
+            self.current_piece, self.hold_piece = self.hold_piece, FallingPiece(self.current_piece.piece, self.spawn_x, 0)
+            self.current_piece.x = self.spawn_x
+            self.current_piece.y = 0
+        self.hold_used = True
+        self.events.emit(PieceHeld, self)
+        return True
+
+    def gravity_step(self):
+        """Parçayı bir satır düşürür; düşemiyorsa kilitler.
+
+        Kilitlenme olduysa silinen satırların listesini, yoksa None döndürür.
+        """
+        if self.try_move(0, 1):
+            return None
+        self.lock_piece()
+        cleared = self.clear_lines()
+        self.spawn_new_piece()
+        return cleared
+
+    def update_level(self):
+        level = 1 + self.lines_cleared // 10
+        raised = level > self.level
+        self.level = level
+        self.fall_speed = max(100, 500 - (self.level-1)*40)
+        if raised:
+            self.events.emit(LevelUp, self, level)
+
+    def check_berserk(self):
+        # Only trigger once per 10 lines, after player clears 10, 20, 30... lines
+        if self.lines_cleared // 10 > self.last_berserk_trigger and self.lines_cleared % 10 == 0:
+            self.last_berserk_trigger = self.lines_cleared // 10
+            self.berserk_ready = True
+            self.berserk_anim = {'timer': 0, 'lines': [len(self.grid)-1, len(self.grid)-2]}
+            return True
+        return False
+
+    def advance_berserk(self):
+        """Berserk sayacını ilerletir; alt satırlar silindiği karede True döner."""
+        if not self.berserk_anim:
+            return False
+        self.berserk_anim['timer'] += 1
+        removed = False
+        if self.berserk_anim['timer'] == 1:
+            # Remove 2 bottom lines and shift grid down
+            for _ in self.berserk_anim['lines']:
+                self.grid.pop()
+                self.grid.insert(0, [None for _ in range(len(self.grid[0]))])
+            self.grid_version += 1
+            self.lock_rows = None
+            self.touch_rows(0, len(self.grid) - 1)
+            self.events.emit(Berserk, self, self.berserk_anim['lines'])
+            removed = True
+        if self.berserk_anim['timer'] > 60:
+            self.berserk_anim = None
+            self.berserk_ready = False
+        return removed
+
+    def add_garbage(self, count, hole):
+        """Alttan `count` çöp satırı ekler; taşma olursa oyun biter."""
+        if count <= 0:
+            return
+        was_over = self.state == "gameover"
+        cols = len(self.grid[0])
+        for row in self.grid[:count]:
+            if any(cell is not None for cell in row):
+                self.state = "gameover"
+        del self.grid[:count]
+        for _ in range(count):
+            row = [GARBAGE_COLOR] * cols
+            row[hole % cols] = None
+            self.grid.append(row)
+        self.grid_version += 1
+        self.lock_rows = None
+        self.touch_rows(0, len(self.grid) - 1)
+        piece = self.current_piece
+        if piece and not self.is_valid_position(piece, 0, 0):
+            if self.is_valid_position(piece, 0, -count):
+                piece.y -= count
+            else:
+                self.state = "gameover"
+        if self.state == "gameover" and not was_over:
+            self.events.emit(GameOver, self)
@@ -0,0 +1,77 @@
+"""Boşta kare zamanlayıcı.
+
+Menü, duraklatma ve oyun sonu ekranlarında girdi yokken tam 60 FPS yerine
+düşük bir hızda çizer; pencere küçültülmüşken çizimi tamamen bırakıp
+`pygame.event.wait` ile uyur ve süren oyun duraklatılır. Herhangi bir girdi
+tam hıza anında döndürür.
+"""
+
+import pygame
+
+from . import settings
+
+FULL = 'full'
+IDLE = 'idle'
+SLEEP = 'sleep'
+
+_INPUT_EVENTS = {
+    pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.FINGERDOWN, pygame.FINGERUP,
+    pygame.FINGERMOTION, pygame.TEXTINPUT, pygame.VIDEORESIZE, pygame.QUIT,
+}
+_HIDE_EVENTS = {pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN, pygame.APP_DIDENTERBACKGROUND}
+_SHOW_EVENTS = {pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED,
+                pygame.WINDOWEXPOSED, pygame.APP_DIDENTERFOREGROUND}
+
+
+class FrameScheduler:
+    def __init__(self, enabled=None):
+        cfg = settings.IDLE_SCHEDULER
+        self.enabled = cfg['enabled'] if enabled is None else enabled
+        self.idle_fps = cfg['idle_fps']
+        self.idle_after_ms = cfg['idle_after_ms']
+        self.sleep_timeout_ms = cfg['sleep_timeout_ms']
+        self.last_input = pygame.time.get_ticks()
+        self.minimized = False
+
+    def observe(self, event):
+        if event.type in _INPUT_EVENTS:
+            self.last_input = pygame.time.get_ticks()
+        elif event.type in _HIDE_EVENTS:
+            self.minimized = True
+        elif event.type in _SHOW_EVENTS:
+            self.minimized = False
+            self.last_input = pygame.time.get_ticks()
+
+    def mode(self, state, busy=False):
+        """Bu kare için 'full', 'idle' veya 'sleep' döndürür."""
+        if not self.enabled:
+            return FULL
+        if self.minimized:
+            return SLEEP
+        if state == "playing" or busy:
+            return FULL
+        if pygame.time.get_ticks() - self.last_input < self.idle_after_ms:
+            return FULL
+        return IDLE
+
+    def wait(self, clock, mode):
+        """Kareyi zamanlar ve bekleyen olayları döndürür.
+
+        Tam hızda sabit FPS ile bekler; boşta ve uykuda bir sonraki kareye
+        kadar `pygame.event.wait` ile bloklanır, böylece ilk girdi beklemeyi
+        hemen bitirir. Girdi olmayan olay yağmurları kareyi `idle_fps`
+        hızının üstüne çıkaramaz.
+        """
+        if mode == FULL:
+            clock.tick(settings.FPS)
+            return pygame.event.get()
+        timeout = self.sleep_timeout_ms if mode == SLEEP else 1000 // self.idle_fps
+        event = pygame.event.wait(timeout)
+        events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+        if any(e.type in _INPUT_EVENTS for e in events):
+            clock.tick()
+        else:
+            # Window, joystick and timer events must not lift the idle frame rate
+            clock.tick(self.idle_fps)
+        return events
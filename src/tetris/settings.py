@@ -26,6 +26,11 @@ WINDOW_HEIGHT = DEFAULT_HEIGHT
 # Kare boyutu (auto-calculated)
 BLOCK_SIZE = WINDOW_WIDTH // 10
 
+# Board size in cells as "COLSxROWS" (e.g. 100x400), independent of the
+# window; boards that do not fit scroll and zoom with a camera. Empty: 10x18.
+_board = os.environ.get('TETRIS_BOARD', '').lower()
+BOARD_SIZE = tuple(int(n) for n in _board.split('x')) if _board else None
+
 # Renkler (ateş, su, toprak, hava)
 RED = (255, 0, 0)      # Ateş
 BLUE = (0, 0, 255)     # Su
@@ -37,6 +42,50 @@ COLORS = [RED, BLUE, BROWN, WHITE]
 # FPS ayarı
 FPS = 60
 
+# How the fixed logical frame reaches the window: 'scaled' lets SDL's renderer
+# stretch it (GPU, letterboxed); 'integer' does one software scale step at
+# whole-number factors
+RENDER_SCALE = os.environ.get('TETRIS_RENDER_SCALE', 'scaled')
+
+# Threaded render pipeline: '0' (serial), 'auto' (one worker per spare core,
+# serial on single-core devices) or a worker count
+RENDER_THREADS = os.environ.get('TETRIS_RENDER_THREADS', '0')
+
+# AI player searched in a separate process (F7 toggles it in game)
+AI_PLAYER = {
+    'enabled': os.environ.get('TETRIS_AI', '') == '1',
+    'actions_per_second': float(os.environ.get('TETRIS_AI_APS', '10')),
+    # Placement table from `python -m tetris.skyline build` ('' searches every piece)
+    'table': os.environ.get('TETRIS_AI_TABLE', ''),
+}
+
+# Diagnostic frame profiler: '' (off), 'time' or 'alloc' (adds tracemalloc/gc)
+PROFILE = os.environ.get('TETRIS_PROFILE', '')
+
+# Prometheus telemetry endpoint (0 disables the HTTP server)
+METRICS_HOST = os.environ.get('TETRIS_METRICS_HOST', '127.0.0.1')
+METRICS_PORT = int(os.environ.get('TETRIS_METRICS_PORT', '0'))
+
+# Spectator stream broadcast (0 disables)
+SPECTATOR_HOST = os.environ.get('TETRIS_SPECTATOR_HOST', '0.0.0.0')
+SPECTATOR_PORT = int(os.environ.get('TETRIS_SPECTATOR_PORT', '0'))
+
+# Game log: the spectator stream written to this file ('' disables); replay
+# it to video with `python -m tetris.replay render`
+RECORD_FILE = os.environ.get('TETRIS_RECORD', '')
+
+# Live game state in a shared-memory segment of this name ('' disables); read
+# it with `python -m tetris.livestate watch <name>`
+LIVE_STATE_NAME = os.environ.get('TETRIS_SHM', '')
+
+# Idle frame scheduler for menu / pause / game-over screens
+IDLE_SCHEDULER = {
+    'enabled': True,
+    'idle_fps': 10,           # frame rate when only ambient animation runs
+    'idle_after_ms': 1500,    # quiet time before dropping to idle_fps
+    'sleep_timeout_ms': 1000, # event.wait timeout while minimized
+}
+
 # Resource paths (use resource_path for PyInstaller compatibility)
 RESOURCE_DIR = resource_path(os.path.join('src', 'tetris', 'resources'))
 SOUND_MOVE = os.path.join(RESOURCE_DIR, 'move.wav')
@@ -50,11 +99,26 @@ SOUND_WIN = os.path.join(RESOURCE_DIR, 'win.wav')
 SOUND_COIN = os.path.join(RESOURCE_DIR, 'coin.wav')
 MUSIC_BG = os.path.join(RESOURCE_DIR, 'bgm.mp3')
 
+# Audio engine: small mixer buffer for low latency, reserved voices per category
+AUDIO = {
+    'frequency': 44100,
+    'buffer': int(os.environ.get('TETRIS_AUDIO_BUFFER', '256')),  # samples (~6 ms)
+    # category: (sounds, voices, min ms between repeats of one sound)
+    'categories': {
+        'input': (('move', 'rotate', 'click'), 2, 35),
+        'impact': (('drop', 'coin'), 3, 20),
+        'event': (('line', 'levelup', 'win'), 3, 0),
+        'jingle': (('gameover',), 1, 0),
+    },
+}
+
 # High score file (write to user home for EXE compatibility)
 USERDATA_DIR = os.path.join(os.path.expanduser('~'), '.tetris_userdata')
 if not os.path.exists(USERDATA_DIR):
     os.makedirs(USERDATA_DIR, exist_ok=True)
 HIGH_SCORE_FILE = os.path.join(USERDATA_DIR, 'highscores.txt')
+# Autosave snapshot written on pause / app backgrounding
+AUTOSAVE_FILE = os.path.join(USERDATA_DIR, 'autosave.snap')
 
 # Background image (cyberpunk chill world)
 BACKGROUND_IMAGE = os.path.join(RESOURCE_DIR, 'cyberpunk_bg.jpg')
@@ -65,5 +129,72 @@ DEFAULT_SETTINGS = {
     'music_volume': 0.5,
     'effects_volume': 0.7,
     'mute': False,
-    'graphics': 'best',  # 'low', 'good', 'best'
+    'graphics': 'best',  # 'low', 'good', 'best', 'auto'
+}
+
+# Effect tiers, cheapest first. 'low'/'good'/'best' pin the tier with the
+# same name; 'auto' lets the governor move between all of them.
+GRAPHICS_TIERS = [
+    {'name': 'low', 'style': 'low', 'trail_length': 0, 'glow_passes': 0,
+     'elemental': False, 'particle_cap': 40, 'explosion_density': 2},
+    {'name': 'lite', 'style': 'good', 'trail_length': 6, 'glow_passes': 1,
+     'elemental': False, 'particle_cap': 80, 'explosion_density': 5},
+    {'name': 'good', 'style': 'good', 'trail_length': 12, 'glow_passes': 4,
+     'elemental': False, 'particle_cap': 160, 'explosion_density': 10},
+    {'name': 'high', 'style': 'best', 'trail_length': 18, 'glow_passes': 4,
+     'elemental': True, 'particle_cap': 240, 'explosion_density': 10},
+    {'name': 'best', 'style': 'best', 'trail_length': 24, 'glow_passes': 4,
+     'elemental': True, 'particle_cap': 400, 'explosion_density': 10},
+]
+
+# Auto graphics governor thresholds (work time relative to the frame budget)
+AUTO_GRAPHICS = {
+    'window': 60,       # frames per decision
+    'down_ratio': 0.85, # step down when mean work exceeds this share of budget
+    'up_ratio': 0.45,   # step up when mean work stays below this share...
+    'up_windows': 3,    # ...for this many consecutive windows
+    'cooldown': 120,    # frames to wait after a switch
+}
+
+# One-pass bloom post-process (needs NumPy; falls back to per-object glow)
+BLOOM = {
+    'enabled': os.environ.get('TETRIS_BLOOM', '1') != '0',
+    'downscale': 4,     # blur at 1/4 resolution
+    'threshold': 170,   # luma where pixels start to glow
+    'radius': 3,        # box radius in downscaled pixels
+    'passes': 2,        # box passes (2 is close to a gaussian)
+    'strength': 1.0,
+}
+
+# Instant replay: ring buffer of downscaled frames, saved with F8 as APNG
+INSTANT_REPLAY = {
+    'enabled': os.environ.get('TETRIS_REPLAY', '') == '1',
+    'budget_mb': float(os.environ.get('TETRIS_REPLAY_MB', '64')),
+    'seconds': 30,          # kept when the budget allows
+    'fps': 15,              # capture rate
+    'downscale': 3,         # 400x800 -> 133x266
+    'auto_save_after': 0,   # seconds after a bigwin/berserk to save by itself (0 = off)
+    'dir': os.path.join(USERDATA_DIR, 'clips'),
+}
+
+# Columnar log of finished games and their pieces (tetris.warehouse; needs NumPy)
+WAREHOUSE = {
+    'enabled': os.environ.get('TETRIS_WAREHOUSE', '') == '1',
+    'dir': os.environ.get('TETRIS_WAREHOUSE_DIR', os.path.join(USERDATA_DIR, 'warehouse')),
+    'chunk_rows': 1 << 16,  # rows buffered per table before a chunk is written
+}
+
+# Generated surfaces (text, glows, block sprites, overlays), least recently used dropped first
+SURFACE_CACHE = {
+    'budget_mb': float(os.environ.get('TETRIS_SURFACE_CACHE_MB', '24')),
+}
+
+# Board camera and chunked block cache (see BOARD_SIZE)
+BOARD_VIEW = {
+    'chunk_cells': 16,      # chunk edge in cells
+    'cache_mb': 32,         # rendered chunks kept, least recently drawn dropped first
+    'min_cell': 2,          # zoom limits in pixels per cell
+    'max_cell': BLOCK_SIZE * 2,
+    'lod_cell': 6,          # below this, cells are plain fills without borders
+    'follow_margin': 4,     # cells kept between the active piece and the view edge
 }
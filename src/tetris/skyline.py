@@ -0,0 +1,401 @@
+"""Tahta siluetine göre önceden hesaplanmış yerleşim tablosu.
+
+`ai.search` her parçada bütün yerleşimleri dener; zayıf donanımda bu
+yavaştır. Yalnızca dört parça olduğu için en iyi yerleşim büyük ölçüde
+tahtanın üst yüzeyine bağlıdır: komşu sütun yükseklik farkları
+`[-clamp, clamp]` aralığına kırpılır ve bu silüet, aktif parça ve sonraki
+parça için en iyi (dönüş, x) bir kez hesaplanıp diske yazılır. Hesap
+`ai.evaluate`'in ağırlıklarıyla ve sonraki parçaya bir adım ileri bakarak
+NumPy ile bütün silüetler için birlikte yapılır; silüet tahtalarında
+sütunlar doludur ve her sütunun hücreleri bir bit maskesinde tutulur.
+
+Oyun sırasında tablo `mmap` ile açılır ve bir yerleşim tek bir bayt
+okumasıdır. Tablo yoksa, sütun sayısı uymuyorsa ya da tablodaki yerleşime
+giden yol (dönüşler ve kaydırmalar) tahtada yapılamıyorsa `ai.search`'e
+düşülür.
+
+Dosya düzeni (little-endian, sürüm 1):
+
+    0   4s   magic b"TSKY"
+    4   u8   sürüm (1)
+    5   u8   sütun sayısı
+    6   u8   kırpma sınırı
+    7   u8   parça sayısı
+    8   ...  silüet, parça, sonraki parça sırasıyla kayıt başına bir bayt:
+             dönüş << 6 | x; 0xFF = yerleşim yok
+
+Kullanım:
+    python -m tetris.skyline build placements.tsky --clamp 2 --processes 4
+    python -m tetris.skyline bench placements.tsky
+    TETRIS_AI=1 TETRIS_AI_TABLE=placements.tsky python -m main
+"""
+
+import argparse
+import logging
+import mmap
+import multiprocessing
+import os
+import struct
+import time
+
+try:
+    import numpy
+except ImportError:  # optional dependency, only needed to build tables
+    numpy = None
+
+from .ai import WEIGHTS, search
+from .pieces import PIECES, FallingPiece
+from .rules import Board, DEFAULT_COLS
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TSKY"
+VERSION = 1
+MISS = 0xFF
+
+_HEADER = struct.Struct("<4sBBBB")
+
+
+def _rotations(piece):
+    """Parçanın farklı dönüşleri: [(dönüş sayısı, şekil)]."""
+    falling = FallingPiece(piece, 0, 0)
+    seen, out = set(), []
+    for rotation in range(4):
+        key = tuple(map(tuple, falling.shape))
+        if key not in seen:
+            seen.add(key)
+            out.append((rotation, falling.shape))
+        falling.rotate()
+    return out
+
+
+def _profile(shape):
+    """Alttan ölçülen sütun başına (alt, üst) ve satır başına hücre sütunları [ilk, son)."""
+    height = len(shape)
+    bottoms, tops = [], []
+    for x in range(len(shape[0])):
+        filled = [height - 1 - y for y in range(height) if shape[y][x]]
+        bottoms.append(min(filled))
+        tops.append(max(filled) + 1)
+    # Every row of every piece is one run of cells
+    spans = []
+    for r in range(height):
+        row = shape[height - 1 - r]
+        first = row.index(1)
+        spans.append((first, first + sum(row)))
+    return (numpy.array(bottoms, numpy.int16), numpy.array(tops, numpy.int16),
+            [last - first for first, last in spans], spans)
+
+
+def heights(grid):
+    rows = len(grid)
+    out = []
+    for x in range(len(grid[0])):
+        y = 0
+        while y < rows and grid[y][x] is None:
+            y += 1
+        out.append(rows - y)
+    return out
+
+
+def contour_index(column_heights, clamp):
+    """Yükseklik farklarını kırpıp tablodaki silüet sırasına çevirir."""
+    base = 2 * clamp + 1
+    index = 0
+    for a, b in zip(column_heights, column_heights[1:]):
+        index = index * base + max(-clamp, min(clamp, b - a)) + clamp
+    return index
+
+
+# -- building ----------------------------------------------------------
+
+def _contours(cols, clamp, start, stop):
+    """`start:stop` silüetlerinin sütun yükseklikleri, en alçak sütun 0 olacak biçimde."""
+    base = 2 * clamp + 1
+    index = numpy.arange(start, stop)
+    diffs = numpy.empty((len(index), cols - 1), numpy.int16)
+    for i in range(cols - 2, -1, -1):
+        diffs[:, i] = index % base - clamp
+        index //= base
+    h = numpy.zeros((len(diffs), cols), numpy.int16)
+    h[:, 1:] = numpy.cumsum(diffs, axis=1)
+    h -= h.min(axis=1, keepdims=True)
+    return h
+
+
+def _placements(shapes, cols):
+    for rotation, shape in shapes:
+        profile = _profile(shape)
+        for x in range(cols - len(shape[0]) + 1):
+            yield rotation, x, profile
+
+
+def _drop(h, filled, cells, lines, profile, x):
+    """Düşürme sonrası (yükseklikler, dolu hücreler, hücre sayısı, satırlar).
+
+    `filled` sütun başına bir bit maskesidir (bit k = alttan k. satır dolu);
+    satır silme ve delikler bu maskelerden tam olarak hesaplanır.
+    """
+    bottoms, tops, _, _ = profile
+    width = len(bottoms)
+    one = numpy.int64(1)
+    under = h[:, x:x + width]
+    land = (under - bottoms).max(axis=1)
+    filled = filled.copy()
+    for j in range(width):
+        bits = (one << int(tops[j] - bottoms[j])) - 1
+        filled[:, x + j] |= bits << (land + int(bottoms[j])).astype(numpy.int64)
+    after = h.copy()
+    after[:, x:x + width] = land[:, None] + tops
+    cells = cells + int((tops - bottoms).sum())
+    full = numpy.bitwise_and.reduce(filled, axis=1)
+    cleared = numpy.zeros(len(h), numpy.int16)
+    for r in range(int(tops.max()) - 1, -1, -1):  # top down keeps lower rows in place
+        shift = (land + r).astype(numpy.int64)
+        gone = (full >> shift) & 1 == 1
+        if gone.any():
+            shift = shift[:, None]
+            kept = (filled & ((one << shift) - 1)) | ((filled >> (shift + 1)) << shift)
+            filled = numpy.where(gone[:, None], kept, filled)
+            cleared += gone
+    if cleared.any():
+        # A column whose top cells all clear drops to its next filled cell
+        after = numpy.frexp(filled.astype(numpy.float64))[1].astype(numpy.int16)
+        cells = cells - h.shape[1] * cleared
+    return after, filled, cells, lines + cleared
+
+
+def _best_ahead(h, filled, cells, lines, shapes):
+    """Sonraki parçanın en iyi yerleşiminin puanı.
+
+    Satır silmeyen yerleşimler yalnızca değişen sütunlardan puanlanır;
+    silenler `_drop` ile tam hesaplanır.
+    """
+    a, l, o, b = WEIGHTS
+    n, cols = h.shape
+    one = numpy.int64(1)
+    # Column-major so every step works on one contiguous column of all contours
+    column = numpy.ascontiguousarray(h.T, dtype=numpy.int32)
+    masks = numpy.ascontiguousarray(filled.T)
+    total = numpy.zeros((cols + 1, n), numpy.int32)
+    numpy.cumsum(column, axis=0, out=total[1:])
+    step = numpy.abs(numpy.diff(column, axis=0))
+    bumps = numpy.zeros((cols, n), numpy.int32)
+    numpy.cumsum(step, axis=0, out=bumps[1:])
+    # prefix[k] = rows full in columns [:k], suffix[k] = rows full in columns [k:]
+    every = numpy.full((1, n), -1, numpy.int64)
+    prefix = numpy.concatenate([every, numpy.bitwise_and.accumulate(masks, axis=0)])
+    suffix = numpy.concatenate([numpy.bitwise_and.accumulate(masks[::-1], axis=0)[::-1], every])
+    holes = total[cols] - cells
+    base = a * total[cols] + b * bumps[cols - 1] + o * holes + l * lines
+    best = numpy.full(n, -numpy.inf)
+    for _, x, profile in _placements(shapes, cols):
+        bottoms, tops, _, _ = profile
+        width = len(bottoms)
+        land = column[x] - int(bottoms[0])
+        for j in range(1, width):
+            numpy.maximum(land, column[x + j] - int(bottoms[j]), out=land)
+        under = total[x + width] - total[x]
+        new = [land + int(top) for top in tops]
+        lo, hi = max(x - 1, 0), min(x + width, cols - 1)
+        line = ([column[x - 1]] if x else []) + new + ([column[x + width]] if x + width < cols else [])
+        local = sum(numpy.abs(line[k + 1] - line[k]) for k in range(len(line) - 1))
+        score = (base + a * (width * land + int(tops.sum()) - under)
+                 + o * (width * land + int(bottoms.sum()) - under)
+                 + b * (local - (bumps[hi] - bumps[lo])))
+        full = prefix[x] & suffix[x + width]
+        for j in range(width):
+            bits = (one << int(tops[j] - bottoms[j])) - 1
+            full &= masks[x + j] | (bits << (land + int(bottoms[j])).astype(numpy.int64))
+        clears = full != 0
+        if clears.any():
+            i = numpy.flatnonzero(clears)
+            score[i] = _score(*_drop(h[i], filled[i], cells[i], lines[i], profile, x))
+        numpy.maximum(best, score, out=best)
+    return best
+
+
+def _score(h, filled, cells, lines):
+    a, l, o, b = WEIGHTS
+    total = h.sum(axis=1)
+    bumpiness = numpy.abs(numpy.diff(h, axis=1)).sum(axis=1)
+    return a * total + l * lines + o * (total - cells) + b * bumpiness
+
+
+def _build_chunk(args):
+    cols, clamp, start, stop = args
+    h = _contours(cols, clamp, start, stop)
+    n = len(h)
+    zeros = numpy.zeros(n, numpy.int16)
+    filled = (numpy.int64(1) << h.astype(numpy.int64)) - 1
+    cells = h.sum(axis=1, dtype=numpy.int32)
+    shapes = [_rotations(p) for p in PIECES]
+    table = numpy.full((n, len(PIECES), len(PIECES)), MISS, numpy.uint8)
+    for p in range(len(PIECES)):
+        best = numpy.full((n, len(PIECES)), -numpy.inf)
+        for rotation, x, profile in _placements(shapes[p], cols):
+            state = _drop(h, filled, cells, zeros, profile, x)
+            code = rotation << 6 | x
+            for q in range(len(PIECES)):
+                # One piece of lookahead: the best follow-up decides
+                ahead = _best_ahead(*state, shapes[q])
+                better = ahead > best[:, q]
+                best[better, q] = ahead[better]
+                table[better, p, q] = code
+    return table.tobytes()
+
+
+def build(cols=DEFAULT_COLS, clamp=2, processes=1, chunk=1 << 16):
+    """Tabloyu bayt dizisi olarak hesaplar; silüet aralıkları süreçlere bölünebilir."""
+    if numpy is None:
+        raise RuntimeError("building placement tables needs NumPy")
+    if cols > 64:
+        raise ValueError("placements store x in 6 bits")
+    if clamp * (cols - 1) + 2 * 4 > 62:
+        raise ValueError("two pieces on the tallest contour must fit a 64-bit column mask")
+    count = (2 * clamp + 1) ** (cols - 1)
+    tasks = [(cols, clamp, start, min(count, start + chunk)) for start in range(0, count, chunk)]
+    if processes > 1:
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(processes) as pool:
+            parts = pool.map(_build_chunk, tasks, chunksize=1)
+    else:
+        parts = [_build_chunk(task) for task in tasks]
+    return _HEADER.pack(MAGIC, VERSION, cols, clamp, len(PIECES)) + b"".join(parts)
+
+
+# -- runtime -----------------------------------------------------------
+
+class PlacementTable:
+    """`mmap` ile açılmış tablo; `lookup` tek bayt okur."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.cols, self.clamp, self.pieces = _HEADER.unpack_from(self.map, 0)
+        expected = _HEADER.size + (2 * self.clamp + 1) ** (self.cols - 1) * self.pieces ** 2
+        if magic != MAGIC or version != VERSION or len(self.map) != expected:
+            self.map.close()
+            raise ValueError(f"{path} is not a version {VERSION} placement table")
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def lookup(self, board):
+        """(dönüş, x) ya da tabloda yoksa None."""
+        current, upcoming = board.current_piece, board.next_piece
+        if board.cols != self.cols or current is None or upcoming is None:
+            return None
+        p = PIECES.index(current.piece)
+        q = PIECES.index(upcoming.piece)
+        index = (contour_index(heights(board.grid), self.clamp) * self.pieces + p) * self.pieces + q
+        code = self.map[_HEADER.size + index]
+        if code == MISS:
+            return None
+        return code >> 6, code & 0x3F
+
+    def close(self):
+        self.map.close()
+
+
+def open_table(path):
+    """Ayarlı tabloyu açar; yoksa veya bozuksa None döndürür."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        return PlacementTable(path)
+    except (OSError, ValueError) as exc:
+        logger.warning("placement table disabled: %s", exc)
+        return None
+
+
+def _inputs(board, rotation, x):
+    """Aktif parçayı (dönüş, x)'e götüren girdiler; yol kapalıysa None.
+
+    `search` gibi tahtanın `try_rotate`/`try_move`'unu dener ve parçayı geri koyar.
+    """
+    piece = board.current_piece
+    origin = (piece.x, piece.y, piece.shape)
+    try:
+        if not all(board.try_rotate() for _ in range(rotation)):
+            return None
+        inputs = ["rotate"] * rotation
+        step, name = (1, "right") if x > piece.x else (-1, "left")
+        while piece.x != x:
+            if not board.try_move(step, 0):
+                return None
+            inputs.append(name)
+        return inputs + ["drop"]
+    finally:
+        piece.x, piece.y, piece.shape = origin
+
+
+def plan(board, table=None):
+    """Tablodan, olmazsa aramayla aktif parçanın girdilerini döndürür."""
+    if table is not None and board.state != "gameover":
+        placement = table.lookup(board)
+        inputs = _inputs(board, *placement) if placement else None
+        if inputs is not None:
+            table.stats['hits'] += 1
+            return inputs
+        table.stats['misses'] += 1
+    return search(board)
+
+
+# -- measurement -------------------------------------------------------
+
+def _play(table, pieces, seed):
+    """Bir botun `pieces` parça boyunca oyunu; (silinen satır, oyun sonu, saniye)."""
+    board = Board(seed=seed)
+    spent = 0.0
+    lines = games_over = 0
+    for _ in range(pieces):
+        start = time.perf_counter()
+        inputs = plan(board, table)
+        spent += time.perf_counter() - start
+        for action in inputs:
+            if action == "drop":
+                board.hard_drop()
+            elif action == "rotate":
+                board.try_rotate()
+            else:
+                board.try_move(-1 if action == "left" else 1, 0)
+        if board.state == "gameover":
+            games_over += 1
+            lines += board.lines_cleared
+            board.reset_board()
+    return lines + board.lines_cleared, games_over, spent / pieces
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.skyline")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_build = sub.add_parser("build", help="compute a placement table")
+    p_build.add_argument("path")
+    p_build.add_argument("--cols", type=int, default=DEFAULT_COLS)
+    p_build.add_argument("--clamp", type=int, default=2, help="largest height step kept")
+    p_build.add_argument("--processes", type=int, default=1, help="split the contours across processes")
+    p_bench = sub.add_parser("bench", help="compare table lookups with search")
+    p_bench.add_argument("path")
+    p_bench.add_argument("--pieces", type=int, default=2000)
+    p_bench.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    if args.cmd == "build":
+        start = time.perf_counter()
+        data = build(args.cols, args.clamp, args.processes)
+        with open(args.path, 'wb') as f:
+            f.write(data)
+        print(f"{len(data)} bytes for {args.cols} columns, clamp {args.clamp} "
+              f"in {time.perf_counter() - start:.1f} s")
+        return
+    table = PlacementTable(args.path)
+    try:
+        for name, source in (("search", None), ("table", table)):
+            lines, overs, seconds = _play(source, args.pieces, args.seed)
+            print(f"{name:6} {seconds * 1e6:8.1f} us/piece  {lines:5} lines  {overs} games over")
+        hits, misses = table.stats['hits'], table.stats['misses']
+        print(f"table hit rate {hits / max(1, hits + misses):.1%}")
+    finally:
+        table.close()
+
+
+if __name__ == "__main__":
+    main()
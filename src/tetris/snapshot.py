@@ -0,0 +1,190 @@
+"""Oyun durumu anlık görüntüleri.
+
+Oyunun mantıksal durumunu (ızgara, aktif/sonraki/hold parçaları, skor,
+seviye, satırlar, berserk sayaçları ve parça üreteci) birkaç yüz baytlık,
+sürümlü bir ikili kayda paketler. Duraklatmada otomatik kayıt, kontrol
+noktasından yeniden başlama ve botlar için geri alma bu kayıtları kullanır.
+
+Sürüm 2 büyük tahtalar için boyutları u16, parça konumlarını i16 tutar;
+sürüm 1 kayıtları (en fazla 255x255 tahta) hâlâ okunur.
+"""
+
+import os
+import struct
+
+from .pieces import PIECES, FallingPiece
+
+MAGIC = b"TSNP"
+VERSION = 2
+
+# magic, version, cols, rows
+_HEADER = struct.Struct("<4sBHH")
+# score, lines, level, fall_speed, berserk trigger, berserk timer,
+# berserk ready, hold used, state code, rng state
+_STATE = struct.Struct("<IIHHHH??BI")
+# piece index, rotation, x, y
+_PIECE = struct.Struct("<BBhh")
+
+# version -> (header, piece) layouts decode accepts
+_LAYOUTS = {
+    1: (struct.Struct("<4sBBB"), struct.Struct("<BBbb")),
+    VERSION: (_HEADER, _PIECE),
+}
+
+MAX_SIDE = 0xFFFF
+
+_NO_PIECE = 0xFF
+STATES = ("menu", "playing", "paused", "gameover")
+
+
+class SnapshotError(ValueError):
+    """Geçersiz veya uyumsuz anlık görüntü."""
+
+
+def pack_grid(grid):
+    # One nibble per cell: 0 = empty, 1..15 = color_index + 1
+    cells = [0 if c is None else c + 1 for row in grid for c in row]
+    if len(cells) % 2:
+        cells.append(0)
+    return bytes((cells[i] << 4) | cells[i + 1] for i in range(0, len(cells), 2))
+
+
+def unpack_grid(data, cols, rows):
+    cells = []
+    for b in data:
+        cells.append(b >> 4)
+        cells.append(b & 0x0F)
+    return [[None if c == 0 else c - 1 for c in cells[y*cols:(y+1)*cols]]
+            for y in range(rows)]
+
+
+def _pack_piece(piece):
+    if piece is None:
+        return _PIECE.pack(_NO_PIECE, 0, 0, 0)
+    index = next(i for i, p in enumerate(PIECES) if p is piece.piece)
+    shape = piece.piece.shape
+    rotation = 0
+    while shape != piece.shape and rotation < 3:
+        shape = [list(row) for row in zip(*shape[::-1])]
+        rotation += 1
+    return _PIECE.pack(index, rotation, piece.x, piece.y)
+
+
+def _unpack_piece(data, offset, layout=_PIECE):
+    index, rotation, x, y = layout.unpack_from(data, offset)
+    if index == _NO_PIECE:
+        return None
+    if index >= len(PIECES):
+        raise SnapshotError(f"unknown piece index {index}")
+    piece = FallingPiece(PIECES[index], x, y)
+    for _ in range(rotation):
+        piece.rotate()
+    return piece
+
+
+def size(cols, rows):
+    """`cols` x `rows` tahtanın anlık görüntüsünün bayt uzunluğu."""
+    return _HEADER.size + _STATE.size + 3*_PIECE.size + (cols * rows + 1) // 2
+
+
+def capture(game):
+    """Oyunun mantıksal durumunu bayt dizisine paketler."""
+    rows, cols = len(game.grid), len(game.grid[0])
+    if cols > MAX_SIDE or rows > MAX_SIDE:
+        raise SnapshotError(f"{cols}x{rows} board is too large for a snapshot")
+    berserk_timer = game.berserk_anim['timer'] if game.berserk_anim else 0
+    state = STATES.index(game.state) if game.state in STATES else 1
+    return b"".join((
+        _HEADER.pack(MAGIC, VERSION, cols, rows),
+        _STATE.pack(game.score, game.lines_cleared, game.level, game.fall_speed,
+                    game.last_berserk_trigger, berserk_timer, game.berserk_ready,
+                    game.hold_used, state, game.piece_rng.state),
+        _pack_piece(game.current_piece),
+        _pack_piece(game.next_piece),
+        _pack_piece(game.hold_piece),
+        pack_grid(game.grid),
+    ))
+
+
+def decode(data):
+    """Anlık görüntüyü alan sözlüğüne çözer; oyuna dokunmaz."""
+    if len(data) < 5 or data[:4] != MAGIC:
+        raise SnapshotError("not a snapshot")
+    if data[4] not in _LAYOUTS:
+        raise SnapshotError(f"unsupported snapshot version {data[4]}")
+    header, piece = _LAYOUTS[data[4]]
+    if len(data) < header.size:
+        raise SnapshotError("truncated snapshot")
+    magic, version, cols, rows = header.unpack_from(data, 0)
+    offset = header.size
+    grid_size = (cols * rows + 1) // 2
+    if len(data) != offset + _STATE.size + 3*piece.size + grid_size:
+        raise SnapshotError("truncated snapshot")
+    (score, lines, level, fall_speed, berserk_trigger, berserk_timer,
+     berserk_ready, hold_used, state, rng_state) = _STATE.unpack_from(data, offset)
+    offset += _STATE.size
+    pieces = []
+    for _ in range(3):
+        pieces.append(_unpack_piece(data, offset, piece))
+        offset += piece.size
+    return {
+        'grid': unpack_grid(data[offset:], cols, rows),
+        'score': score,
+        'lines_cleared': lines,
+        'level': level,
+        'fall_speed': fall_speed,
+        'last_berserk_trigger': berserk_trigger,
+        'berserk_timer': berserk_timer,
+        'berserk_ready': berserk_ready,
+        'hold_used': hold_used,
+        'state': STATES[state] if state < len(STATES) else "menu",
+        'rng_state': rng_state,
+        'current_piece': pieces[0],
+        'next_piece': pieces[1],
+        'hold_piece': pieces[2],
+    }
+
+
+def restore(game, data):
+    """Anlık görüntüyü oyuna geri yükler ve çözülen durum adını döndürür.
+
+    Animasyon ve efekt durumu sıfırlanır; yalnızca mantıksal durum geri gelir.
+    Başka boyutta bir tahtanın kaydı `SnapshotError` verir.
+    """
+    snap = decode(data)
+    rows, cols = len(snap['grid']), len(snap['grid'][0])
+    if (getattr(game, 'cols', cols), getattr(game, 'rows', rows)) != (cols, rows):
+        raise SnapshotError(f"snapshot is for a {cols}x{rows} board")
+    game.grid = snap['grid']
+    game.grid_version = getattr(game, 'grid_version', 0) + 1
+    game.score = snap['score']
+    game.lines_cleared = snap['lines_cleared']
+    game.level = snap['level']
+    game.fall_speed = snap['fall_speed']
+    game.last_berserk_trigger = snap['last_berserk_trigger']
+    game.berserk_ready = snap['berserk_ready']
+    if snap['berserk_timer']:
+        rows = len(game.grid)
+        game.berserk_anim = {'timer': snap['berserk_timer'], 'lines': [rows-1, rows-2]}
+    else:
+        game.berserk_anim = None
+    game.hold_used = snap['hold_used']
+    game.piece_rng.state = snap['rng_state']
+    game.current_piece = snap['current_piece']
+    game.next_piece = snap['next_piece']
+    game.hold_piece = snap['hold_piece']
+    return snap['state']
+
+
+def save_file(data, path):
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def load_file(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return f.read()
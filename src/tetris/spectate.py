@@ -0,0 +1,473 @@
+"""İzleyici akışı.
+
+Tahtayı büyük ekranlara ucuzca yayınlamak için yalnızca değişiklikleri
+taşıyan ikili bir kayıt akışı. Parça doğma/hareket/döndürme/kilitleme
+olayları, silinen satırlar ve skor güncellemeleri birkaç bayttır; araya
+belirli aralıklarla tam anlık görüntü (keyframe) girer, böylece oyunun
+ortasında bağlanan izleyici bir sonraki keyframe'den itibaren tahtayı kurar.
+
+Kayıt biçimi (sürüm 2; büyük tahtalar için konumlar i16, satırlar u16):
+u8 tür + yük.
+    KEYFRAME 0x01  u8 akış sürümü, u32 uzunluk + snapshot.capture() baytları
+    SPAWN    0x02  u8 aktif parça, u8 sonraki parça
+    MOVE     0x03  i16 x, i16 y
+    ROTATE   0x04  u8 dönüş, i16 x
+    LOCK     0x05  u8 dönüş, i16 x, i16 y
+    CLEAR    0x06  u8 n, n x u16 satır
+    SCORE    0x07  u32 skor, u16 satır
+    HOLD     0x08  u8 hold, u8 aktif, u8 sonraki
+    TICK     0x09  u8 geçen kare sayısı
+    GAMEOVER 0x0A
+    BERSERK  0x0B  alttaki iki satırı sil
+
+Sürüm 1 akışlarının keyframe'i u16 uzunlukla başlar; okuyucu bunları
+`snapshot.SnapshotError` ile reddeder.
+"""
+
+import argparse
+import logging
+import queue
+import random
+import socket
+import struct
+import threading
+import time
+
+from . import snapshot
+from .events import (EventBus, Berserk, BoardReset, GameOver, LinesCleared, PieceHeld, PieceLocked,
+                     PieceMoved, PieceRotated, PieceSpawned)
+from .pieces import PIECES, FallingPiece
+from .rules import Board, SPAWN_X
+
+logger = logging.getLogger(__name__)
+
+VERSION = 2
+
+KEYFRAME, SPAWN, MOVE, ROTATE, LOCK, CLEAR, SCORE, HOLD, TICK, GAMEOVER, BERSERK = range(1, 12)
+
+_KEYFRAME = struct.Struct("<BBI")
+_SCORE = struct.Struct("<BIH")
+_MOVE = struct.Struct("<Bhh")
+_ROTATE = struct.Struct("<BBh")
+_LOCK = struct.Struct("<BBhh")
+
+
+def _piece_index(piece):
+    if piece is None:
+        return 0xFF
+    return next(i for i, p in enumerate(PIECES) if p is piece.piece)
+
+
+def _rotation(piece):
+    shape = piece.piece.shape
+    rotation = 0
+    while shape != piece.shape and rotation < 3:
+        shape = [list(row) for row in zip(*shape[::-1])]
+        rotation += 1
+    return rotation
+
+
+def _make_piece(index, rotation=0, x=SPAWN_X, y=0):
+    if index >= len(PIECES):
+        return None
+    piece = FallingPiece(PIECES[index], x, y)
+    for _ in range(rotation):
+        piece.rotate()
+    return piece
+
+
+class StreamWriter:
+    """Tahta olaylarını kayıtlara çevirir.
+
+    `sink(data, keyframe)` her kayıt grubu için çağrılır; dosyaya yazmak
+    ya da `SpectatorBroadcaster.send` ile yayınlamak için kullanılır.
+    """
+
+    def __init__(self, sink, keyframe_interval=5.0, fps=60):
+        self.sink = sink
+        self.keyframe_frames = int(keyframe_interval * fps)
+        self.fps = fps
+        self.frames = 0
+        self.idle_frames = 0
+        self.buf_frames = 0
+        self.ticked_frames = 0
+        self.since_keyframe = None
+        self.pending_move = None
+        self.buf = bytearray()
+        self.bytes_written = 0
+        self.started = time.time()
+
+    def subscribe(self, events):
+        """Kancaları bir tahtanın olay veriyoluna bağlar."""
+        events.subscribe(PieceSpawned, lambda e: self.spawned(e.board))
+        events.subscribe(PieceMoved, lambda e: self.moved(e.board))
+        events.subscribe(PieceRotated, lambda e: self.rotated(e.board))
+        events.subscribe(PieceLocked, lambda e: self.locked(e.board))
+        events.subscribe(LinesCleared, lambda e: self.cleared(e.board, e.rows))
+        events.subscribe(PieceHeld, lambda e: self.held(e.board))
+        events.subscribe(Berserk, lambda e: self.berserk(e.board))
+        events.subscribe(GameOver, lambda e: self.game_over(e.board))
+        events.subscribe(BoardReset, lambda e: self.keyframe(e.board))
+
+    # -- hooks ---------------------------------------------------------
+    def spawned(self, board):
+        self._emit(bytes((SPAWN, _piece_index(board.current_piece), _piece_index(board.next_piece))))
+
+    def moved(self, board):
+        # Coalesced: only the last position per frame is written
+        piece = board.current_piece
+        self.pending_move = (piece.x, piece.y)
+
+    def rotated(self, board):
+        piece = board.current_piece
+        self._emit(_ROTATE.pack(ROTATE, _rotation(piece), piece.x))
+
+    def locked(self, board):
+        piece = board.current_piece
+        self.pending_move = None
+        self._emit(_LOCK.pack(LOCK, _rotation(piece), piece.x, piece.y))
+
+    def cleared(self, board, rows):
+        if rows:
+            self._emit(struct.pack(f"<BB{len(rows)}H", CLEAR, len(rows), *rows))
+            self._emit(_SCORE.pack(SCORE, board.score, board.lines_cleared))
+
+    def held(self, board):
+        self._emit(bytes((HOLD, _piece_index(board.hold_piece), _piece_index(board.current_piece),
+                          _piece_index(board.next_piece))))
+
+    def berserk(self, board):
+        self._emit(bytes((BERSERK,)))
+
+    def game_over(self, board):
+        self._emit(bytes((GAMEOVER,)))
+        self.flush()
+
+    def keyframe(self, board):
+        """Bir sonraki `frame` çağrısında tam anlık görüntü yazılmasını ister."""
+        self.since_keyframe = None
+
+    def frame(self, board):
+        """Kare sonunda çağrılır: bekleyen hareketi ve gerekirse keyframe'i yazar."""
+        self.frames += 1
+        self.idle_frames += 1
+        if self.since_keyframe is None or self.since_keyframe >= self.keyframe_frames:
+            self.buf.clear()
+            self.buf_frames = 0
+            self.pending_move = None
+            data = snapshot.capture(board)
+            # The keyframe replaces this frame's records but not its time:
+            # earlier frames are ticked before it so replays stay in step
+            self.idle_frames = self.frames - 1 - self.ticked_frames
+            self._tick()
+            self.buf += _KEYFRAME.pack(KEYFRAME, VERSION, len(data)) + data
+            self.since_keyframe = 0
+            self.idle_frames = 1
+            self._flush(keyframe=True)
+            return
+        self.since_keyframe += 1
+        if self.pending_move is not None:
+            self._emit(_MOVE.pack(MOVE, *self.pending_move))
+            self.pending_move = None
+        self._flush()
+
+    def flush(self):
+        """Bekleyen hareketi ve sayılmış ama yazılmamış kareleri hemen yazar."""
+        if self.since_keyframe is None:
+            return
+        if self.pending_move is not None:
+            self._emit(_MOVE.pack(MOVE, *self.pending_move))
+            self.pending_move = None
+        self._tick()
+        self._flush()
+
+    def close(self):
+        self.flush()
+
+    # -- internals -----------------------------------------------------
+    def _emit(self, record):
+        if self.since_keyframe is None:
+            return  # everything before the first keyframe is in it
+        self._tick()
+        if self.pending_move is not None and record[0] != MOVE:
+            pending, self.pending_move = self.pending_move, None
+            self.buf += _MOVE.pack(MOVE, *pending)
+        self.buf += record
+
+    def _tick(self):
+        if self.idle_frames:
+            self.buf_frames += self.idle_frames
+            while self.idle_frames > 255:
+                self.buf += bytes((TICK, 255))
+                self.idle_frames -= 255
+            self.buf += bytes((TICK, self.idle_frames))
+            self.idle_frames = 0
+
+    def _flush(self, keyframe=False):
+        if self.buf:
+            data = bytes(self.buf)
+            self.buf.clear()
+            self.ticked_frames += self.buf_frames
+            self.buf_frames = 0
+            self.bytes_written += len(data)
+            self.sink(data, keyframe)
+
+    def bytes_per_second(self):
+        seconds = self.frames / self.fps
+        return self.bytes_written / seconds if seconds else 0.0
+
+
+class StreamReader:
+    """Akıştan `grid` ve parçaları yeniden kurar; ilk keyframe'e kadar bekler.
+
+    `board` verilirse kayıtlar ona uygulanır; örneğin bir `TetrisGame`
+    verildiğinde kilitleme ve satır silme efektleri de oynar.
+    """
+
+    def __init__(self, board=None):
+        self.board = board
+        self.synced = False
+        self.frames = 0
+        self.buf = bytearray()
+
+    def feed(self, data):
+        self.buf += data
+        buf = self.buf
+        pos = 0
+        while pos < len(buf):
+            kind = buf[pos]
+            size = self._record_size(kind, buf, pos)
+            if size is None or pos + size > len(buf):
+                break
+            self._apply(kind, bytes(buf[pos + 1:pos + size]))
+            pos += size
+        del buf[:pos]
+
+    def replay(self, data):
+        """Kaydı kare kare oynatır; geçen her kare için tahtayı verir.
+
+        Son kareler yazıcı `flush`/`close` ile kapatıldığında kayıttadır.
+        """
+        pos = 0
+        while pos < len(data):
+            kind = data[pos]
+            size = self._record_size(kind, data, pos)
+            if size is None or pos + size > len(data):
+                break
+            if kind == TICK and self.synced:
+                for _ in range(data[pos + 1]):
+                    yield self.board
+            self._apply(kind, bytes(data[pos + 1:pos + size]))
+            pos += size
+
+    @staticmethod
+    def _record_size(kind, buf, pos):
+        if kind == KEYFRAME:
+            if pos + 2 > len(buf):
+                return None
+            if buf[pos + 1] != VERSION:
+                raise snapshot.SnapshotError(f"unsupported stream version {buf[pos + 1]}")
+            if pos + _KEYFRAME.size > len(buf):
+                return None
+            return _KEYFRAME.size + _KEYFRAME.unpack_from(buf, pos)[2]
+        if kind == CLEAR:
+            if pos + 2 > len(buf):
+                return None
+            return 2 + 2 * buf[pos + 1]
+        return {SPAWN: 3, MOVE: 5, ROTATE: 4, LOCK: 6, SCORE: 7, HOLD: 4,
+                TICK: 2, GAMEOVER: 1, BERSERK: 1}.get(kind, 1)
+
+    def _apply(self, kind, payload):
+        if kind == KEYFRAME:
+            data = payload[_KEYFRAME.size - 1:]
+            snap = snapshot.decode(data)
+            rows, cols = len(snap['grid']), len(snap['grid'][0])
+            if self.board is None or (self.board.rows, self.board.cols) != (rows, cols):
+                self.board = Board(cols, rows)
+            self.board.state = snapshot.restore(self.board, data)
+            self.synced = True
+            return
+        board = self.board
+        if not self.synced:
+            return
+        if kind == TICK:
+            self.frames += payload[0]
+        elif kind == SPAWN:
+            board.current_piece = _make_piece(payload[0], x=board.spawn_x)
+            board.next_piece = _make_piece(payload[1], x=board.spawn_x)
+        elif kind == MOVE:
+            board.current_piece.x, board.current_piece.y = struct.unpack("<hh", payload)
+        elif kind == ROTATE:
+            rotation, x = struct.unpack("<Bh", payload)
+            piece = board.current_piece
+            board.current_piece = _make_piece(_piece_index(piece), rotation, x, piece.y)
+        elif kind == LOCK:
+            rotation, x, y = struct.unpack("<Bhh", payload)
+            board.current_piece = _make_piece(_piece_index(board.current_piece), rotation, x, y)
+            board.lock_piece()
+        elif kind == CLEAR:
+            board.clear_lines()
+        elif kind == SCORE:
+            board.score, board.lines_cleared = struct.unpack("<IH", payload)
+            board.update_level()
+        elif kind == HOLD:
+            board.hold_piece = _make_piece(payload[0], x=board.spawn_x)
+            board.current_piece = _make_piece(payload[1], x=board.spawn_x)
+            board.next_piece = _make_piece(payload[2], x=board.spawn_x)
+        elif kind == BERSERK:
+            for _ in range(2):
+                board.grid.pop()
+                board.grid.insert(0, [None] * board.cols)
+            board.grid_version += 1
+            board.touch_rows(0, board.rows - 1)
+        elif kind == GAMEOVER:
+            board.state = "gameover"
+
+
+class RecordedBoard(Board):
+    """Olayları bir `StreamWriter`'a giden başsız tahta.
+
+    Yazıcı, `TetrisGame`'deki gibi tahtanın olaylarına abonedir; kayıt
+    araçları ve bant genişliği ölçümü bunu kullanır.
+    """
+
+    def __init__(self, writer, **kwargs):
+        self.writer = writer
+        events = EventBus()
+        writer.subscribe(events)
+        super().__init__(events=events, **kwargs)
+
+
+class SpectatorBroadcaster:
+    """Akışı TCP izleyicilerine arka plan iş parçacığında gönderir.
+
+    Oyun iş parçacığı yalnızca kuyruğa ekler ve hiç beklemez. Yeni bağlanan
+    izleyici ilk keyframe'den itibaren veri alır. İzleyiciler geride kalıp
+    kuyruk dolarsa kayıtlar bir sonraki keyframe'e kadar atılır; keyframe
+    tahtayı baştan kurduğu için izleyiciler oradan devam eder. Gönderimi
+    `SEND_TIMEOUT` saniyeden uzun süren izleyicinin bağlantısı kesilir.
+    """
+
+    MAX_QUEUED = 256   # record groups, about one per frame
+    SEND_TIMEOUT = 2.0
+
+    def __init__(self, host="0.0.0.0", port=7778, max_queued=MAX_QUEUED):
+        self.server = socket.create_server((host, port))
+        self.queue = queue.Queue(max_queued)
+        self.dropping = False
+        self.dropped = 0
+        self.closed = False
+        self.viewers = []    # [socket, synced]
+        self.lock = threading.Lock()
+        threading.Thread(target=self._accept, name="spectate-accept", daemon=True).start()
+        self.sender = threading.Thread(target=self._send_loop, name="spectate-send", daemon=True)
+        self.sender.start()
+
+    def send(self, data, keyframe=False):
+        if self.closed or (self.dropping and not keyframe):
+            return
+        try:
+            self.queue.put_nowait((data, keyframe))
+            self.dropping = False
+        except queue.Full:
+            if not self.dropping:
+                logger.warning("spectators are behind; skipping to the next keyframe")
+            self.dropping = True
+            self.dropped += 1
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.settimeout(self.SEND_TIMEOUT)
+            with self.lock:
+                self.viewers.append([conn, False])
+
+    def _send_loop(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            data, keyframe = item
+            with self.lock:
+                viewers = list(self.viewers)
+            for viewer in viewers:
+                conn, synced = viewer
+                if not synced and not keyframe:
+                    continue
+                viewer[1] = True
+                try:
+                    conn.sendall(data)
+                except OSError:
+                    with self.lock:
+                        if viewer in self.viewers:
+                            self.viewers.remove(viewer)
+                    conn.close()
+
+    def close(self):
+        self.closed = True
+        self.server.close()
+        while True:
+            try:
+                self.queue.put_nowait(None)
+                break
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+        self.sender.join(self.SEND_TIMEOUT)
+        with self.lock:
+            for conn, _ in self.viewers:
+                conn.close()
+            self.viewers.clear()
+
+
+# -- bandwidth measurement ---------------------------------------------
+
+def measure_bandwidth(seconds=120, fps=60, seed=1):
+    """Rastgele hamle yapan bir oyuncuyla akışın bayt/saniye değerini ölçer."""
+    rng = random.Random(seed)
+    reader = StreamReader()
+    writer = StreamWriter(lambda data, keyframe: reader.feed(data), fps=fps)
+    board = RecordedBoard(writer, seed=seed)
+    fall_ms = 0.0
+    for _ in range(int(seconds * fps)):
+        if board.state == "gameover":
+            board.reset_board()
+        # About four inputs per second
+        if rng.random() < 4 / fps:
+            action = rng.choice("LLRRU D")
+            if action == "L":
+                board.try_move(-1, 0)
+            elif action == "R":
+                board.try_move(1, 0)
+            elif action == "U":
+                board.try_rotate()
+            elif action == " ":
+                board.hard_drop()
+            else:
+                board.try_move(0, 1)
+        fall_ms += 1000 / fps
+        if fall_ms >= board.fall_speed:
+            fall_ms = 0.0
+            board.gravity_step()
+        board.update_level()
+        writer.frame(board)
+    in_sync = reader.board is not None and reader.board.grid == board.grid
+    return writer.bytes_per_second(), in_sync
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.spectate")
+    parser.add_argument("--seconds", type=float, default=120)
+    args = parser.parse_args(argv)
+    bps, in_sync = measure_bandwidth(args.seconds)
+    print(f"{bps:.1f} bytes/s per spectator (reader in sync: {in_sync})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Üretilen yüzeyler için merkezi önbellek.
+
+Çizim kodunun kare başına yeniden oluşturduğu yüzeyler (yazılar, ölçeklenmiş
+parıltılar, blok ve iz kareleri, element efektleri, karartma katmanları) tek
+bir `SurfaceCache` içinde tutulur. Anahtar (varlık, boyut, varyant, pencere
+ölçeği) dörtlüsüdür; her girdinin piksel baytı sayılır ve toplam
+`TETRIS_SURFACE_CACHE_MB` bütçesini aşınca en uzun süredir kullanılmayanlar
+atılır. 4K tam ekranda veya 1 GB'lık bir Android cihazda da bellek sınırlı
+kalır.
+
+Pencere boyutu değiştiğinde veya tam ekrana geçildiğinde görüntü biçimi ve
+ölçek değişebilir; o zaman bütün girdiler birlikte atılır. İsabet, ıska,
+atma ve toplu temizleme sayaçları telemetride ve F3 raporunda görünür.
+"""
+
+import logging
+from collections import OrderedDict
+
+import pygame
+
+from . import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _finish(surf):
+    # Match the display format when there is one; headless tools may not have it
+    if not pygame.display.get_surface():
+        return surf
+    # Opaque surfaces stay opaque so a per-surface alpha can fade them
+    return surf.convert_alpha() if surf.get_flags() & pygame.SRCALPHA else surf.convert()
+
+
+class SurfaceCache:
+    def __init__(self, budget_mb=None):
+        budget_mb = budget_mb or settings.SURFACE_CACHE['budget_mb']
+        self.budget = int(budget_mb * 1024 * 1024)
+        self.entries = OrderedDict()  # (asset, size, variant, scale) -> surface, oldest first
+        self.bytes = 0
+        self.scale = 1.0
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def get(self, asset, size, variant, make):
+        """Önbellekteki yüzeyi döndürür; yoksa `make()` ile üretip saklar."""
+        key = (asset, size, variant, self.scale)
+        surf = self.entries.get(key)
+        if surf is not None:
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return surf
+        self.stats['misses'] += 1
+        surf = self.entries[key] = _finish(make())
+        self.bytes += surf.get_pitch() * surf.get_height()
+        while self.bytes > self.budget and len(self.entries) > 1:
+            _, old = self.entries.popitem(last=False)
+            self.bytes -= old.get_pitch() * old.get_height()
+            self.stats['evictions'] += 1
+        return surf
+
+    def text(self, font, name, text, color):
+        """`font.render` sonucu; `name` yazı tipinin önbellekteki adıdır."""
+        return self.get(name, font.get_height(), (text, color), lambda: font.render(text, True, color))
+
+    def invalidate(self, scale=None):
+        """Bütün girdileri atar; pencere ölçeği verildiyse yeni anahtarlar onu kullanır."""
+        self.entries.clear()
+        self.bytes = 0
+        if scale is not None:
+            self.scale = scale
+        self.stats['invalidations'] += 1
+
+    def report(self):
+        s = self.stats
+        lookups = s['hits'] + s['misses']
+        return (f"surfaces: {len(self.entries)} entries, {self.bytes / 1024 / 1024:.1f} / "
+                f"{self.budget / 1024 / 1024:.0f} MB, hit rate {s['hits'] / max(1, lookups):.1%}, "
+                f"{s['misses']} misses, {s['evictions']} evictions, {s['invalidations']} invalidations")
+
+    def log_report(self):
+        logger.info("%s", self.report())
@@ -0,0 +1,177 @@
+"""Canlı telemetri.
+
+Oyun iş parçacığı yalnızca basit sayaçları artırır; isteğe bağlı yerel HTTP
+sunucusu ayrı bir daemon iş parçacığında bu değerleri Prometheus metin
+biçiminde sunar. Sunucu oyunla hiçbir kilit paylaşmaz.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .events import GameOver, LinesCleared, PieceLocked, PieceSpawned
+
+logger = logging.getLogger(__name__)
+
+FRAME_BUCKETS_MS = (4, 8, 12, 16.7, 20, 25, 33.4, 50, 100)
+
+
+class Telemetry:
+    def __init__(self):
+        self.started = time.time()
+        self.pieces_placed = 0
+        self.pieces_spawned = 0
+        self.lines_by_size = [0, 0, 0, 0, 0]
+        self.games_started = 0
+        self.games_over = 0
+        self.actions = 0
+        self.frames = 0
+        self.frame_buckets = [0] * (len(FRAME_BUCKETS_MS) + 1)
+        self.frame_ms_sum = 0.0
+        self.asset_load = {}
+        self.surfaces = None  # SurfaceCache, read for its counters
+        # Per-session gauges
+        self.level = 1
+        self.score = 0
+        self.particles = 0
+        self.session_pieces = 0
+        self.session_actions = 0
+        self.session_play_seconds = 0.0
+
+    def subscribe(self, events):
+        """Parça ve satır sayaçlarını bir tahtanın olay veriyoluna bağlar."""
+        events.subscribe(PieceSpawned, lambda e: self.piece_spawned())
+        events.subscribe(PieceLocked, lambda e: self.piece_locked())
+        events.subscribe(LinesCleared, lambda e: self.lines_cleared(len(e.rows)))
+        events.subscribe(GameOver, lambda e: self.game_over())
+
+    # -- hooks called from the game thread ---------------------------
+    def new_session(self):
+        self.games_started += 1
+        self.session_pieces = 0
+        self.session_actions = 0
+        self.session_play_seconds = 0.0
+
+    def piece_locked(self):
+        self.pieces_placed += 1
+        self.session_pieces += 1
+
+    def piece_spawned(self):
+        self.pieces_spawned += 1
+
+    def lines_cleared(self, count):
+        if count:
+            self.lines_by_size[min(count, 4)] += 1
+
+    def action(self):
+        self.actions += 1
+        self.session_actions += 1
+
+    def game_over(self):
+        self.games_over += 1
+
+    def frame(self, frame_ms, playing, particles, level, score):
+        self.frames += 1
+        self.frame_ms_sum += frame_ms
+        self.frame_buckets[bisect.bisect_left(FRAME_BUCKETS_MS, frame_ms)] += 1
+        if playing:
+            self.session_play_seconds += frame_ms / 1000
+        self.particles = particles
+        self.level = level
+        self.score = score
+
+    def timed_load(self, name, loader, *args):
+        start = time.perf_counter()
+        result = loader(*args)
+        self.asset_load[name] = time.perf_counter() - start
+        return result
+
+    # -- exposition (server thread) ----------------------------------
+    def render(self):
+        play = self.session_play_seconds
+        pps = self.session_pieces / play if play > 0 else 0.0
+        apm = self.session_actions * 60 / play if play > 0 else 0.0
+        out = []
+
+        def metric(name, kind, help_text, samples):
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                out.append(f"{name}{labels} {value}")
+
+        metric("tetris_uptime_seconds", "gauge", "Seconds since the game started.",
+               [("", round(time.time() - self.started, 3))])
+        metric("tetris_games_started_total", "counter", "Games started.", [("", self.games_started)])
+        metric("tetris_games_over_total", "counter", "Games ended by top-out.", [("", self.games_over)])
+        metric("tetris_pieces_placed_total", "counter", "Pieces locked into the grid.", [("", self.pieces_placed)])
+        metric("tetris_pieces_spawned_total", "counter", "Pieces spawned.", [("", self.pieces_spawned)])
+        metric("tetris_line_clears_total", "counter", "Line clears by number of rows cleared at once.",
+               [(f'{{size="{i}"}}', self.lines_by_size[i]) for i in range(1, 5)])
+        metric("tetris_actions_total", "counter", "Player input actions.", [("", self.actions)])
+        metric("tetris_level", "gauge", "Current level.", [("", self.level)])
+        metric("tetris_score", "gauge", "Current score.", [("", self.score)])
+        metric("tetris_pieces_per_second", "gauge", "Pieces per second of play this session.", [("", round(pps, 4))])
+        metric("tetris_actions_per_minute", "gauge", "Actions per minute of play this session.", [("", round(apm, 2))])
+        metric("tetris_particles", "gauge", "Live particles.", [("", self.particles)])
+        buckets = list(self.frame_buckets)
+        cumulative = 0
+        samples = []
+        for le, count in zip(FRAME_BUCKETS_MS, buckets):
+            cumulative += count
+            samples.append((f'_bucket{{le="{le}"}}', cumulative))
+        cumulative += buckets[-1]
+        samples.append(('_bucket{le="+Inf"}', cumulative))
+        samples.append(("_sum", round(self.frame_ms_sum, 3)))
+        samples.append(("_count", cumulative))
+        metric("tetris_frame_time_ms", "histogram", "Frame time in milliseconds.", samples)
+        metric("tetris_asset_load_seconds", "gauge", "Time spent loading each asset group.",
+               [(f'{{asset="{name}"}}', round(sec, 6)) for name, sec in list(self.asset_load.items())])
+        if self.surfaces is not None:
+            stats = dict(self.surfaces.stats)
+            for name in ('hits', 'misses', 'evictions', 'invalidations'):
+                metric(f"tetris_surface_cache_{name}_total", "counter", f"Surface cache {name}.",
+                       [("", stats[name])])
+            metric("tetris_surface_cache_bytes", "gauge", "Pixel bytes held by the surface cache.",
+                   [("", self.surfaces.bytes)])
+        return "\n".join(out) + "\n"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    telemetry = None
+
+    def do_GET(self):
+        if self.path not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.telemetry.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+class TelemetryServer:
+    def __init__(self, telemetry, host="127.0.0.1", port=9108):
+        handler = type("TelemetryHandler", (_Handler,), {"telemetry": telemetry})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="telemetry", daemon=True)
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1]
+
+    def start(self):
+        self.thread.start()
+        logger.info("telemetry on http://%s:%d/metrics", *self.httpd.server_address[:2])
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
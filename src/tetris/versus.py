@@ -0,0 +1,413 @@
+"""Yerel ağ versus sunucusu.
+
+Bir asyncio sunucusu, `rules.Board` üzerinde çok sayıda eşzamanlı maçı
+60 Hz'de yürütür. Silinen satırlar rakiplere çöp satırı olarak gider;
+istemciler TCP üzerinden eylem gönderir ve yalnızca değişen satırları içeren
+durum farklarını alır. Her çekirdek için ayrı bir süreç ve olay döngüsü
+çalışır (Linux'ta SO_REUSEPORT ile aynı portu paylaşırlar); maçlar her
+sürecin kendi bekleme odasında eşleşir.
+
+Kullanım:
+    python -m tetris.versus serve --port 7777 --workers 4
+    python -m tetris.versus bench
+
+Çerçeve biçimi (little-endian): u16 yük uzunluğu, u8 tür, yük.
+    JOIN    (1)  u8 oda boyutu (2 = birebir, >2 = battle royale)
+    ACTION  (2)  eylem baytları: L R D U (döndür) ' ' (anında düşür) C (hold)
+    STATS   (3)  boş; sunucu JSON ile yanıtlar
+    WELCOME (10) u8 slot, u8 oyuncu sayısı, u8 sütun, u8 satır
+    DELTA   (11) _DELTA başlığı + [u8 satır, paketli satır]...
+    END     (13) u8 kazanan slot (0xFF = yok)
+    STATS_REPLY (14) JSON
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import struct
+import sys
+import time
+from collections import deque
+
+from .pieces import PIECES
+from .rules import Board
+
+TICK_HZ = 60
+TICK_MS = 1000 / TICK_HZ
+# Garbage rows sent for 0..4 cleared lines
+GARBAGE_TABLE = (0, 0, 1, 2, 4)
+MAX_ACTIONS_PER_TICK = 8
+# Actions a session may have waiting; one second of input at the tick cap
+MAX_QUEUED_ACTIONS = MAX_ACTIONS_PER_TICK * TICK_HZ
+MAX_WRITE_BUFFER = 1 << 20
+
+JOIN, ACTION, STATS = 1, 2, 3
+WELCOME, DELTA, END, STATS_REPLY = 10, 11, 13, 14
+
+_FRAME = struct.Struct("<HB")
+_WELCOME = struct.Struct("<BBBB")
+# slot, tick, score, lines, level, state, piece index, rotation, x, y, changed rows
+_DELTA = struct.Struct("<BIIHBBBBbbB")
+_NO_PIECE = 0xFF
+_STATES = {"playing": 0, "gameover": 1}
+
+
+def encode(kind, payload=b""):
+    return _FRAME.pack(len(payload), kind) + payload
+
+
+async def read_frame(reader):
+    size, kind = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+    payload = await reader.readexactly(size) if size else b""
+    return kind, payload
+
+
+def pack_row(row):
+    # One nibble per cell, same encoding as snapshot.pack_grid
+    cells = [0 if c is None else c + 1 for c in row]
+    if len(cells) % 2:
+        cells.append(0)
+    return bytes((cells[i] << 4) | cells[i + 1] for i in range(0, len(cells), 2))
+
+
+def piece_key(piece):
+    if piece is None:
+        return (_NO_PIECE, 0, 0, 0)
+    index = next(i for i, p in enumerate(PIECES) if p is piece.piece)
+    shape = piece.piece.shape
+    rotation = 0
+    while shape != piece.shape and rotation < 3:
+        shape = [list(r) for r in zip(*shape[::-1])]
+        rotation += 1
+    return (index, rotation, piece.x, piece.y)
+
+
+class Session:
+    def __init__(self, writer, seed):
+        self.writer = writer
+        self.board = Board(seed=seed)
+        # Full queue drops the oldest actions, so a flooding peer cannot grow memory
+        self.actions = deque(maxlen=MAX_QUEUED_ACTIONS)
+        self.fall_ms = 0.0
+        self.slot = 0
+        self.match = None
+        # Nibble-packed copy of the rows last sent to viewers, used for deltas;
+        # Board.grid itself is a plain list of lists with one object per cell
+        self.rows_sent = [None] * self.board.rows
+        self.version_sent = None
+        self.head_sent = None
+
+    @property
+    def alive(self):
+        return self.board.state != "gameover"
+
+    def apply(self, action):
+        board = self.board
+        if action == ord('L'):
+            board.try_move(-1, 0)
+        elif action == ord('R'):
+            board.try_move(1, 0)
+        elif action == ord('D'):
+            if not board.try_move(0, 1):
+                return board.gravity_step()
+        elif action == ord('U'):
+            board.try_rotate()
+        elif action == ord(' '):
+            return board.hard_drop()
+        elif action == ord('C'):
+            board.hold_current_piece()
+        return None
+
+    def delta(self, tick):
+        board = self.board
+        changed = []
+        if board.grid_version != self.version_sent:
+            self.version_sent = board.grid_version
+            for y, row in enumerate(board.grid):
+                packed = pack_row(row)
+                if packed != self.rows_sent[y]:
+                    self.rows_sent[y] = packed
+                    changed.append(bytes((y,)) + packed)
+        head = (board.score, board.lines_cleared, board.level, _STATES.get(board.state, 0),
+                piece_key(board.current_piece))
+        if not changed and head == self.head_sent:
+            return None
+        self.head_sent = head
+        score, lines, level, state, (index, rotation, x, y) = head
+        return encode(DELTA, _DELTA.pack(self.slot, tick, score, lines, level, state,
+                                         index, rotation, x, y, len(changed)) + b"".join(changed))
+
+
+class Match:
+    def __init__(self, sessions, seed=None):
+        self.sessions = sessions
+        self.rng = random.Random(seed)
+        self.over = False
+        cols, rows = sessions[0].board.cols, sessions[0].board.rows
+        for slot, session in enumerate(sessions):
+            session.slot = slot
+            session.match = self
+            send(session, encode(WELCOME, _WELCOME.pack(slot, len(sessions), cols, rows)))
+
+    def _send_garbage(self, sender, cleared):
+        count = GARBAGE_TABLE[min(len(cleared), 4)]
+        targets = [s for s in self.sessions if s is not sender and s.alive]
+        if not count or not targets:
+            return
+        target = targets[0] if len(self.sessions) == 2 else self.rng.choice(targets)
+        target.board.add_garbage(count, self.rng.randrange(target.board.cols))
+
+    def tick(self, tick):
+        for session in self.sessions:
+            if not session.alive:
+                continue
+            board = session.board
+            for _ in range(min(len(session.actions), MAX_ACTIONS_PER_TICK)):
+                cleared = session.apply(session.actions.popleft())
+                if cleared:
+                    self._send_garbage(session, cleared)
+                if not session.alive:
+                    break
+            session.fall_ms += TICK_MS
+            while session.alive and session.fall_ms >= board.fall_speed:
+                session.fall_ms -= board.fall_speed
+                cleared = board.gravity_step()
+                if cleared:
+                    self._send_garbage(session, cleared)
+            board.update_level()
+        frames = [d for d in (s.delta(tick) for s in self.sessions) if d]
+        if frames:
+            data = b"".join(frames)
+            for session in self.sessions:
+                send(session, data)
+        alive = [s for s in self.sessions if s.alive]
+        if len(alive) <= (1 if len(self.sessions) > 1 else 0):
+            winner = alive[0].slot if alive else 0xFF
+            for session in self.sessions:
+                send(session, encode(END, bytes((winner,))))
+                session.match = None
+                session.actions.clear()
+            self.over = True
+
+
+def send(session, data):
+    writer = session.writer
+    if writer is None or writer.is_closing():
+        return
+    if writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+        # Never let a slow viewer hold memory or time on the tick loop
+        writer.close()
+        return
+    writer.write(data)
+
+
+class VersusServer:
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.waiting = {}
+        self.matches = []
+        self.sessions = 0
+        self.tick_no = 0
+        self.tick_ms = deque(maxlen=TICK_HZ * 10)
+        self.overruns = 0
+
+    async def handle(self, reader, writer):
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        session = None
+        self.sessions += 1
+        try:
+            while True:
+                kind, payload = await read_frame(reader)
+                if kind == JOIN and session is None:
+                    size = max(1, payload[0] if payload else 2)
+                    session = Session(writer, self.rng.getrandbits(32))
+                    room = self.waiting.setdefault(size, [])
+                    room.append(session)
+                    if len(room) >= size:
+                        self.matches.append(Match(room[:size], self.rng.getrandbits(32)))
+                        del room[:size]
+                elif kind == ACTION and session is not None and session.match is not None:
+                    session.actions.extend(payload[:MAX_ACTIONS_PER_TICK * 4])
+                elif kind == STATS:
+                    writer.write(encode(STATS_REPLY, json.dumps(self.stats()).encode()))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.sessions -= 1
+            if session is not None:
+                session.writer = None
+                session.board.state = "gameover"
+                for room in self.waiting.values():
+                    if session in room:
+                        room.remove(session)
+            writer.close()
+
+    def stats(self):
+        samples = sorted(self.tick_ms)
+        mean = sum(samples) / len(samples) if samples else 0.0
+        return {
+            'pid': os.getpid(),
+            'sessions': self.sessions,
+            'matches': len(self.matches),
+            'tick': self.tick_no,
+            'tick_ms_mean': round(mean, 3),
+            'tick_ms_p99': round(samples[int(len(samples) * 0.99)] if samples else 0.0, 3),
+            'load': round(mean / TICK_MS, 3),
+            'overruns': self.overruns,
+        }
+
+    async def tick_loop(self):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            start = time.perf_counter()
+            self.tick_no += 1
+            for match in self.matches:
+                match.tick(self.tick_no)
+            if any(m.over for m in self.matches):
+                self.matches = [m for m in self.matches if not m.over]
+            self.tick_ms.append((time.perf_counter() - start) * 1000)
+            deadline += 1 / TICK_HZ
+            delay = deadline - loop.time()
+            if delay < 0:
+                self.overruns += 1
+                deadline = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+
+async def _serve(host, port, reuse_port, ready=None):
+    server = VersusServer()
+    srv = await asyncio.start_server(server.handle, host, port, reuse_port=reuse_port)
+    if ready is not None:
+        ready.set()
+    async with srv:
+        await asyncio.gather(srv.serve_forever(), server.tick_loop())
+
+
+def run_worker(host, port, reuse_port=False, ready=None):
+    try:
+        asyncio.run(_serve(host, port, reuse_port, ready))
+    except KeyboardInterrupt:
+        pass
+
+
+def serve(host="0.0.0.0", port=7777, workers=None):
+    """Her çekirdek için bir olay döngüsü başlatır."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or not hasattr(socket, 'SO_REUSEPORT'):
+        run_worker(host, port)
+        return
+    procs = [multiprocessing.Process(target=run_worker, args=(host, port, True), daemon=True)
+             for _ in range(workers)]
+    for p in procs:
+        p.start()
+    try:
+        for p in procs:
+            p.join()
+    except KeyboardInterrupt:
+        for p in procs:
+            p.terminate()
+
+
+# -- loopback load test ------------------------------------------------
+
+async def _bench_client(host, port, room, stop, rng):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(encode(JOIN, bytes((room,))))
+    received = 0
+
+    async def drain():
+        nonlocal received
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            received += len(data)
+
+    task = asyncio.create_task(drain())
+    # About six actions per second, like a steady human player
+    while not stop.is_set():
+        await asyncio.sleep(rng.uniform(0.1, 0.23))
+        writer.write(encode(ACTION, bytes((rng.choice(b"LRDU LR"),))))
+    task.cancel()
+    writer.close()
+    return received
+
+
+async def _query_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(encode(STATS))
+    kind, payload = await read_frame(reader)
+    writer.close()
+    return json.loads(payload)
+
+
+async def _bench_step(host, port, sessions, seconds, rng):
+    stop = asyncio.Event()
+    clients = [asyncio.create_task(_bench_client(host, port, 2, stop, rng)) for _ in range(sessions)]
+    await asyncio.sleep(1.0)
+    before = await _query_stats(host, port)
+    await asyncio.sleep(seconds)
+    stats = await _query_stats(host, port)
+    stop.set()
+    results = await asyncio.gather(*clients, return_exceptions=True)
+    received = sum(r for r in results if isinstance(r, int))
+    stats['overruns_in_step'] = stats['overruns'] - before['overruns']
+    stats['bytes_per_session_s'] = round(received / max(1, sessions) / (seconds + 1.0), 1)
+    await asyncio.sleep(0.5)
+    return stats
+
+
+def bench(steps=(50, 100, 200, 400, 800, 1600), seconds=3.0, host="127.0.0.1"):
+    """Tek çekirdekli bir sunucuya karşı 60 Hz oturum sayısını artırarak ölçer."""
+    with socket.socket() as s:
+        s.bind((host, 0))
+        port = s.getsockname()[1]
+    ctx = multiprocessing.get_context("spawn")
+    ready = ctx.Event()
+    proc = ctx.Process(target=run_worker, args=(host, port, False, ready), daemon=True)
+    proc.start()
+    ready.wait(10)
+    rng = random.Random(1)
+    sustained = 0
+    print(f"{'sessions':>8} {'tick ms':>8} {'p99 ms':>8} {'load':>6} {'overruns':>8} {'B/s/session':>12}")
+    try:
+        for n in steps:
+            stats = asyncio.run(_bench_step(host, port, n, seconds, rng))
+            print(f"{n:8d} {stats['tick_ms_mean']:8.3f} {stats['tick_ms_p99']:8.3f} "
+                  f"{stats['load']:6.2f} {stats['overruns_in_step']:8d} {stats['bytes_per_session_s']:12.1f}")
+            if stats['load'] >= 1.0 or stats['overruns_in_step'] > seconds * TICK_HZ * 0.01:
+                break
+            sustained = n
+    finally:
+        proc.terminate()
+    print(f"one core sustains at least {sustained} concurrent 60 Hz sessions")
+    return sustained
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.versus")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_serve = sub.add_parser("serve")
+    p_serve.add_argument("--host", default="0.0.0.0")
+    p_serve.add_argument("--port", type=int, default=7777)
+    p_serve.add_argument("--workers", type=int, default=0)
+    p_bench = sub.add_parser("bench")
+    p_bench.add_argument("--seconds", type=float, default=3.0)
+    p_bench.add_argument("--steps", type=int, nargs="+", default=[50, 100, 200, 400, 800, 1600])
+    args = parser.parse_args(argv)
+    if args.cmd == "serve":
+        serve(args.host, args.port, args.workers or None)
+    else:
+        bench(tuple(args.steps), args.seconds)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
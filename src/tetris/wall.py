@@ -0,0 +1,272 @@
+"""Çoklu tahta izleme duvarı.
+
+Turnuva ve salon izleme için tek pencerede 16-100 canlı tahtayı küçük
+ölçekte gösterir. Her tahta hücre başına bir piksellik bir yüzeye tek bir
+`pygame.image.frombuffer` yazımıyla çizilir ve en yakın komşu ölçeklemeyle
+büyütülür. Yalnızca son kareden beri değişen tahtalar yeniden çizilir ve
+ekrana yalnızca onların dikdörtgenleri gönderilir.
+
+Kullanım:
+    python -m tetris.wall --boards 100
+    python -m tetris.wall --connect 10.0.0.5:7778 10.0.0.6:7778
+"""
+
+import argparse
+import logging
+import math
+import queue
+import random
+import socket
+import struct
+import threading
+import time
+
+import pygame
+
+from . import settings
+from .rules import Board
+from .snapshot import SnapshotError
+from .spectate import StreamReader
+
+logger = logging.getLogger(__name__)
+
+EMPTY = (24, 24, 32)
+PIECE_TINT = 60
+LABEL_HEIGHT = 14
+
+
+def _palette():
+    cells = {None: bytes(EMPTY)}
+    active = {}
+    for i, color in enumerate(settings.COLORS):
+        cells[i] = bytes(color)
+        active[i] = bytes(min(255, c + PIECE_TINT) for c in color)
+    return cells, active
+
+
+class BoardTile:
+    def __init__(self, source, rect):
+        self.source = source   # callable returning the current Board (or None)
+        self.rect = pygame.Rect(rect)
+        self.key = None
+        self.label_key = None
+        self.label = None
+
+    def board_key(self, board):
+        piece = board.current_piece
+        coords = tuple(piece.get_coords()) if piece else ()
+        return (board.grid_version, coords, board.state)
+
+
+class SpectatorWall:
+    def __init__(self, surface, sources, font=None, gap=4):
+        self.surface = surface
+        self.font = font or pygame.font.SysFont("Arial", 11)
+        self.palette, self.active_palette = _palette()
+        self.tiles = []
+        self.frame_ms = 0.0
+        self.redrawn = 0
+        self.layout(sources, gap)
+
+    def layout(self, sources, gap=4):
+        w, h = self.surface.get_size()
+        n = max(1, len(sources))
+        aspect = settings.DEFAULT_WIDTH / (settings.DEFAULT_HEIGHT - 60)
+        # Pick the column count that gives the largest tiles
+        best = None
+        for cols in range(1, n + 1):
+            rows = math.ceil(n / cols)
+            tw = (w - gap) // cols - gap
+            th = (h - gap) // rows - gap - LABEL_HEIGHT
+            tw = min(tw, int(th * aspect))
+            if tw > 0 and (best is None or tw > best[0]):
+                best = (tw, cols)
+        if best is None:
+            # Window too small for any grid: one-pixel tiles in a square grid, clipped at the edges
+            best = (1, math.ceil(math.sqrt(n)))
+        tw, cols = best
+        th = max(1, int(tw / aspect))
+        self.tiles = []
+        for i, source in enumerate(sources):
+            cx, cy = i % cols, i // cols
+            rect = (gap + cx * (tw + gap), gap + cy * (th + LABEL_HEIGHT + gap), tw, th)
+            self.tiles.append(BoardTile(source, rect))
+        self.surface.fill((0, 0, 0))
+        pygame.display.flip()
+
+    def render_board(self, board):
+        # One buffer write per board: one RGB pixel per cell
+        cells = self.palette
+        buf = bytearray(b"".join(cells[c] for row in board.grid for c in row))
+        piece = board.current_piece
+        if piece is not None and board.state != "gameover":
+            color = self.active_palette[piece.color_index]
+            for x, y in piece.get_coords():
+                if 0 <= x < board.cols and 0 <= y < board.rows:
+                    i = (y * board.cols + x) * 3
+                    buf[i:i + 3] = color
+        return pygame.image.frombuffer(bytes(buf), (board.cols, board.rows), "RGB")
+
+    def draw(self):
+        """Değişen tahtaları çizer ve güncellenen dikdörtgenleri döndürür."""
+        start = time.perf_counter()
+        dirty = []
+        for tile in self.tiles:
+            board = tile.source()
+            if board is None:
+                continue
+            key = tile.board_key(board)
+            if key != tile.key:
+                tile.key = key
+                small = self.render_board(board)
+                self.surface.blit(pygame.transform.scale(small, tile.rect.size), tile.rect)
+                if board.state == "gameover":
+                    self.surface.fill((90, 0, 0), tile.rect, special_flags=pygame.BLEND_RGB_ADD)
+                dirty.append(tile.rect)
+            label_key = (board.score, board.level)
+            if label_key != tile.label_key:
+                tile.label_key = label_key
+                label_rect = pygame.Rect(tile.rect.x, tile.rect.bottom, tile.rect.width, LABEL_HEIGHT)
+                self.surface.fill((0, 0, 0), label_rect)
+                text = self.font.render(f"{board.score}  L{board.level}", True, (220, 220, 220))
+                self.surface.blit(text, label_rect.topleft, area=pygame.Rect(0, 0, label_rect.width, LABEL_HEIGHT))
+                dirty.append(label_rect)
+        self.redrawn = len(dirty)
+        self.frame_ms = (time.perf_counter() - start) * 1000
+        return dirty
+
+
+# -- sources -------------------------------------------------------------
+
+class BotBoard:
+    """Duvarı beslemek için rastgele oynayan başsız tahta."""
+
+    def __init__(self, seed, fps=60):
+        self.board = Board(seed=seed)
+        self.rng = random.Random(seed)
+        self.fall_ms = 0.0
+        self.fps = fps
+
+    def step(self):
+        board = self.board
+        if board.state == "gameover":
+            board.reset_board()
+        if self.rng.random() < 4 / self.fps:
+            action = self.rng.choice("LRU ")
+            if action == "L":
+                board.try_move(-1, 0)
+            elif action == "R":
+                board.try_move(1, 0)
+            elif action == "U":
+                board.try_rotate()
+            else:
+                board.hard_drop()
+        self.fall_ms += 1000 / self.fps
+        if self.fall_ms >= board.fall_speed:
+            self.fall_ms = 0.0
+            board.gravity_step()
+        board.update_level()
+
+    def __call__(self):
+        return self.board
+
+
+class StreamSource:
+    """Bir izleyici akışına bağlanır; baytlar arka planda alınır, tahta ana iş parçacığında kurulur.
+
+    Alıcı iş parçacığı yalnızca kuyruğa ekler; kayıtlar duvar tahtayı
+    istediğinde uygulanır, böylece çizim sırasında tahta değişmez. Akış
+    biterse ya da bozulursa bu bir kez loglanır ve tahta son haliyle kalır.
+    """
+
+    def __init__(self, host, port):
+        self.name = f"{host}:{port}"
+        self.reader = StreamReader()
+        self.received = queue.SimpleQueue()
+        self.lost = False
+        self.sock = socket.create_connection((host, port))
+        threading.Thread(target=self._recv, name=f"wall-{self.name}", daemon=True).start()
+
+    def _recv(self):
+        try:
+            while True:
+                data = self.sock.recv(65536)
+                if not data:
+                    break
+                self.received.put(data)
+            reason = "stream ended"
+        except OSError as exc:
+            reason = str(exc)
+        finally:
+            self.sock.close()
+        self.received.put(reason)
+
+    def __call__(self):
+        while not self.lost:
+            try:
+                item = self.received.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, str):
+                self._lose(item)
+                break
+            try:
+                self.reader.feed(item)
+            except (SnapshotError, struct.error) as exc:
+                self._lose(f"bad stream: {exc}")
+        return self.reader.board
+
+    def _lose(self, reason):
+        self.lost = True
+        logger.warning("spectator feed %s lost: %s", self.name, reason)
+
+
+def _parse_addr(addr):
+    host, port = addr.rsplit(":", 1)
+    return host, int(port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.wall")
+    parser.add_argument("--boards", type=int, default=100, help="local bot boards when not connecting")
+    parser.add_argument("--connect", nargs="*", default=[], help="host:port spectator streams")
+    parser.add_argument("--size", default="1600x900")
+    parser.add_argument("--seconds", type=float, default=0, help="exit after this long and print timings")
+    args = parser.parse_args(argv)
+    pygame.init()
+    w, h = (int(v) for v in args.size.split("x"))
+    screen = pygame.display.set_mode((w, h))
+    pygame.display.set_caption("Doğa Tetrisi - izleme duvarı")
+    bots = []
+    if args.connect:
+        sources = [StreamSource(*_parse_addr(addr)) for addr in args.connect]
+    else:
+        bots = [BotBoard(seed) for seed in range(args.boards)]
+        sources = bots
+    wall = SpectatorWall(screen, sources)
+    clock = pygame.time.Clock()
+    started = time.time()
+    frames = 0
+    render_ms = 0.0
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+        for bot in bots:
+            bot.step()
+        dirty = wall.draw()
+        if dirty:
+            pygame.display.update(dirty)
+        frames += 1
+        render_ms += wall.frame_ms
+        clock.tick(settings.FPS)
+        if args.seconds and time.time() - started >= args.seconds:
+            running = False
+    elapsed = time.time() - started
+    print(f"{len(sources)} boards: {frames / elapsed:.1f} FPS, wall render {render_ms / max(1, frames):.3f} ms/frame")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
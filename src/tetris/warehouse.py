@@ -0,0 +1,487 @@
+"""Bitmiş oyunların sütunlu kayıt deposu.
+
+Salonlardaki makinelerden ve bot koşularından gelen oyunlar iki tabloya
+eklenir: oyun başına bir satır (`games`) ve kilitlenen parça başına bir
+satır (`pieces`). Her tablo parçalara (chunk) bölünür; bir parça her sütun
+için bir `.npy` dosyasıdır ve bir kez yazıldıktan sonra değişmez. Dolmamış
+son parça yeni satırlarla birlikte yeni bir adla yeniden yazılır ve eskisinin
+yerini alır; kısa oturumlar da böylece parça sayısını artırmaz. Oyuncu
+adları sözlükle kodlanır: sütunda yalnızca `players.json`'daki sıranın
+indeksi tutulur. `manifest.json` parçaları, satır sayılarını ve her sayısal
+sütunun parça başına en küçük/en büyük değerini listeler; sorgular bu
+dizinle ilgisiz parçaları hiç açmadan atlar.
+
+Ekleme akışlıdır: yazıcı her tablo için sabit boyutlu sütun tamponları
+tutar, tampon dolunca parçayı diske yazar ve tamponu yeniden kullanır;
+bellek, geçmişin büyüklüğünden bağımsızdır. Oyun sonunda diske yazılmaz;
+oyundaki kaydedici tamponları oyunun her çıkış yolunda (`shutdown`) yazar. Parça dosyaları önce geçici
+adla yazılır, manifest en son ve atomik olarak değiştirilir; yarıda kalan
+bir yazma depoyu bozmaz. Depoya aynı anda tek yazıcı yazar.
+
+Toplamalar parçaları `mmap` ile açar ve NumPy ile parça parça hesaplar:
+seviyeye göre skor yüzdelikleri, dakikada ortalama satır ve oyuncu başına
+en iyi skor.
+
+Kullanım:
+    TETRIS_WAREHOUSE=1 python -m main
+    python -m tetris.warehouse ingest oyunlar.jsonl --store depo/
+    python -m tetris.warehouse bots --games 100 --store depo/
+    python -m tetris.warehouse query --store depo/
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+
+try:
+    import numpy
+except ImportError:  # optional dependency, only needed for the game log
+    numpy = None
+
+from . import settings
+from .events import BoardReset, GameOver, LinesCleared, PieceLocked
+from .pieces import PIECES
+
+logger = logging.getLogger(__name__)
+
+VERSION = 1
+
+# table -> ((column, dtype), ...); every column is numeric, `player` holds dictionary codes
+TABLES = {
+    'games': (('game', '<i8'), ('player', '<i4'), ('score', '<i8'), ('lines', '<i4'),
+              ('level', '<i2'), ('pieces', '<i4'), ('seconds', '<f4'), ('ended', '<f8')),
+    'pieces': (('game', '<i8'), ('index', '<i4'), ('piece', '<i1'), ('rotation', '<i1'),
+               ('x', '<i2'), ('y', '<i2'), ('lines', '<i1'), ('level', '<i2'), ('seconds', '<f4')),
+}
+
+
+def _require_numpy():
+    if numpy is None:
+        raise RuntimeError("the game log needs NumPy")
+
+
+def _write_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def _read_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+# -- writing -------------------------------------------------------------
+
+class _Buffer:
+    """Bir tablonun doldurulmakta olan parçası; diziler her parçada yeniden kullanılır."""
+
+    def __init__(self, schema, rows):
+        self.names = [name for name, _ in schema]
+        self.columns = [numpy.zeros(rows, dtype) for _, dtype in schema]
+        self.size = 0
+
+    def append(self, values):
+        i = self.size
+        for column, value in zip(self.columns, values):
+            column[i] = value
+        self.size = i + 1
+        return self.size == len(self.columns[0])
+
+
+class Writer:
+    """Depoya akışlı ekleme; `close` ya da `flush` çağrılana kadar satırlar tampondadır."""
+
+    def __init__(self, root, chunk_rows=None):
+        _require_numpy()
+        chunk_rows = chunk_rows or settings.WAREHOUSE['chunk_rows']
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self.manifest = _read_json(os.path.join(root, 'manifest.json'),
+                                   {'version': VERSION, 'next_game': 0,
+                                    'tables': {table: [] for table in TABLES}})
+        if self.manifest['version'] != VERSION:
+            raise ValueError(f"{root} is not a version {VERSION} game log")
+        self.players = _read_json(os.path.join(root, 'players.json'), [])
+        self.codes = {name: code for code, name in enumerate(self.players)}
+        self.buffers = {table: _Buffer(schema, chunk_rows) for table, schema in TABLES.items()}
+        # table -> manifest entry of the unfilled last chunk the buffer continues
+        self.tails = {table: self._reopen(table) for table in TABLES}
+
+    def _reopen(self, table):
+        entries = self.manifest['tables'][table]
+        buf = self.buffers[table]
+        if not entries or entries[-1]['rows'] >= len(buf.columns[0]):
+            return None
+        entry = entries[-1]
+        path = os.path.join(self.root, table, entry['name'])
+        for name, column in zip(buf.names, buf.columns):
+            column[:entry['rows']] = numpy.load(os.path.join(path, name + ".npy"))
+        buf.size = entry['rows']
+        return entry
+
+    def _chunk_name(self, table):
+        counters = self.manifest.setdefault('next_chunk', {})
+        if table not in counters:
+            # Logs written before the counter existed named chunks by position
+            counters[table] = len(self.manifest['tables'][table])
+        number = counters[table]
+        counters[table] = number + 1
+        return f"{number:06d}"
+
+    def player_code(self, name):
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.players)
+            self.players.append(name)
+        return code
+
+    def new_game(self):
+        """Yeni oyun kimliği; kimlikler depo boyunca artar."""
+        game = self.manifest['next_game']
+        self.manifest['next_game'] = game + 1
+        return game
+
+    def add_game(self, game, player, score, lines, level, pieces, seconds, ended):
+        self._append('games', (game, self.player_code(player), score, lines, level, pieces, seconds, ended))
+
+    def add_piece(self, game, index, piece, rotation, x, y, lines, level, seconds):
+        self._append('pieces', (game, index, piece, rotation, x, y, lines, level, seconds))
+
+    def _append(self, table, values):
+        if self.buffers[table].append(values):
+            self._commit([self._write_chunk(table)])
+
+    def _write_chunk(self, table):
+        """Tamponu yeni bir parça olarak yazar; yerini aldığı eski parçanın yolunu döndürür."""
+        buf = self.buffers[table]
+        entries = self.manifest['tables'][table]
+        name = self._chunk_name(table)
+        final = os.path.join(self.root, table, name)
+        tmp = final + ".tmp"
+        # Leftovers of a writer that stopped before its manifest commit
+        for path in (tmp, final):
+            shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(tmp)
+        lo, hi = {}, {}
+        for column_name, column in zip(buf.names, buf.columns):
+            values = column[:buf.size]
+            numpy.save(os.path.join(tmp, column_name + ".npy"), values)
+            lo[column_name], hi[column_name] = values.min().item(), values.max().item()
+        os.replace(tmp, final)
+        replaced = None
+        tail = self.tails[table]
+        if tail is not None:
+            entries.remove(tail)
+            replaced = os.path.join(self.root, table, tail['name'])
+        entry = {'name': name, 'rows': buf.size, 'min': lo, 'max': hi}
+        entries.append(entry)
+        if buf.size == len(buf.columns[0]):
+            buf.size = 0
+            self.tails[table] = None
+        else:
+            # Partial chunk: the next write continues it
+            self.tails[table] = entry
+        return replaced
+
+    def _commit(self, replaced=()):
+        # Chunks and player names land first; the manifest makes them visible
+        _write_json(os.path.join(self.root, 'players.json'), self.players)
+        _write_json(os.path.join(self.root, 'manifest.json'), self.manifest)
+        # Readers holding the old manifest keep their mmaps after the unlink
+        for path in replaced:
+            if path:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def flush(self):
+        """Yarım parçaları da yazar; tampon bir sonraki yazmada aynı parçayı sürdürür."""
+        replaced = []
+        for table, buf in self.buffers.items():
+            tail = self.tails[table]
+            if buf.size and (tail is None or tail['rows'] != buf.size):
+                replaced.append(self._write_chunk(table))
+        self._commit(replaced)
+
+    def close(self):
+        self.flush()
+
+
+def _rotation(piece):
+    shape = piece.piece.shape
+    rotation = 0
+    while shape != piece.shape and rotation < 3:
+        shape = [list(row) for row in zip(*shape[::-1])]
+        rotation += 1
+    return rotation
+
+
+class GameRecorder:
+    """Bir tahtanın olaylarından oyun ve parça satırları üretir.
+
+    Silinen satırlar kilitlenmeden hemen sonra gelir; bu yüzden parça satırı
+    bir sonraki olaya kadar bekletilir.
+    """
+
+    def __init__(self, writer, player="Player", clock=time.monotonic):
+        self.writer = writer
+        self.player = player
+        self.clock = clock
+        self.pending = None
+        self.begin()
+
+    def subscribe(self, events):
+        events.subscribe(BoardReset, lambda e: self.begin())
+        events.subscribe(PieceLocked, self.piece_locked)
+        events.subscribe(LinesCleared, self.lines_cleared)
+        events.subscribe(GameOver, self.game_over)
+
+    def begin(self):
+        self.pending = None
+        self.game = None
+        self.pieces = 0
+        self.started = self.clock()
+
+    def _flush_piece(self):
+        if self.pending is not None:
+            self.writer.add_piece(*self.pending)
+            self.pending = None
+
+    def piece_locked(self, event):
+        self._flush_piece()
+        if self.game is None:
+            self.game = self.writer.new_game()
+        piece = event.piece
+        self.pending = [self.game, self.pieces, PIECES.index(piece.piece), _rotation(piece),
+                        piece.x, piece.y, 0, event.board.level, self.clock() - self.started]
+        self.pieces += 1
+
+    def lines_cleared(self, event):
+        if self.pending is not None:
+            self.pending[6] = len(event.rows)
+
+    def game_over(self, event):
+        self.finish(event.board)
+
+    def finish(self, board):
+        """Oyunun satırını yazar; oyun sonu olayı olmadan biten oyunlar için de."""
+        self._flush_piece()
+        game = self.writer.new_game() if self.game is None else self.game
+        self.writer.add_game(game, self.player, board.score, board.lines_cleared, board.level,
+                             self.pieces, self.clock() - self.started, time.time())
+        self.begin()
+
+    def close(self):
+        self.writer.close()
+
+
+def start(game):
+    """Ayar açıksa oyunun kaydedicisini kurar."""
+    cfg = settings.WAREHOUSE
+    if not cfg['enabled']:
+        return None
+    try:
+        return GameRecorder(Writer(cfg['dir']), game.player_name)
+    except (OSError, ValueError, RuntimeError) as exc:
+        logger.warning("game log disabled: %s", exc)
+        return None
+
+
+# -- reading -------------------------------------------------------------
+
+class Chunk:
+    """Bir parçanın sütunları; her sütun ilk erişimde `mmap` ile açılır."""
+
+    def __init__(self, path, entry):
+        self.path = path
+        self.rows = entry['rows']
+        self.min = entry['min']
+        self.max = entry['max']
+        self.columns = {}
+
+    def __getitem__(self, name):
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = numpy.load(os.path.join(self.path, name + ".npy"), mmap_mode='r')
+        return column
+
+
+class Store:
+    """Depoyu okur; açıldığı andaki manifest görülür."""
+
+    def __init__(self, root):
+        _require_numpy()
+        self.root = root
+        self.manifest = _read_json(os.path.join(root, 'manifest.json'), None)
+        if self.manifest is None or self.manifest['version'] != VERSION:
+            raise ValueError(f"{root} is not a version {VERSION} game log")
+        self.players = _read_json(os.path.join(root, 'players.json'), [])
+
+    def rows(self, table):
+        return sum(entry['rows'] for entry in self.manifest['tables'][table])
+
+    def chunks(self, table, **ranges):
+        """Parçaları sırayla verir; `sütun=(en küçük, en büyük)` aralığıyla kesişmeyenler atlanır."""
+        for entry in self.manifest['tables'][table]:
+            if all(entry['max'][name] >= lo and entry['min'][name] <= hi
+                   for name, (lo, hi) in ranges.items()):
+                yield Chunk(os.path.join(self.root, table, entry['name']), entry)
+
+    def player_code(self, name):
+        return self.players.index(name) if name in self.players else None
+
+
+def score_percentiles(store, percentiles=(50, 90, 99), levels=None):
+    """{seviye: [yüzdelik skorlar]}; `levels` (en küçük, en büyük) seviye aralığıdır."""
+    ranges = {'level': levels} if levels else {}
+    parts = {}
+    for chunk in store.chunks('games', **ranges):
+        level, score = chunk['level'], chunk['score']
+        if levels:
+            keep = (level >= levels[0]) & (level <= levels[1])
+            level, score = level[keep], score[keep]
+        order = numpy.argsort(level, kind='stable')
+        level, score = level[order], score[order]
+        values, starts = numpy.unique(level, return_index=True)
+        for value, part in zip(values.tolist(), numpy.split(score, starts[1:])):
+            parts.setdefault(value, []).append(part)
+    return {level: numpy.percentile(numpy.concatenate(chunks), percentiles).tolist()
+            for level, chunks in sorted(parts.items())}
+
+
+def lines_per_minute(store, player=None):
+    """Oyun süresine göre dakikada silinen satır; `player` verilirse yalnızca onun oyunları."""
+    ranges = {}
+    if player is not None:
+        code = store.player_code(player)
+        if code is None:
+            return 0.0
+        ranges['player'] = (code, code)
+    lines = seconds = 0.0
+    for chunk in store.chunks('games', **ranges):
+        if player is None:
+            lines += chunk['lines'].sum(dtype=numpy.float64)
+            seconds += chunk['seconds'].sum(dtype=numpy.float64)
+        else:
+            mine = chunk['player'] == ranges['player'][0]
+            lines += chunk['lines'][mine].sum(dtype=numpy.float64)
+            seconds += chunk['seconds'][mine].sum(dtype=numpy.float64)
+    return lines * 60 / seconds if seconds else 0.0
+
+
+def player_best(store):
+    """{oyuncu: en iyi skor}, skora göre azalan."""
+    best = numpy.full(len(store.players), -1, numpy.int64)
+    for chunk in store.chunks('games'):
+        numpy.maximum.at(best, chunk['player'], chunk['score'])
+    order = numpy.argsort(-best, kind='stable')
+    return {store.players[code]: int(best[code]) for code in order.tolist() if best[code] >= 0}
+
+
+# -- ingestion -----------------------------------------------------------
+
+def ingest(writer, lines):
+    """JSON satırlarından oyunları ekler; her satır bir oyundur. Eklenen oyun sayısını döndürür.
+
+    Satır: {"player", "score", "lines", "level", "seconds", "ended",
+    "pieces": [[parça, dönüş, x, y, silinen satır, seviye, saniye], ...]}
+    """
+    count = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        game = writer.new_game()
+        pieces = record.get('pieces', ())
+        for index, piece in enumerate(pieces):
+            writer.add_piece(game, index, *piece)
+        writer.add_game(game, record['player'], record['score'], record['lines'], record['level'],
+                        len(pieces), record['seconds'], record.get('ended', time.time()))
+        count += 1
+    return count
+
+
+def play_bots(writer, games, seed=1, max_pieces=1000, player="bot"):
+    """Yapay zeka oyuncusunun başsız oyunlarını ekler; süre, eylem hızından hesaplanır."""
+    from .ai import search
+    from .rules import Board
+    aps = settings.AI_PLAYER['actions_per_second']
+    actions = [0]
+    recorder = GameRecorder(writer, player, clock=lambda: actions[0] / aps)
+    for n in range(games):
+        board = Board(seed=seed + n)
+        recorder.subscribe(board.events)
+        recorder.begin()
+        for _ in range(max_pieces):
+            if board.state == "gameover":
+                break
+            inputs = search(board)
+            actions[0] += len(inputs)
+            for action in inputs:
+                if action == "drop":
+                    board.hard_drop()
+                elif action == "rotate":
+                    board.try_rotate()
+                else:
+                    board.try_move(-1 if action == "left" else 1, 0)
+            board.update_level()
+        if board.state != "gameover":
+            # Out of pieces; the game still counts as finished
+            recorder.finish(board)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tetris.warehouse")
+    parser.add_argument("--store", default=settings.WAREHOUSE['dir'])
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_ingest = sub.add_parser("ingest", help="append games from JSON lines ('-' reads stdin)")
+    p_ingest.add_argument("path")
+    p_bots = sub.add_parser("bots", help="append headless AI games")
+    p_bots.add_argument("--games", type=int, default=10)
+    p_bots.add_argument("--seed", type=int, default=1)
+    p_bots.add_argument("--max-pieces", type=int, default=1000)
+    p_query = sub.add_parser("query", help="print the standard aggregates")
+    p_query.add_argument("--player", help="lines per minute of one player")
+    p_query.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+    if args.cmd == "query":
+        store = Store(args.store)
+        start = time.perf_counter()
+        percentiles = score_percentiles(store)
+        rate = lines_per_minute(store, args.player)
+        best = player_best(store)
+        seconds = time.perf_counter() - start
+        print(f"{store.rows('games')} games, {store.rows('pieces')} pieces")
+        print("level    p50      p90      p99")
+        for level, values in percentiles.items():
+            print(f"{level:5} " + " ".join(f"{v:8.0f}" for v in values))
+        print(f"lines per minute{f' ({args.player})' if args.player else ''}: {rate:.2f}")
+        for name, score in list(best.items())[:args.top]:
+            print(f"{name:12} {score}")
+        print(f"queried in {seconds * 1000:.1f} ms")
+        return
+    writer = Writer(args.store)
+    start = time.perf_counter()
+    try:
+        if args.cmd == "ingest":
+            if args.path == "-":
+                count = ingest(writer, sys.stdin)
+            else:
+                with open(args.path) as f:
+                    count = ingest(writer, f)
+        else:
+            play_bots(writer, args.games, args.seed, args.max_pieces)
+            count = args.games
+    finally:
+        writer.close()
+    print(f"appended {count} games in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
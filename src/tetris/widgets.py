@@ -0,0 +1,212 @@
+"""Önbellekli (retained-mode) arayüz bileşenleri.
+
+Her bileşen kendini bir kez küçük bir yüzeye çizer ve yalnızca etiketi,
+durumu veya fare üzerinde olup olmadığı değişince yeniden çizer; kare başına
+maliyeti tek bir blit'tir. Tıklamalar etiket metinleriyle değil, bileşenlerin
+eylem kimlikleriyle (`action`) çözülür: `WidgetLayer` tıklanabilir
+bileşenleri kaba bir ızgara üzerinde dizinler ve `action_at(pos)` yalnızca
+o hücredeki bileşenlere bakar.
+"""
+
+import pygame
+
+
+class Widget:
+    """Önbelleğe çizilen bileşenlerin temeli; alt sınıflar `paint` yazar."""
+
+    margin = 0  # extra pixels around the rect (hover rim)
+
+    def __init__(self, action, rect):
+        self.action = action
+        self.rect = pygame.Rect(rect)
+        self.hovered = False
+        self.renders = 0
+        self._key = None
+        self._surface = None
+
+    def state(self):
+        """Önbellek anahtarı; değiştiğinde yüzey yeniden çizilir."""
+        return (self.hovered,)
+
+    def paint(self, surface):
+        raise NotImplementedError
+
+    def surface(self):
+        key = self.state()
+        if key != self._key:
+            m = self.margin
+            self._surface = pygame.Surface((self.rect.width + 2*m, self.rect.height + 2*m), pygame.SRCALPHA)
+            self.paint(self._surface)
+            self._key = key
+            self.renders += 1
+        return self._surface
+
+    def draw(self, target):
+        target.blit(self.surface(), (self.rect.x - self.margin, self.rect.y - self.margin))
+
+
+class Button(Widget):
+    margin = 6
+
+    def __init__(self, action, rect, text, font, color=(70, 70, 70), text_color=(255,255,255),
+                 radius=8, rim=False, border=(200,200,200)):
+        super().__init__(action, rect)
+        self.text = text
+        self.font = font
+        self.color = color
+        self.text_color = text_color
+        self.radius = radius
+        self.border = border
+        self.rim = rim  # bright hover rim for the bloom pass to spread
+
+    def state(self):
+        return (self.text, self.color, self.hovered and self.rim)
+
+    def set_text(self, text):
+        self.text = text
+
+    def paint(self, surface):
+        m = self.margin
+        rect = pygame.Rect(m, m, self.rect.width, self.rect.height)
+        pygame.draw.rect(surface, self.color, rect, border_radius=self.radius)
+        pygame.draw.rect(surface, self.border, rect, 2, border_radius=self.radius)
+        if self.hovered and self.rim:
+            pygame.draw.rect(surface, (255,240,200), rect.inflate(6,6), 3, border_radius=self.radius+2)
+        text_surf = self.font.render(self.text, True, self.text_color)
+        surface.blit(text_surf, text_surf.get_rect(center=rect.center))
+
+    def is_hovered(self, pos):
+        return self.rect.collidepoint(pos)
+
+
+class Label(Widget):
+    """Tıklanmayan metin; `center` veya `topleft` konumuna hizalanır."""
+
+    def __init__(self, text, font, color=(255,255,255), center=None, topleft=None):
+        self.text = text
+        self.font = font
+        self.color = color
+        self.anchor = ('center', center) if center is not None else ('topleft', topleft)
+        super().__init__(None, self._place(font.size(text)))
+
+    def _place(self, size):
+        rect = pygame.Rect((0, 0), size)
+        setattr(rect, *self.anchor)
+        return rect
+
+    def state(self):
+        return (self.text, self.color)
+
+    def set_text(self, text, color=None):
+        if text != self.text:
+            self.text = text
+            self.rect = self._place(self.font.size(text))
+        if color is not None:
+            self.color = color
+
+    def paint(self, surface):
+        surface.blit(self.font.render(self.text, True, self.color), (0, 0))
+
+
+class TextBox(Widget):
+    """Ad kutusu gibi etiketli tek satırlık giriş alanı."""
+
+    def __init__(self, action, rect, label, label_font, font):
+        super().__init__(action, rect)
+        self.label = label_font.render(label, True, (255,255,255))
+        self.font = font
+        self.text = ""
+        self.active = False
+
+    def state(self):
+        return (self.text, self.active)
+
+    def draw(self, target):
+        target.blit(self.label, (self.rect.x - 60, self.rect.y + 8))
+        super().draw(target)
+
+    def paint(self, surface):
+        rect = surface.get_rect()
+        pygame.draw.rect(surface, (40,40,60), rect, border_radius=8)
+        pygame.draw.rect(surface, (255,255,255), rect, 2, border_radius=8)
+        color = (255,215,0) if self.active else (255,255,255)
+        surface.blit(self.font.render(self.text, True, color), (10, 5))
+
+
+class Overlay(Widget):
+    """Tam ekran karartma, isteğe bağlı ortalanmış satırlarla."""
+
+    def __init__(self, size, alpha, lines=(), font=None, top=120, spacing=36):
+        super().__init__(None, ((0, 0), size))
+        self.alpha = alpha
+        self.lines = tuple(lines)
+        self.font = font
+        self.top = top
+        self.spacing = spacing
+
+    def state(self):
+        return (self.alpha, self.lines)
+
+    def paint(self, surface):
+        surface.fill((0, 0, 0, self.alpha))
+        for i, line in enumerate(self.lines):
+            text = self.font.render(line, True, (255,255,255))
+            surface.blit(text, (self.rect.width//2 - text.get_width()//2, self.top + i*self.spacing))
+
+
+class WidgetLayer:
+    """Bir ekranın bileşenleri; çizim sırası listedeki sıradır."""
+
+    def __init__(self, widgets=(), cell=64):
+        self.cell = cell
+        self.widgets = []
+        self.index = {}  # (cx, cy) -> tuple of interactive widgets, topmost first
+        self.hovered = None
+        for widget in widgets:
+            self.add(widget)
+
+    def add(self, widget):
+        self.widgets.append(widget)
+        if widget.action is None:
+            return widget
+        c = self.cell
+        r = widget.rect
+        for cx in range(r.left // c, (r.right - 1) // c + 1):
+            for cy in range(r.top // c, (r.bottom - 1) // c + 1):
+                self.index[(cx, cy)] = (widget,) + self.index.get((cx, cy), ())
+        return widget
+
+    def __iter__(self):
+        return iter(self.widgets)
+
+    def widget_at(self, pos):
+        x, y = pos
+        for widget in self.index.get((x // self.cell, y // self.cell), ()):
+            if widget.rect.collidepoint(x, y):
+                return widget
+        return None
+
+    def action_at(self, pos):
+        widget = self.widget_at(pos)
+        return widget.action if widget else None
+
+    def get(self, action):
+        return next(w for w in self.widgets if w.action == action)
+
+    def hover(self, pos):
+        """Fare altındaki bileşeni işaretler; yalnızca değişen iki bileşen yeniden çizilir."""
+        widget = self.widget_at(pos) if pos is not None else None
+        if widget is not self.hovered:
+            if self.hovered:
+                self.hovered.hovered = False
+            if widget:
+                widget.hovered = True
+            self.hovered = widget
+        return widget
+
+    def draw(self, target):
+        for widget in self.widgets:
+            widget.draw(target)
+
+    def renders(self):
+        return sum(w.renders for w in self.widgets)
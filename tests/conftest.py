@@ -0,0 +1,20 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+
+@pytest.fixture
+def game(tmp_path, monkeypatch):
+    """A headless TetrisGame whose autosave and high scores live in tmp_path."""
+    from tetris import settings
+    monkeypatch.setattr(settings, "AUTOSAVE_FILE", str(tmp_path / "autosave.snap"))
+    monkeypatch.setattr(settings, "HIGH_SCORE_FILE", str(tmp_path / "highscores.txt"))
+    from tetris.game import TetrisGame
+    game = TetrisGame()
+    yield game
+    game.shutdown()
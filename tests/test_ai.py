@@ -0,0 +1,61 @@
+import time
+
+from tetris import ai, snapshot
+from tetris.rules import Board
+
+
+def _slot(board):
+    return bytearray(ai.slot_size(board.cols, board.rows))
+
+
+def test_slot_round_trip():
+    board = Board(seed=1)
+    buf = _slot(board)
+    data = snapshot.capture(board)
+    ai.write_slot(buf, 7, data)
+    assert ai.read_slot(buf, 7) == data
+
+
+def test_overwritten_slot_is_stale():
+    board = Board(seed=1)
+    buf = _slot(board)
+    ai.write_slot(buf, 1, snapshot.capture(board))
+    board.hard_drop()
+    ai.write_slot(buf, 2, snapshot.capture(board))
+    assert ai.read_slot(buf, 1) is None
+    assert ai.read_slot(buf, 2) == snapshot.capture(board)
+
+
+def test_half_written_slot_is_stale():
+    board = Board(seed=1)
+    buf = _slot(board)
+    data = snapshot.capture(board)
+    ai.write_slot(buf, 1, data)
+    # The writer has updated the head but not yet the tail
+    buf[:ai._SLOT_HEAD.size] = ai._SLOT_HEAD.pack(2, len(data))
+    assert ai.read_slot(buf, 1) is None and ai.read_slot(buf, 2) is None
+
+
+def test_search_ends_with_a_drop():
+    board = Board(seed=1)
+    before = snapshot.capture(board)
+    inputs = ai.search(board)
+    assert inputs[-1] == "drop" and inputs.count("drop") == 1
+    # The search leaves the live piece where it found it
+    assert snapshot.capture(board) == before
+
+
+def test_player_keeps_only_the_newest_plan():
+    board = Board(seed=1)
+    player = ai.AIPlayer()
+    try:
+        player.request(board)
+        player.request(board)
+        deadline = time.monotonic() + 30
+        while not player.plan and time.monotonic() < deadline:
+            time.sleep(0.01)
+            player.poll()
+        assert player.plan and player.plan[-1] == "drop"
+        assert player.stats['plans'] == 1
+    finally:
+        player.close()
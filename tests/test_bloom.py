@@ -0,0 +1,47 @@
+import pygame
+import pytest
+
+pytest.importorskip("numpy")
+
+from tetris import settings
+from tetris.bloom import Bloom
+
+SIZE = (64, 64)
+
+
+def _source(color):
+    surf = pygame.Surface(SIZE)
+    surf.fill((0, 0, 0))
+    surf.fill(color, (24, 24, 16, 16))
+    return surf
+
+
+def test_bright_pixels_glow_past_their_edges():
+    out = Bloom().render(_source((255, 255, 255)), pygame.Surface(SIZE))
+    assert out.get_at((32, 32))[:3] > (0, 0, 0)
+    # The blur spreads the glow outside the lit square
+    assert out.get_at((20, 32))[:3] > (0, 0, 0)
+    assert out.get_at((0, 0))[:3] == (0, 0, 0)
+
+
+def test_dim_pixels_stay_below_threshold():
+    dim = settings.BLOOM['threshold'] // 2
+    out = Bloom().render(_source((dim, dim, dim)), pygame.Surface(SIZE))
+    assert max(out.get_at((x, 32))[0] for x in range(SIZE[0])) == 0
+
+
+def test_apply_adds_the_glow_to_the_target():
+    source = _source((255, 255, 255))
+    target = pygame.Surface(SIZE)
+    target.fill((10, 10, 10))
+    Bloom().apply(source, target)
+    assert target.get_at((20, 32))[0] > 10
+    assert target.get_at((0, 0))[:3] == (10, 10, 10)
+
+
+def test_disabled_bloom_leaves_the_target_alone():
+    bloom = Bloom(dict(settings.BLOOM, enabled=False))
+    target = _source((255, 255, 255))
+    before = pygame.image.tobytes(target, 'RGB')
+    bloom.apply(target)
+    assert not bloom.available and pygame.image.tobytes(target, 'RGB') == before
@@ -0,0 +1,45 @@
+import os
+
+import pygame
+
+from tetris import settings
+from tetris.clip import APNGWriter, InstantReplay
+
+
+def _replay(tmp_path):
+    pygame.display.init()
+    screen = pygame.display.set_mode((64, 48))
+    config = dict(settings.INSTANT_REPLAY, dir=str(tmp_path), downscale=2, seconds=1, fps=10)
+    return screen, InstantReplay(screen, config)
+
+
+def test_empty_ring_is_not_saved(tmp_path):
+    _, replay = _replay(tmp_path)
+    try:
+        assert replay.save() is None
+    finally:
+        replay.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_writer_without_frames_leaves_no_file(tmp_path):
+    path = str(tmp_path / "empty.png")
+    writer = APNGWriter(path, (4, 4), 10)
+    assert writer.close() is False
+    assert not os.path.exists(path)
+
+
+def test_saved_clip_is_a_png(tmp_path):
+    screen, replay = _replay(tmp_path)
+    try:
+        for n in range(3):
+            screen.fill((n * 80, 0, 0))
+            replay.capture(screen, now=n * replay.interval)
+        replay.save()
+        path = replay.saving.result()
+    finally:
+        replay.close()
+    with open(path, 'rb') as f:
+        data = f.read()
+    assert data.startswith(b"\x89PNG\r\n\x1a\n")
+    assert b"IDAT" in data and b"fdAT" in data and data.endswith(b"IEND\xaeB`\x82")
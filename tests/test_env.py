@@ -0,0 +1,17 @@
+import pytest
+
+from tetris import env
+
+
+def test_env_needs_numpy(monkeypatch):
+    monkeypatch.setattr(env, "numpy", None)
+    with pytest.raises(RuntimeError, match="NumPy"):
+        env.TetrisEnv()
+
+
+def test_env_observes_the_board():
+    pytest.importorskip("numpy")
+    e = env.TetrisEnv(seed=1)
+    obs, _ = e.reset()
+    assert obs.shape == e.observation_shape
+    assert (obs == env.ACTIVE).sum() == 4
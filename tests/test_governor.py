@@ -0,0 +1,34 @@
+from tetris import settings
+from tetris.governor import GraphicsGovernor, fixed_tier
+
+BEST = len(settings.GRAPHICS_TIERS) - 1
+
+
+def _run(governor, frame_ms, frames):
+    return [governor.frame for _ in range(frames) if governor.tick(frame_ms)]
+
+
+def test_slow_frames_step_down_one_tier_per_cooldown():
+    governor = GraphicsGovernor(budget_ms=10)
+    assert _run(governor, 20, 119) == [] and governor.tier == BEST
+    assert _run(governor, 20, 121) == [120, 240]
+    assert governor.tier == BEST - 2
+    assert governor.effects is settings.GRAPHICS_TIERS[BEST - 2]
+
+
+def test_fast_frames_step_up_after_calm_windows():
+    governor = GraphicsGovernor(budget_ms=10, tier=0)
+    cfg = settings.AUTO_GRAPHICS
+    # The first decision waits out the cooldown, then needs up_windows calm windows
+    first = cfg['cooldown'] + (cfg['up_windows'] - 1) * cfg['window']
+    assert _run(governor, 1, first) == [first] and governor.tier == 1
+
+
+def test_frames_between_thresholds_hold_the_tier():
+    governor = GraphicsGovernor(budget_ms=10, tier=2)
+    assert _run(governor, 6, 1000) == [] and governor.tier == 2
+
+
+def test_fixed_modes_pin_named_tiers():
+    assert settings.GRAPHICS_TIERS[fixed_tier('low')]['name'] == 'low'
+    assert fixed_tier('best') == BEST
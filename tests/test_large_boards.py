@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from tetris import ai, livestate, snapshot
+from tetris.rules import Board, GARBAGE_COLOR
+from tetris.spectate import StreamReader, StreamWriter
+
+SIZES = [(100, 400), (400, 100)]
+
+
+def _played(cols, rows):
+    board = Board(cols, rows, seed=7)
+    for y in range(rows - 3, rows):
+        board.grid[y] = [GARBAGE_COLOR if (x + y) % 3 else None for x in range(cols)]
+    # Far from the origin, past the old i8 coordinate range
+    board.current_piece.x = cols - 5
+    board.current_piece.y = rows // 2
+    board.hold_piece = board.next_piece
+    board.score = 123456
+    return board
+
+
+@pytest.mark.parametrize("cols, rows", SIZES)
+def test_snapshot_round_trip(cols, rows):
+    board = _played(cols, rows)
+    data = snapshot.capture(board)
+    assert len(data) == snapshot.size(cols, rows)
+    other = Board(cols, rows)
+    other.state = snapshot.restore(other, data)
+    assert other.grid == board.grid
+    assert (other.current_piece.x, other.current_piece.y) == (cols - 5, rows // 2)
+    assert other.hold_piece.piece is board.hold_piece.piece
+    assert snapshot.capture(other) == data
+
+
+def test_snapshot_rejects_other_board_size():
+    data = snapshot.capture(_played(100, 400))
+    with pytest.raises(snapshot.SnapshotError):
+        snapshot.restore(Board(400, 100), data)
+
+
+@pytest.mark.parametrize("cols, rows", SIZES)
+def test_keyframe_round_trip(cols, rows):
+    board = _played(cols, rows)
+    chunks = []
+    writer = StreamWriter(lambda data, keyframe: chunks.append(data))
+    writer.subscribe(board.events)
+    writer.frame(board)
+    board.try_move(-1, 0)
+    board.hard_drop()
+    writer.frame(board)
+    reader = StreamReader()
+    reader.feed(b"".join(chunks))
+    assert reader.synced
+    assert reader.board.grid == board.grid
+    assert reader.board.score == board.score
+
+
+@pytest.mark.parametrize("cols, rows", SIZES)
+def test_live_state_round_trip(cols, rows):
+    board = _played(cols, rows)
+    name = f"tetris_test_{os.getpid()}_{cols}"
+    writer = livestate.LiveStateWriter(name, cols, rows)
+    try:
+        writer.publish(board)
+        reader = livestate.LiveStateReader(name)
+        snap = reader.read()
+        reader.close()
+    finally:
+        writer.close()
+    assert (reader.cols, reader.rows) == (cols, rows)
+    assert snap['grid'] == board.grid
+    assert snap['current_piece'][2:] == (cols - 5, rows // 2)
+
+
+@pytest.mark.parametrize("cols, rows", SIZES)
+def test_ai_slot_holds_snapshot(cols, rows):
+    data = snapshot.capture(_played(cols, rows))
+    buf = bytearray(ai.slot_size(cols, rows))
+    ai.write_slot(buf, 3, data)
+    assert ai.read_slot(buf, 3) == data
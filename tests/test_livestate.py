@@ -0,0 +1,71 @@
+import os
+import threading
+import time
+
+import pytest
+
+from tetris import livestate
+from tetris.rules import Board
+
+
+@pytest.fixture
+def writer():
+    board = Board(seed=1)
+    writer = livestate.LiveStateWriter(f"tetris_test_{os.getpid()}", board.cols, board.rows)
+    yield writer
+    writer.close()
+
+
+def test_published_board_reads_back(writer):
+    board = Board(seed=1)
+    writer.subscribe(board.events)
+    for _ in range(4):
+        board.hard_drop()
+    board.score = 1234
+    board.try_move(1, 0)
+    assert writer.publish(board)
+    reader = livestate.LiveStateReader(writer.name)
+    try:
+        snap = reader.read()
+        assert snap['seq'] % 2 == 0 and snap['seq'] == writer.seq
+        assert snap['score'] == 1234 and snap['state'] == board.state
+        assert snap['grid'] == board.grid
+        assert snap['grid_version'] == board.grid_version
+        piece = board.current_piece
+        assert snap['current_piece'][2:] == (piece.x, piece.y)
+    finally:
+        reader.close()
+
+
+def test_unchanged_board_is_not_republished(writer):
+    board = Board(seed=1)
+    writer.subscribe(board.events)
+    assert writer.publish(board)
+    assert not writer.publish(board)
+    board.try_move(1, 0)
+    assert writer.publish(board)
+
+
+def test_reader_waits_out_a_write_in_progress(writer):
+    board = Board(seed=1)
+    writer.publish(board)
+    reader = livestate.LiveStateReader(writer.name)
+    # Leave the counter odd, as a writer preempted mid-write would
+    livestate._SEQ.pack_into(writer.buf, livestate.SEQ_OFFSET, writer.seq + 1)
+
+    def finish():
+        time.sleep(0.05)
+        board.score = 77
+        writer.dirty = True
+        writer.publish(board)
+
+    thread = threading.Thread(target=finish)
+    thread.start()
+    try:
+        snap = reader.read()
+        thread.join()
+        assert reader.retries > 0
+        assert snap['score'] == 77 and snap['seq'] == writer.seq
+    finally:
+        thread.join()
+        reader.close()
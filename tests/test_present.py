@@ -0,0 +1,40 @@
+import pygame
+import pytest
+
+from tetris.present import Presenter
+
+
+@pytest.fixture
+def presenter():
+    pygame.display.init()
+    presenter = Presenter((200, 150), mode='integer')
+    presenter.open((500, 300))
+    yield presenter
+    pygame.display.quit()
+
+
+def test_window_gets_whole_number_scale_centered(presenter):
+    assert presenter.surface.get_size() == (200, 150)
+    assert presenter.scale == 2.0
+    assert presenter.dest == pygame.Rect(50, 0, 400, 300)
+
+
+def test_small_window_shrinks_to_fit(presenter):
+    presenter.resize(100, 100)
+    assert presenter.scale == 0.5
+    assert presenter.dest == pygame.Rect(0, 12, 100, 75)
+
+
+def test_mouse_events_map_to_logical_coordinates(presenter):
+    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(250, 150))
+    assert presenter.map_event(event).pos == (100, 75)
+    key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+    assert presenter.map_event(key) is key
+
+
+def test_present_scales_into_the_letterboxed_area(presenter):
+    presenter.surface.fill((255, 0, 0))
+    presenter.present()
+    assert presenter.window.get_at((50, 10))[:3] == (255, 0, 0)
+    assert presenter.window.get_at((449, 299))[:3] == (255, 0, 0)
+    assert presenter.window.get_at((49, 10))[:3] == (0, 0, 0)
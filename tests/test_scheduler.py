@@ -0,0 +1,30 @@
+import pygame
+
+from tetris.scheduler import FULL, IDLE
+
+
+def _quiet(game):
+    game.scheduler.last_input = pygame.time.get_ticks() - game.scheduler.idle_after_ms - 1
+
+
+def _click(game, ui, action):
+    pos = ui.get(action).rect.center
+    game.handle_events([pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)], True)
+
+
+def test_paused_game_idles_after_start(game):
+    game.state = "menu"
+    _click(game, game.menu_ui, "start")
+    assert game.state == "playing" and game.frame_mode() == FULL
+    game.pause_game()
+    _quiet(game)
+    assert game.frame_mode() == IDLE
+
+
+def test_menu_fade_keeps_full_rate(game):
+    game.state = "menu"
+    game.fade_in = True
+    _quiet(game)
+    assert game.frame_mode() == FULL
+    game.fade_in = False
+    assert game.frame_mode() == IDLE
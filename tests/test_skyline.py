@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from tetris import skyline
+from tetris.ai import evaluate
+from tetris.pieces import PIECES
+
+COLS, CLAMP, ROWS = 5, 2, 24
+
+
+def _drop(grid, shape, x):
+    """Straight drop and clear on a plain grid, as the table models it."""
+    cells = [(dx, dy) for dy, row in enumerate(shape) for dx, val in enumerate(row) if val]
+    y = 0
+    while all(y + 1 + dy < ROWS and grid[y + 1 + dy][x + dx] is None for dx, dy in cells):
+        y += 1
+    grid = [list(row) for row in grid]
+    for dx, dy in cells:
+        grid[y + dy][x + dx] = 1
+    kept = [row for row in grid if None in row]
+    return [[None] * COLS for _ in range(ROWS - len(kept))] + kept, ROWS - len(kept)
+
+
+def _placements(piece):
+    for rotation, shape in skyline._rotations(piece):
+        for x in range(COLS - len(shape[0]) + 1):
+            yield rotation, x, shape
+
+
+def _ahead(column_heights, piece, rotation, x, upcoming):
+    """Two-ply value of placing `piece` at (rotation, x) with `upcoming` next."""
+    grid = [[1 if ROWS - y <= height else None for height in column_heights] for y in range(ROWS)]
+    shape = dict((r, s) for r, s in skyline._rotations(piece))[rotation]
+    first, lines = _drop(grid, shape, x)
+    return max(evaluate(second, lines + more)
+               for _, nx, nshape in _placements(upcoming)
+               for second, more in [_drop(first, nshape, nx)])
+
+
+@pytest.fixture(scope="module")
+def table():
+    return skyline.build(COLS, CLAMP)[skyline._HEADER.size:]
+
+
+def _check(table, contour, p, q):
+    column_heights = skyline._contours(COLS, CLAMP, contour, contour + 1)[0].tolist()
+    code = table[(contour * len(PIECES) + p) * len(PIECES) + q]
+    best = max(_ahead(column_heights, PIECES[p], r, x, PIECES[q]) for r, x, _ in _placements(PIECES[p]))
+    chosen = _ahead(column_heights, PIECES[p], code >> 6, code & 0x3F, PIECES[q])
+    assert chosen == pytest.approx(best), (column_heights, p, q, code >> 6, code & 0x3F)
+
+
+def test_cleared_column_gaps_stop_holing_rows(table):
+    # Heights [4 2 2 0 1], I then O: the flat I at x=1 clears a row
+    _check(table, 53, 0, 1)
+
+
+def test_table_matches_brute_force(table):
+    count = (2 * CLAMP + 1) ** (COLS - 1)
+    rng = random.Random(3)
+    for _ in range(300):
+        _check(table, rng.randrange(count), rng.randrange(len(PIECES)), rng.randrange(len(PIECES)))
@@ -0,0 +1,94 @@
+import struct
+
+import pytest
+
+from tetris import settings, snapshot
+from tetris.pieces import PIECES, FallingPiece
+from tetris.rules import Board, GARBAGE_COLOR
+
+
+def _played(seed=3):
+    board = Board(seed=seed)
+    for _ in range(6):
+        board.try_rotate()
+        board.try_move(1, 0)
+        board.hard_drop()
+    board.hold_piece = FallingPiece(PIECES[2], 0, 0)
+    board.hold_piece.rotate()
+    board.score, board.level, board.last_berserk_trigger = 4200, 3, 20
+    return board
+
+
+def test_capture_decode_restore_round_trip():
+    board = _played()
+    data = snapshot.capture(board)
+    snap = snapshot.decode(data)
+    assert snap['grid'] == board.grid
+    assert (snap['score'], snap['level'], snap['state']) == (4200, 3, "playing")
+    assert snap['rng_state'] == board.piece_rng.state
+    assert snap['hold_piece'].shape == board.hold_piece.shape
+    other = Board(seed=99)
+    assert snapshot.restore(other, data) == "playing"
+    assert snapshot.capture(other) == data
+    # The restored generator deals the same pieces
+    assert [other.piece_rng.choice(PIECES) for _ in range(8)] == \
+        [board.piece_rng.choice(PIECES) for _ in range(8)]
+
+
+def test_decode_version_1():
+    board = _played()
+    board.current_piece.x, board.current_piece.y = 4, 7
+    v2 = snapshot.capture(board)
+    header, state_size, piece = snapshot._HEADER.size, snapshot._STATE.size, snapshot._PIECE
+    v1_piece = struct.Struct("<BBbb")
+    pieces = b"".join(v1_piece.pack(*piece.unpack_from(v2, header + state_size + i * piece.size))
+                      for i in range(3))
+    v1 = (struct.pack("<4sBBB", snapshot.MAGIC, 1, board.cols, board.rows)
+          + v2[header:header + state_size] + pieces + v2[header + state_size + 3 * piece.size:])
+    snap = snapshot.decode(v1)
+    assert snap['grid'] == board.grid
+    assert (snap['current_piece'].x, snap['current_piece'].y) == (4, 7)
+    assert snap['score'] == 4200
+
+
+@pytest.mark.parametrize("data", [b"", b"XXXX\x02", snapshot.MAGIC + b"\x09", None])
+def test_decode_rejects_bad_data(data):
+    if data is None:
+        data = snapshot.capture(Board())[:-1]
+    with pytest.raises(snapshot.SnapshotError):
+        snapshot.decode(data)
+
+
+def test_load_snapshot_resets_presentation(game):
+    game.state = "playing"
+    for _ in range(3):
+        game.hard_drop()
+    data = game.save_snapshot()
+    game.reset_game()
+    game.particles.append(object())
+    assert game.load_snapshot(data) == "playing"
+    assert game.save_snapshot() == data
+    assert game.particles == [] and game.score_anim['value'] == game.score
+    assert game.animated_piece.falling_piece.shape == game.current_piece.shape
+
+
+def _top_out(game):
+    game.state = "playing"
+    for y in range(2, game.rows):
+        game.grid[y] = [GARBAGE_COLOR] * (game.cols - 1) + [None]
+    # A flat I lands on row 1 and leaves room for one more
+    for _ in range(3):
+        game.hard_drop()
+        if game.state == "gameover":
+            break
+    assert game.state == "gameover"
+
+
+def test_every_game_over_clears_autosave_and_saves_score(game):
+    for score in (500, 700):
+        game.reset_game()
+        game.score = score
+        game.autosave()
+        _top_out(game)
+        assert snapshot.load_file(settings.AUTOSAVE_FILE) is None
+        assert score in game.load_high_scores()
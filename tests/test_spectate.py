@@ -0,0 +1,79 @@
+import random
+import socket
+import time
+
+from tetris.events import GameOver
+from tetris.spectate import RecordedBoard, SpectatorBroadcaster, StreamReader, StreamWriter
+
+
+def _record(frames, close=True):
+    out = bytearray()
+    writer = StreamWriter(lambda data, keyframe: out.extend(data))
+    board = RecordedBoard(writer, seed=1)
+    rng = random.Random(1)
+    for i in range(frames):
+        if rng.random() < 0.05:
+            board.try_move(rng.choice((-1, 1)), 0)
+        if i % 50 == 0:
+            board.gravity_step()
+        writer.frame(board)
+    if close:
+        writer.close()
+    return board, bytes(out)
+
+
+def test_replay_has_every_recorded_frame():
+    board, data = _record(1200)
+    frames = list(StreamReader().replay(data))
+    assert len(frames) == 1200
+    assert frames[-1].grid == board.grid
+
+
+def test_game_over_flushes_the_stream():
+    out = bytearray()
+    writer = StreamWriter(lambda data, keyframe: out.extend(data))
+    board = RecordedBoard(writer, seed=1)
+    writer.frame(board)
+    sent = len(out)
+    board.events.emit(GameOver, board)
+    assert len(out) > sent
+
+
+def test_broadcaster_skips_to_the_next_keyframe_when_full():
+    broadcaster = SpectatorBroadcaster("127.0.0.1", 0, max_queued=2)
+    try:
+        with broadcaster.lock:  # the send thread stalls on its first group
+            for _ in range(5):
+                broadcaster.send(b"x")
+            assert broadcaster.dropping
+            dropped = broadcaster.dropped
+            broadcaster.send(b"y")
+            assert broadcaster.dropped == dropped  # skipped without trying the queue
+        deadline = time.monotonic() + 2
+        while not broadcaster.queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        broadcaster.send(b"k", keyframe=True)
+        assert not broadcaster.dropping
+    finally:
+        broadcaster.close()
+    assert not broadcaster.sender.is_alive()
+
+
+def test_broadcaster_sends_from_the_first_keyframe():
+    broadcaster = SpectatorBroadcaster("127.0.0.1", 0)
+    try:
+        viewer = socket.create_connection(broadcaster.server.getsockname())
+        deadline = time.monotonic() + 2
+        while not broadcaster.viewers and time.monotonic() < deadline:
+            time.sleep(0.01)
+        broadcaster.send(b"skipped")
+        broadcaster.send(b"KEY", keyframe=True)
+        broadcaster.send(b"+")
+        viewer.settimeout(2)
+        received = b""
+        while len(received) < 4:
+            received += viewer.recv(16)
+        assert received == b"KEY+"
+        viewer.close()
+    finally:
+        broadcaster.close()
@@ -0,0 +1,42 @@
+import urllib.request
+
+from tetris.rules import Board
+from tetris.telemetry import Telemetry, TelemetryServer
+
+
+def _samples(text):
+    return dict(line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#"))
+
+
+def test_board_events_drive_counters():
+    telemetry = Telemetry()
+    board = Board(seed=1)
+    telemetry.subscribe(board.events)
+    spawned = telemetry.pieces_spawned
+    for _ in range(3):
+        board.hard_drop()
+    assert telemetry.pieces_placed == 3
+    assert telemetry.pieces_spawned == spawned + 3
+
+
+def test_frame_histogram_is_cumulative():
+    telemetry = Telemetry()
+    for ms in (3, 16, 16, 200):
+        telemetry.frame(ms, True, 0, 1, 0)
+    samples = _samples(telemetry.render())
+    assert samples['tetris_frame_time_ms_bucket{le="4"}'] == "1"
+    assert samples['tetris_frame_time_ms_bucket{le="16.7"}'] == "3"
+    assert samples['tetris_frame_time_ms_bucket{le="+Inf"}'] == "4"
+    assert samples['tetris_frame_time_ms_count'] == "4"
+
+
+def test_server_exposes_metrics():
+    telemetry = Telemetry()
+    telemetry.lines_cleared(4)
+    server = TelemetryServer(telemetry, port=0).start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+            samples = _samples(response.read().decode())
+    finally:
+        server.stop()
+    assert samples['tetris_line_clears_total{size="4"}'] == "1"
@@ -0,0 +1,22 @@
+from tetris import versus
+
+
+def _match(size=2):
+    sessions = [versus.Session(None, seed) for seed in range(size)]
+    return versus.Match(sessions, seed=1), sessions
+
+
+def test_action_queue_is_bounded():
+    _, (a, _) = _match()
+    for _ in range(1000):
+        a.actions.extend(b"LRLR" * 8)
+    assert len(a.actions) == versus.MAX_QUEUED_ACTIONS
+
+
+def test_match_end_clears_queued_actions():
+    match, (a, b) = _match()
+    a.actions.extend(b"L" * 100)
+    b.board.state = "gameover"
+    match.tick(1)
+    assert match.over
+    assert a.match is None and not a.actions
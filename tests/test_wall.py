@@ -0,0 +1,63 @@
+import socket
+import time
+
+import pygame
+
+from tetris.rules import Board
+from tetris.spectate import StreamWriter
+from tetris.wall import SpectatorWall, StreamSource
+
+
+def _keyframe(board):
+    out = bytearray()
+    writer = StreamWriter(lambda data, keyframe: out.extend(data))
+    writer.frame(board)
+    writer.close()
+    return bytes(out)
+
+
+def _poll(source, until, seconds=2):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        board = source()
+        if until(board):
+            return board
+        time.sleep(0.01)
+    return source()
+
+
+def test_stream_source_applies_records_on_the_calling_thread():
+    server = socket.create_server(("127.0.0.1", 0))
+    board = Board(seed=5)
+    board.score = 1234
+    source = StreamSource(*server.getsockname())
+    conn, _ = server.accept()
+    # Nothing reaches the board until the wall asks for it
+    conn.sendall(_keyframe(board))
+    time.sleep(0.05)
+    assert source.reader.board is None
+    got = _poll(source, lambda b: b is not None)
+    assert got.score == 1234 and got.grid == board.grid
+    conn.close()
+    server.close()
+    _poll(source, lambda b: source.lost)
+    assert source.lost and source() is got
+
+
+def test_corrupt_stream_marks_the_source_lost():
+    server = socket.create_server(("127.0.0.1", 0))
+    source = StreamSource(*server.getsockname())
+    conn, _ = server.accept()
+    conn.sendall(bytes((1, 99, 0, 0)))  # keyframe of an unknown stream version
+    _poll(source, lambda b: source.lost)
+    assert source.lost
+    conn.close()
+    server.close()
+
+
+def test_layout_survives_a_tiny_window():
+    pygame.init()
+    surface = pygame.display.set_mode((20, 20))
+    wall = SpectatorWall(surface, [lambda: None] * 100, font=pygame.font.Font(None, 11))
+    assert len(wall.tiles) == 100
+    assert all(tile.rect.width >= 1 and tile.rect.height >= 1 for tile in wall.tiles)
@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from tetris import warehouse
+from tetris.rules import Board
+
+
+def _game(player, score):
+    return f'{{"player": "{player}", "score": {score}, "lines": 1, "level": 1, "seconds": 60, ' \
+           f'"pieces": [[0, 0, 3, 10, 1, 1, 1.5]]}}'
+
+
+def test_sessions_continue_the_tail_chunk(tmp_path):
+    root = str(tmp_path)
+    for n in range(5):
+        writer = warehouse.Writer(root, chunk_rows=4)
+        warehouse.ingest(writer, [_game("ann", n * 10)])
+        writer.close()
+    store = warehouse.Store(root)
+    # Four rows fill one chunk, the fifth continues a single tail
+    assert [entry['rows'] for entry in store.manifest['tables']['games']] == [4, 1]
+    assert sorted(os.listdir(os.path.join(root, 'games'))) == \
+        sorted(entry['name'] for entry in store.manifest['tables']['games'])
+    scores = numpy.concatenate([chunk['score'] for chunk in store.chunks('games')])
+    assert scores.tolist() == [0, 10, 20, 30, 40]
+
+
+def test_recorder_writes_games_at_shutdown(tmp_path):
+    root = str(tmp_path)
+    recorder = warehouse.GameRecorder(warehouse.Writer(root), "ann")
+    board = Board(seed=1)
+    recorder.subscribe(board.events)
+    board.hard_drop()
+    board.score = 99
+    recorder.finish(board)
+    # Game over leaves the partial chunk in memory
+    assert not os.path.isdir(os.path.join(root, 'games'))
+    recorder.close()
+    store = warehouse.Store(root)
+    assert store.rows('games') == 1 and store.rows('pieces') == 1
+    assert warehouse.player_best(store) == {"ann": 99}
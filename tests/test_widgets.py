@@ -0,0 +1,53 @@
+import pygame
+import pytest
+
+from tetris.widgets import Button, Label, Widget, WidgetLayer
+
+
+class Box(Widget):
+    def paint(self, surface):
+        surface.fill((255, 255, 255, 255))
+
+
+@pytest.fixture
+def font():
+    pygame.init()
+    return pygame.font.Font(None, 20)
+
+
+def test_hit_testing_spans_grid_cells():
+    layer = WidgetLayer([Box("wide", (40, 10, 100, 30))], cell=64)
+    assert layer.action_at((40, 10)) == "wide"
+    assert layer.action_at((139, 39)) == "wide"
+    # Right and bottom edges are outside, as with pygame.Rect
+    assert layer.action_at((140, 20)) is None
+    assert layer.action_at((100, 40)) is None
+    assert layer.action_at((500, 500)) is None
+
+
+def test_last_added_widget_is_on_top():
+    layer = WidgetLayer([Box("under", (0, 0, 100, 100)), Box("over", (50, 50, 100, 100))])
+    assert layer.action_at((75, 75)) == "over"
+    assert layer.action_at((25, 25)) == "under"
+    assert layer.get("under").rect.topleft == (0, 0)
+
+
+def test_labels_are_not_clickable(font):
+    layer = WidgetLayer([Box("start", (0, 0, 100, 40)), Label("Title", font, topleft=(0, 0))])
+    assert layer.action_at((5, 5)) == "start"
+
+
+def test_hover_repaints_only_the_changed_buttons(font):
+    a = Button("a", (0, 0, 100, 40), "A", font, rim=True)
+    b = Button("b", (0, 100, 100, 40), "B", font, rim=True)
+    layer = WidgetLayer([a, b])
+    target = pygame.Surface((200, 200))
+    layer.draw(target)
+    layer.draw(target)
+    assert layer.renders() == 2
+    assert layer.hover((10, 10)) is a and a.hovered
+    layer.draw(target)
+    assert (a.renders, b.renders) == (2, 1)
+    layer.hover((10, 110))
+    layer.draw(target)
+    assert not a.hovered and b.hovered and (a.renders, b.renders) == (3, 2)